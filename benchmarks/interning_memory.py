@@ -0,0 +1,116 @@
+"""Measure the memory held by validated Items, with and without interning.
+
+    python benchmarks/interning_memory.py [--count 200000]
+
+Each mode runs in its own process, which validates `count` synthetic Items
+(decoded with `json.loads`, so every document holds its own strings), keeps
+the models and reports the growth of its resident set size.
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+
+from stac_pydantic.api import Item
+from stac_pydantic.interning import InternPool
+
+LINKS = [
+    {"rel": rel, "type": "application/geo+json", "href": f"https://example.com/{rel}"}
+    for rel in ("self", "root", "parent", "collection")
+]
+
+TEMPLATE = (
+    json.dumps(
+        {
+            "type": "Feature",
+            "id": "item-%d",
+            "stac_version": "1.0.0",
+            "stac_extensions": [
+                "https://stac-extensions.github.io/eo/v1.0.0/schema.json",
+                "https://stac-extensions.github.io/projection/v1.0.0/schema.json",
+            ],
+            "collection": "synthetic",
+            "geometry": {"type": "Point", "coordinates": [0.0, 0.0]},
+            "bbox": [0.0, 0.0, 0.0, 0.0],
+            "properties": {
+                "datetime": "2020-01-01T00:00:00Z",
+                "eo:cloud_cover": 10,
+                "proj:epsg": 4326,
+                "platform": "synthetic-1",
+            },
+            "assets": {
+                name: {
+                    "href": f"https://example.com/{name}.tif",
+                    "type": "image/tiff; application=geotiff; profile=cloud-optimized",
+                    "roles": ["data"],
+                }
+                for name in ("red", "green", "blue")
+            },
+            "links": LINKS,
+        }
+    )
+    .replace("%", "%%")
+    .replace("item-%%d", "item-%d")
+)
+
+
+def rss() -> int:
+    """Current resident set size in bytes (peak size where /proc is missing)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def measure(count: int, intern: bool) -> int:
+    context = {"intern": InternPool()} if intern else None
+    # Build the schemas and validators before the baseline
+    Item.model_validate(json.loads(TEMPLATE % -1), context=context)
+    gc.collect()
+    before = rss()
+    items = [
+        Item.model_validate(json.loads(TEMPLATE % i), context=context)
+        for i in range(count)
+    ]
+    gc.collect()
+    growth = rss() - before
+    assert len(items) == count
+    return growth
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--mode", choices=("default", "intern"))
+    args = parser.parse_args()
+
+    if args.mode:
+        print(measure(args.count, args.mode == "intern"))
+        return
+
+    results = {}
+    for mode in ("default", "intern"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--count", str(args.count), "--mode", mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[mode] = int(output)
+
+    for mode, growth in results.items():
+        print(
+            f"{mode:<10} {growth / 2**20:>10.1f} MiB {growth / args.count:>10.0f} B / item"
+        )
+    saved = 1 - results["intern"] / results["default"]
+    print(f"interning saves {saved:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Time the serialization of Items with reduced coordinate precision.
+
+    python benchmarks/precision.py [--number 2000] [--precision 6] [--simplify 1e-5]
+
+Dumps `number` Items to JSON, with footprints of 5 positions (a scene) and
+of 1000 positions (a swath), at full precision, with the `precision` context
+key and with both `precision` and `simplify`, and reports the size of the
+payload and the time per Item. Checks that the bbox of each reduced Item
+still covers its geometry.
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from stac_pydantic import ItemCollection
+from stac_pydantic.bbox import bbox_covers, geometry_bbox
+
+
+def footprint(rng: random.Random, size: int) -> List[List[float]]:
+    """A closed ring of `size` positions, around a random center."""
+    x, y = rng.uniform(-170, 170), rng.uniform(-70, 70)
+    ring = []
+    for i in range(size - 1):
+        angle = 2 * math.pi * i / (size - 1)
+        radius = 0.5 + rng.uniform(-1e-4, 1e-4)
+        ring.append([x + radius * math.cos(angle), y + radius * math.sin(angle)])
+    return ring + [ring[0]]
+
+
+def items(number: int, size: int) -> ItemCollection:
+    rng = random.Random(0)
+    features = []
+    for i in range(number):
+        ring = footprint(rng, size)
+        geometry = {"type": "Polygon", "coordinates": [ring]}
+        features.append(
+            {
+                "type": "Feature",
+                "id": f"item-{i}",
+                "geometry": geometry,
+                "bbox": geometry_bbox(geometry),
+                "properties": {"datetime": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+                "assets": {},
+                "links": [],
+            }
+        )
+    return ItemCollection(type="FeatureCollection", features=features)
+
+
+def check_covers(data: str) -> None:
+    for feature in json.loads(data)["features"]:
+        assert bbox_covers(feature["bbox"], geometry_bbox(feature["geometry"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--precision", type=int, default=6)
+    parser.add_argument("--simplify", type=float, default=1e-5)
+    args = parser.parse_args()
+
+    contexts: Dict[str, Optional[Dict[str, Any]]] = {
+        "full precision": None,
+        "precision": {"precision": args.precision},
+        "precision + simplify": {
+            "precision": args.precision,
+            "simplify": args.simplify,
+        },
+    }
+    print(f"{'':<12} {'':<22} {'bytes / item':>12} {'us / item':>10}")
+    for size in (5, 1000):
+        collection = items(args.number, size)
+        for name, context in contexts.items():
+            start = time.perf_counter()
+            data = collection.model_dump_json(context=context)
+            seconds = time.perf_counter() - start
+            check_covers(data)
+            print(
+                f"{size:>4} points  {name:<22} {len(data) / args.number:>12.0f}"
+                f" {seconds / args.number * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
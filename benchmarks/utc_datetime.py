@@ -0,0 +1,101 @@
+"""Time the validation of RFC 3339 timestamps by `UtcDatetime`.
+
+    python benchmarks/utc_datetime.py [--number 1000000]
+
+Compares `UtcDatetime` to its previous definition (converting every value
+with `astimezone`) on `number` timestamps, mostly in UTC (`...Z`), and checks
+that both give identical datetimes: equal, with the same offset and the same
+ISO format. Also times `str_to_datetimes` on repeated search datetimes.
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Tuple
+
+from pydantic import AfterValidator, AwareDatetime, TypeAdapter
+from typing_extensions import Annotated
+
+from stac_pydantic.shared import UtcDatetime, str_to_datetimes
+
+PreviousUtcDatetime = Annotated[
+    AwareDatetime, AfterValidator(lambda d: d.astimezone(timezone.utc))
+]
+PreviousSearchDatetime: TypeAdapter = TypeAdapter(Optional[PreviousUtcDatetime])
+
+
+def timestamps(number: int) -> List[str]:
+    rng = random.Random(0)
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    values = []
+    for _ in range(number):
+        value = start + timedelta(seconds=rng.randrange(10**9) / 1000)
+        kind = rng.random()
+        if kind < 0.6:
+            values.append(value.strftime("%Y-%m-%dT%H:%M:%S.%fZ"))
+        elif kind < 0.9:
+            values.append(value.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        else:
+            offset = timezone(timedelta(hours=rng.randint(-12, 12)))
+            values.append(value.astimezone(offset).isoformat())
+    return values
+
+
+def check_identical(previous: List[Any], current: List[Any]) -> None:
+    assert len(previous) == len(current)
+    for a, b in zip(previous, current):
+        assert a == b and a.utcoffset() == b.utcoffset(), (a, b)
+        assert a.isoformat() == b.isoformat() and b.tzinfo == timezone.utc, (a, b)
+
+
+def timed(func: Callable[[], List[Any]]) -> Tuple[float, List[Any]]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = timestamps(args.number)
+    data = json.dumps(values)
+    cases = {
+        "validate_python": lambda adapter: adapter.validate_python(values),
+        "validate_json": lambda adapter: adapter.validate_json(data),
+    }
+    previous_adapter = TypeAdapter(List[PreviousUtcDatetime])
+    adapter = TypeAdapter(List[UtcDatetime])
+
+    print(f"{'':<24} {'previous':>10} {'current':>10}   (ns / timestamp)")
+    for name, func in cases.items():
+        previous_seconds, previous = timed(lambda f=func: f(previous_adapter))
+        seconds, current = timed(lambda f=func: f(adapter))
+        check_identical(previous, current)
+        print(
+            f"{name:<24} {previous_seconds / args.number * 1e9:>10.0f}"
+            f" {seconds / args.number * 1e9:>10.0f}"
+        )
+
+    # Searches repeat a small number of datetime intervals
+    searches = [f"{values[i % 1000]}/.." for i in range(args.number // 10)]
+    previous_seconds, previous = timed(
+        lambda: [
+            PreviousSearchDatetime.validate_strings(s.split("/")[0], strict=True)
+            for s in searches
+        ]
+    )
+    seconds, current = timed(lambda: [str_to_datetimes(s)[0] for s in searches])
+    check_identical(previous, current)
+    print(
+        f"{'str_to_datetimes':<24} {previous_seconds / len(searches) * 1e9:>10.0f}"
+        f" {seconds / len(searches) * 1e9:>10.0f}"
+    )
+    print(f"identical results for {args.number} timestamps")
+
+
+if __name__ == "__main__":
+    main()
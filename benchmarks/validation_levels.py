@@ -0,0 +1,61 @@
+"""Time the validation of STAC API Items with each validation level.
+
+    python benchmarks/validation_levels.py [--number 2000]
+
+`from_trusted` (no checks) and `model_construct` (no nested models) are
+included for reference.
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+from stac_pydantic.api import Item
+from stac_pydantic.shared import ValidationLevel
+
+EXAMPLE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "tests",
+    "example_stac",
+    "itemcollection-sample-full.json",
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(EXAMPLE) as f:
+        items = json.load(f)["features"]
+
+    cases = {
+        f"model_validate ({level.value})": (
+            lambda data, level=level: Item.model_validate(
+                data, context={"validation_level": level}
+            )
+        )
+        for level in ValidationLevel
+    }
+    cases["from_trusted"] = Item.from_trusted
+    cases["model_construct"] = lambda data: Item.model_construct(**data)
+
+    print(f"{'':<32} {'us / item':>10}")
+    for name, func in cases.items():
+        # warm up (schema builds, caches)
+        for data in items:
+            func(data)
+        seconds = min(
+            timeit.repeat(
+                lambda func=func: [func(data) for data in items],
+                number=args.number,
+                repeat=5,
+            )
+        )
+        print(f"{name:<32} {seconds / args.number / len(items) * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,52 @@
 # flake8: noqa: F401
-from .catalog import Catalog
-from .collection import Collection
-from .item import Item, ItemProperties
-from .item_collection import ItemCollection
+"""Pydantic data models for the STAC spec.
+
+Models are imported lazily, on first access, to keep `import stac_pydantic`
+(and `import stac_pydantic.api`) cheap.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .catalog import Catalog
+    from .collection import Collection
+    from .item import Item, ItemProperties
+    from .item_collection import ItemCollection
+    from .prebuild import warmup
+    from .walk import catalog_walk
+
+_LAZY_IMPORTS = {
+    "Catalog": "catalog",
+    "Collection": "collection",
+    "Item": "item",
+    "ItemProperties": "item",
+    "ItemCollection": "item_collection",
+    "catalog_walk": "walk",
+    "warmup": "prebuild",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        # Submodules, as attributes of the package
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # A relative `__import__` (rather than `importlib.import_module`) keeps the
+    # module visible to `python -X importtime`
+    value = getattr(__import__(module, globals(), fromlist=[name], level=1), name)
+    # Cache the attribute so that __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,14 +1,32 @@
-"""STAC API models."""
+"""STAC API models.
 
+Models are imported lazily, on first access, so that importing one of them
+does not build all the others.
+"""
+
+import importlib
 import warnings
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .collection import Collection
+    from .collections import Collections, LazyCollections
+    from .conformance import Conformance
+    from .item import Item
+    from .item_collection import ItemCollection
+    from .landing import LandingPage
+    from .search import Search
 
-from .collection import Collection
-from .collections import Collections
-from .conformance import Conformance
-from .item import Item
-from .item_collection import ItemCollection
-from .landing import LandingPage
-from .search import Search
+_LAZY_IMPORTS = {
+    "Collection": "collection",
+    "Collections": "collections",
+    "Conformance": "conformance",
+    "Item": "item",
+    "ItemCollection": "item_collection",
+    "LandingPage": "landing",
+    "LazyCollections": "collections",
+    "Search": "search",
+}
 
 __all__ = [
     "Collection",
@@ -17,18 +35,38 @@ __all__ = [
     "Item",
     "ItemCollection",
     "LandingPage",
+    "LazyCollections",
     "Search",
 ]
 
 
-# TODO: remove in 4.0
-def __getattr__(name):
+def __getattr__(name: str) -> Any:
+    # TODO: remove in 4.0
     if name == "ConformanceClasses":
         warnings.warn(
             "Class `ConformanceClasses` has been renamed to `Conformance`. Please use the new name. The old alias will be removed in a future version.",
             DeprecationWarning,
             stacklevel=2,
         )
-        return Conformance
+        return __getattr__("Conformance")
+
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        # Submodules, as attributes of the package
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # A relative `__import__` (rather than `importlib.import_module`) keeps the
+    # module visible to `python -X importtime`
+    value = getattr(__import__(module, globals(), fromlist=[name], level=1), name)
+    # Cache the attribute so that __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
 
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,258 @@
+"""In-process cache of serialized responses, keyed by search.
+
+`ResponseCache` stores the serialized JSON of responses (e.g. `ItemCollection`
+pages) keyed by `Search.cache_key()`, so that identical searches are not run
+and serialized again::
+
+    cache = ResponseCache(max_bytes=256 * 2**20, ttl=30)
+
+    def search_items(search: ExtendedSearch) -> bytes:
+        return cache.get_or_set(search, lambda: run_search(search))
+
+Entries are evicted in least recently used order once `max_bytes` (or
+`max_entries`) is reached, and expire `ttl` seconds after being stored.
+Concurrent misses on the same key, from threads (`get_or_set`) or asyncio
+tasks (`aget_or_set`), only produce the response once.
+"""
+
+import asyncio
+import gzip
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from stac_pydantic.api.search import Search
+
+Key = Union[Search, str]
+Response = Union[bytes, BaseModel]
+
+
+@dataclass
+class CacheStats:
+    """Counters of a `ResponseCache`, and its current size."""
+
+    hits: int = 0
+    misses: int = 0
+    # Misses served by a concurrent call producing the same response
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+@dataclass
+class _Entry:
+    data: bytes
+    expires: float
+
+
+class _Flight:
+    """A response being produced by a thread, waited for by the others."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.data: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+
+
+def _serialize(response: Response) -> bytes:
+    if isinstance(response, BaseModel):
+        return response.model_dump_json().encode()
+    return response
+
+
+class ResponseCache:
+    """Size bounded LRU cache, with expiration, of serialized responses.
+
+    `max_bytes` bounds the size of the stored data (compressed with gzip if
+    `compress`), `max_entries` the number of entries and `ttl` (in seconds,
+    None for no expiration) their lifetime. Responses larger than
+    `max_bytes` are not stored. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 2**20,
+        ttl: Optional[float] = 60.0,
+        *,
+        max_entries: Optional[int] = None,
+        compress: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.compress = compress
+        self.clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._size = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], "asyncio.Future[bytes]"] = {}
+
+    @staticmethod
+    def key(key: Key) -> str:
+        """Cache key of a search (its `cache_key()`), or the key itself."""
+        return key.cache_key() if isinstance(key, Search) else key
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters."""
+        with self._lock:
+            stats = CacheStats(**self._stats.__dict__)
+            stats.entries = len(self._entries)
+            stats.size = self._size
+            return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.data)
+
+    def _lookup(self, key: str) -> Optional[bytes]:
+        """Stored data for `key`, counting a hit or a miss. Lock held."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires <= self.clock():
+            self._pop(key)
+            self._stats.expirations += 1
+            entry = None
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry.data
+
+    def _decode(self, data: bytes, decompress: bool) -> bytes:
+        if self.compress and decompress:
+            return gzip.decompress(data)
+        return data
+
+    def get(self, key: Key, *, decompress: bool = True) -> Optional[bytes]:
+        """Return the response stored for `key`, None if missing or expired.
+
+        With `compress` and `decompress=False`, the gzip data is returned as
+        stored, e.g. to be sent with a `Content-Encoding: gzip` header.
+        """
+        key = self.key(key)
+        with self._lock:
+            data = self._lookup(key)
+        return None if data is None else self._decode(data, decompress)
+
+    def set(self, key: Key, response: Response) -> bytes:
+        """Store a response (bytes, or a model serialized to JSON).
+
+        Returns the serialized response.
+        """
+        key = self.key(key)
+        data = _serialize(response)
+        stored = gzip.compress(data, mtime=0) if self.compress else data
+        expires = float("inf") if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            if len(stored) > self.max_bytes:
+                return data
+            self._entries[key] = _Entry(stored, expires)
+            self._size += len(stored)
+            while self._size > self.max_bytes or (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                oldest = next(iter(self._entries))
+                self._pop(oldest)
+                self._stats.evictions += 1
+        return data
+
+    def delete(self, key: Key) -> None:
+        key = self.key(key)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_or_set(self, key: Key, produce: Callable[[], Response]) -> bytes:
+        """Return the response stored for `key`, or store the one `produce` returns.
+
+        While `produce` runs, other threads asking for the same key wait for
+        its result (or exception) instead of producing it again.
+        """
+        key = self.key(key)
+        with self._lock:
+            data = self._lookup(key)
+            if data is None:
+                waited = self._flights.get(key)
+                if waited is None:
+                    flight = self._flights[key] = _Flight()
+                else:
+                    self._stats.coalesced += 1
+        if data is not None:
+            return self._decode(data, True)
+
+        if waited is not None:
+            waited.done.wait()
+            if waited.error is not None:
+                raise waited.error
+            assert waited.data is not None
+            return waited.data
+
+        try:
+            flight.data = self.set(key, produce())
+            return flight.data
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def aget_or_set(
+        self, key: Key, produce: Callable[[], Awaitable[Response]]
+    ) -> bytes:
+        """Like `get_or_set`, for coroutines: concurrent tasks of the event loop
+        asking for the same key await the response of the first one."""
+        key = self.key(key)
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            data = self._lookup(key)
+            if data is None:
+                waited = self._async_flights.get(flight_key)
+                if waited is None:
+                    future = self._async_flights[flight_key] = loop.create_future()
+                else:
+                    self._stats.coalesced += 1
+        if data is not None:
+            return self._decode(data, True)
+
+        if waited is not None:
+            # A cancelled waiter must not cancel the shared future
+            return await asyncio.shield(waited)
+
+        try:
+            data = self.set(key, await produce())
+            future.set_result(data)
+            return data
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieved here, so that no warning is logged without waiters
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._async_flights[flight_key]
@@ -1,26 +1,23 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
 
-from pydantic import model_validator
+from pydantic import PrivateAttr, ValidationError, field_validator, model_validator
+from typing_extensions import Self
 
 from stac_pydantic.api.collection import Collection
 from stac_pydantic.api.links import Links
+from stac_pydantic.collection import Extent
 from stac_pydantic.links import Relations
-from stac_pydantic.shared import StacBaseModel
+from stac_pydantic.shared import BBox, StacBaseModel, str_to_datetimes
+from stac_pydantic.utils import get_value
 
 
-class Collections(StacBaseModel):
-    """
-    https://github.com/radiantearth/stac-api-spec/tree/v1.0.0/ogcapi-features#endpoints
-    https://github.com/radiantearth/stac-api-spec/tree/v1.0.0/ogcapi-features#collections-collections
-    """
+class _CollectionsPage(StacBaseModel):
+    """Links of the pages of `Collections` and `LazyCollections`."""
 
     links: Links
-    collections: List[Collection]
-    numberMatched: Optional[int] = None
-    numberReturned: Optional[int] = None
 
     @model_validator(mode="after")
-    def required_links(self) -> "Collections":
+    def required_links(self) -> Self:
         links_rel = []
         for link in self.links.root:
             links_rel.append(link.rel)
@@ -33,3 +30,165 @@ class Collections(StacBaseModel):
             ), f"STAC API COLLECTIONS conform Collections pages must include a `{rel}` link."
 
         return self
+
+
+class Collections(_CollectionsPage):
+    """
+    https://github.com/radiantearth/stac-api-spec/tree/v1.0.0/ogcapi-features#endpoints
+    https://github.com/radiantearth/stac-api-spec/tree/v1.0.0/ogcapi-features#collections-collections
+    """
+
+    collections: List[Collection]
+    numberMatched: Optional[int] = None
+    numberReturned: Optional[int] = None
+
+
+class LazyCollections(_CollectionsPage):
+    """`Collections`, validating each collection only when it is accessed.
+
+    The links and the ids of the collections are validated up front, the
+    collections themselves (extents, links, ...) by `get`, `page` and
+    `iter_collections`, which replace them in `collections` by their
+    `Collection` model. Collections never accessed are dumped as given.
+    """
+
+    # Collection models, or dictionaries not validated yet
+    collections: List[Any]
+    numberMatched: Optional[int] = None
+    numberReturned: Optional[int] = None
+
+    _index: Optional[Dict[str, int]] = PrivateAttr(None)
+
+    @field_validator("collections")
+    @classmethod
+    def unique_ids(cls, collections: List[Any]) -> List[Any]:
+        ids = set()
+        for entry in collections:
+            if not isinstance(entry, (Mapping, Collection)):
+                raise ValueError("Collections must be objects")
+            collection_id = get_value(entry, "id")
+            if not isinstance(collection_id, str):
+                raise ValueError("Collections must have a string `id`")
+            if collection_id in ids:
+                raise ValueError(f"Duplicate collection id {collection_id!r}")
+            ids.add(collection_id)
+        return collections
+
+    @property
+    def ids(self) -> List[str]:
+        """Ids of the collections, in order."""
+        return [get_value(entry, "id") for entry in self.collections]
+
+    def _position(self, collection_id: str) -> Optional[int]:
+        if self._index is None:
+            self._index = {
+                get_value(c, "id"): i for i, c in enumerate(self.collections)
+            }
+        return self._index.get(collection_id)
+
+    def _validated(self, position: int) -> Collection:
+        entry = self.collections[position]
+        if not isinstance(entry, Collection):
+            entry = Collection.model_validate(entry)
+            self.collections[position] = entry
+        return entry
+
+    def get(self, collection_id: str) -> Optional[Collection]:
+        """Return the collection with this id, validated, or None."""
+        position = self._position(collection_id)
+        return None if position is None else self._validated(position)
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[Collection]:
+        """Return the validated collections from `offset`, at most `limit`."""
+        stop = len(self.collections) if limit is None else offset + limit
+        return [
+            self._validated(i)
+            for i in range(max(offset, 0), min(stop, len(self.collections)))
+        ]
+
+    def iter_collections(self) -> Iterator[Collection]:
+        """Validate and yield the collections, one at a time."""
+        for i in range(len(self.collections)):
+            yield self._validated(i)
+
+    def filter(
+        self,
+        q: Union[str, Sequence[str], None] = None,
+        bbox: Optional[BBox] = None,
+        datetime: Optional[str] = None,
+    ) -> List[str]:
+        """Return the ids of the collections matching all the given filters,
+        without validating them.
+
+        `q` terms match (case-insensitively) the id, title, description or
+        keywords of a collection, any of them being enough. `bbox` and
+        `datetime` (an instant or `start/end` interval, `..` for open ends)
+        match the collections whose overall spatial and temporal extents
+        intersect them. Their extents are validated, and a collection with
+        an invalid extent raises a `ValueError`.
+        """
+        terms = [q] if isinstance(q, str) else list(q or ())
+        terms = [term.lower() for term in terms if term]
+        dates = str_to_datetimes(datetime) if datetime else None
+        if dates is not None and len(dates) == 1:
+            dates = [dates[0], dates[0]]
+        ids = []
+        for entry in self.collections:
+            if terms and not _matches_terms(entry, terms):
+                continue
+            if bbox is not None or dates is not None:
+                extent = _extent(entry)
+                if bbox is not None and not _intersects_bbox(extent, bbox):
+                    continue
+                if dates is not None and not _intersects_interval(extent, dates):
+                    continue
+            ids.append(get_value(entry, "id"))
+        return ids
+
+
+def _matches_terms(entry: Any, terms: List[str]) -> bool:
+    texts = [
+        get_value(entry, "id"),
+        get_value(entry, "title"),
+        get_value(entry, "description"),
+    ]
+    texts.extend(get_value(entry, "keywords") or ())
+    text = "\n".join(t for t in texts if isinstance(t, str)).lower()
+    return any(term in text for term in terms)
+
+
+def _extent(entry: Any) -> Extent:
+    """The extent of a collection, validated."""
+    if isinstance(entry, Collection):
+        return entry.extent
+    try:
+        return Extent.model_validate(get_value(entry, "extent"))
+    except ValidationError as e:
+        raise ValueError(
+            f"Invalid extent of collection {get_value(entry, 'id')!r}: {e}"
+        ) from None
+
+
+def _intersects_bbox(extent: Extent, bbox: BBox) -> bool:
+    if not extent.spatial.bbox:
+        return False
+    overall = extent.spatial.bbox[0]
+    if len(overall) == 6:
+        overall = (overall[0], overall[1], overall[3], overall[4])
+    if len(bbox) == 6:
+        bbox = (bbox[0], bbox[1], bbox[3], bbox[4])
+    xmin, ymin, xmax, ymax = overall
+    west, south, east, north = bbox
+    if ymin > north or ymax < south:
+        return False
+    # Longitude ranges, split at the antimeridian
+    ranges = [(xmin, xmax)] if xmin <= xmax else [(xmin, 180), (-180, xmax)]
+    searched = [(west, east)] if west <= east else [(west, 180), (-180, east)]
+    return any(a <= d and c <= b for a, b in ranges for c, d in searched)
+
+
+def _intersects_interval(extent: Extent, dates: List[Any]) -> bool:
+    start, end = extent.temporal.interval[0]
+    return (dates[1] is None or start is None or start <= dates[1]) and (
+        dates[0] is None or end is None or dates[0] <= end
+    )
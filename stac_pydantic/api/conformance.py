@@ -1,11 +1,93 @@
-from typing import List
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Mapping, Optional, Union
 
-from pydantic import AnyHttpUrl, BaseModel
+from pydantic import (
+    AnyHttpUrl,
+    AnyUrl,
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    model_validator,
+)
+from typing_extensions import Self
 
+from stac_pydantic.api.version import STAC_API_VERSION
+from stac_pydantic.shared import DEFER_BUILD
 
-class Conformance(BaseModel):
+# Conformance classes of the STAC API and OGC API - Features specs
+CORE = f"https://api.stacspec.org/v{STAC_API_VERSION}/core"
+OGCAPI_FEATURES = f"https://api.stacspec.org/v{STAC_API_VERSION}/ogcapi-features"
+COLLECTIONS = f"https://api.stacspec.org/v{STAC_API_VERSION}/collections"
+ITEM_SEARCH = f"https://api.stacspec.org/v{STAC_API_VERSION}/item-search"
+BROWSEABLE = f"https://api.stacspec.org/v{STAC_API_VERSION}/browseable"
+CHILDREN = f"https://api.stacspec.org/v{STAC_API_VERSION}/children"
+OGC_FEATURES_CORE = "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core"
+OGC_FEATURES_OAS30 = "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/oas30"
+OGC_FEATURES_GEOJSON = "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/geojson"
+
+
+@lru_cache(maxsize=1024)
+def _normalized(conformance_class: str) -> str:
+    """The conformance class as validated to a URL (e.g. with a `/` path)."""
+    try:
+        return str(AnyUrl(conformance_class))
+    except ValueError:
+        return conformance_class
+
+
+class _Conformant(BaseModel):
+    """Lookups of the `conformsTo` classes of a model."""
+
+    _conformance_classes: Optional[FrozenSet[str]] = PrivateAttr(None)
+
+    @model_validator(mode="after")
+    def _cache_conformance_classes(self) -> Self:
+        self._conformance_classes = self._compute_conformance_classes()
+        return self
+
+    def _compute_conformance_classes(self) -> FrozenSet[str]:
+        conforms_to = self.conformsTo  # type: ignore[attr-defined]
+        return frozenset(str(c) for c in conforms_to)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "conformsTo":
+            self._conformance_classes = None
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._conformance_classes = None
+        return copied
+
+    @property
+    def conformance_classes(self) -> FrozenSet[str]:
+        """The `conformsTo` classes, as strings.
+
+        Computed at validation, and again after `conformsTo` is assigned (or
+        updated in a `model_copy`), but not when it is modified in place.
+        """
+        # Read from the private attributes directly: `BaseModel.__getattr__`
+        # would take most of the time of a lookup
+        private = self.__pydantic_private__ or {}
+        classes = private.get("_conformance_classes")
+        if classes is None:
+            classes = self._conformance_classes = self._compute_conformance_classes()
+        return classes
+
+    def supports(self, conformance_class: Union[str, AnyUrl]) -> bool:
+        """Whether the API conforms to a class, e.g. `conformance.ITEM_SEARCH`."""
+        classes = self.conformance_classes
+        conformance_class = str(conformance_class)
+        return conformance_class in classes or _normalized(conformance_class) in classes
+
+
+class Conformance(_Conformant):
     """
     https://github.com/radiantearth/stac-api-spec/blob/master/api-spec.md#ogc-api---features-endpoints
     """
 
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
     conformsTo: List[AnyHttpUrl]
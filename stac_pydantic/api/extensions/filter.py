@@ -0,0 +1,740 @@
+"""Filter Extension (CQL2-JSON).
+
+Models of the CQL2-JSON expressions of `ExtendedSearch.filter`: logical
+(`and`, `or`, `not`), comparison (`=`, `<>`, `<`, `<=`, `>`, `>=`, `like`,
+`between`, `in`, `isNull`), spatial (`s_intersects`) and temporal
+(`t_intersects`) operators.
+
+`compile_filter` turns an expression into a single function matching Items
+(models or dictionaries). Sub-expressions without properties are evaluated
+once, at compile time, and the arguments of `and` / `or` are reordered so
+that the cheapest and most selective ones (by a fixed estimate per operator)
+are evaluated first.
+
+Evaluation follows the three-valued logic of CQL2: comparisons with a null
+(or missing) property, or between values of different types, are UNKNOWN
+(None), as are `not` UNKNOWN, `and` without false arguments and `or`
+without true arguments if one of their arguments is UNKNOWN. Items match
+when the filter is true, so `NOT (prop = x)` does not match Items where
+`prop` is null.
+
+https://github.com/stac-api-extensions/filter
+"""
+
+import operator as op
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from geojson_pydantic.geometries import Geometry
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictBool,
+    StrictFloat,
+    StrictInt,
+    StrictStr,
+    TypeAdapter,
+    ValidationError,
+)
+from typing_extensions import Annotated
+
+from stac_pydantic.shared import DEFER_BUILD, SearchDatetime, UtcDatetime
+from stac_pydantic.utils import get_value
+
+# Default `filter-lang` and `filter-crs` of a search
+FILTER_LANG = "cql2-json"
+# `filter-lang` of (unparsed) CQL2 text filters
+FILTER_LANG_TEXT = "cql2-text"
+FILTER_CRS = "http://www.opengis.net/def/crs/OGC/1.3/CRS84"
+
+# Properties read from the top level of Items, the others from `properties`
+ITEM_FIELDS = ("id", "collection", "geometry", "bbox")
+
+# Estimated fraction of the Items matched, and relative cost, of each operator
+_SELECTIVITY = {
+    "=": 0.05,
+    "<>": 0.95,
+    "<": 0.33,
+    "<=": 0.33,
+    ">": 0.33,
+    ">=": 0.33,
+    "like": 0.2,
+    "between": 0.25,
+    "in": 0.05,
+    "isNull": 0.1,
+    "s_intersects": 0.3,
+    "t_intersects": 0.3,
+}
+_COST = {
+    "like": 3.0,
+    "between": 1.5,
+    "isNull": 0.5,
+    "s_intersects": 20.0,
+    "t_intersects": 3.0,
+}
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": op.eq,
+    "<>": op.ne,
+    "<": op.lt,
+    "<=": op.le,
+    ">": op.gt,
+    ">=": op.ge,
+}
+
+Predicate = Callable[[Any], bool]
+# Predicate of the three-valued logic, None for UNKNOWN
+TriStatePredicate = Callable[[Any], Optional[bool]]
+
+
+def _and(a: Optional[bool], b: Optional[bool]) -> Optional[bool]:
+    if a is False or b is False:
+        return False
+    return None if a is None or b is None else True
+
+
+def _instant(value: Any) -> Optional[datetime]:
+    """Parse a datetime (or date, as its start) to an aware datetime."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, date):
+        return datetime.combine(value, time(), timezone.utc)
+    if isinstance(value, str):
+        try:
+            return SearchDatetime.validate_strings(value, strict=True)
+        except ValidationError:
+            try:
+                return _instant(date.fromisoformat(value))
+            except ValueError:
+                return None
+    return None
+
+
+def _validate_bound(value: str) -> str:
+    if value != ".." and _instant(value) is None:
+        raise ValueError(f"Invalid interval bound {value!r}")
+    return value
+
+
+class _Literal(BaseModel):
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
+
+
+class PropertyRef(_Literal):
+    """A property of the Items (`id`, `collection`, `geometry` and `bbox` are
+    read from the Item, the others from its properties)."""
+
+    property: str
+
+
+class Timestamp(_Literal):
+    timestamp: UtcDatetime
+
+
+class Date(_Literal):
+    date_: date = Field(..., alias="date")
+
+
+class Interval(_Literal):
+    """An interval of dates or datetimes, `..` for open ends."""
+
+    interval: Tuple[
+        Union[PropertyRef, Annotated[StrictStr, AfterValidator(_validate_bound)]],
+        Union[PropertyRef, Annotated[StrictStr, AfterValidator(_validate_bound)]],
+    ]
+
+
+Operand = Union[
+    PropertyRef,
+    Timestamp,
+    Date,
+    Interval,
+    Geometry,
+    StrictBool,
+    StrictInt,
+    StrictFloat,
+    StrictStr,
+]
+
+
+class _Operation(BaseModel):
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
+
+class And(_Operation):
+    op: Literal["and"]
+    args: List["Expression"] = Field(..., min_length=2)
+
+
+class Or(_Operation):
+    op: Literal["or"]
+    args: List["Expression"] = Field(..., min_length=2)
+
+
+class Not(_Operation):
+    op: Literal["not"]
+    args: Tuple["Expression"]
+
+
+class Comparison(_Operation):
+    op: Literal["=", "<>", "<", "<=", ">", ">="]
+    args: Tuple[Operand, Operand]
+
+
+class Like(_Operation):
+    """`%` matches any characters, `_` one character and `\\` escapes them."""
+
+    op: Literal["like"]
+    args: Tuple[Operand, Operand]
+
+
+class Between(_Operation):
+    op: Literal["between"]
+    args: Tuple[Operand, Operand, Operand]
+
+
+class In(_Operation):
+    op: Literal["in"]
+    args: Tuple[Operand, List[Operand]]
+
+
+class IsNull(_Operation):
+    op: Literal["isNull"]
+    args: Tuple[Operand]
+
+
+class SpatialIntersects(_Operation):
+    op: Literal["s_intersects"]
+    args: Tuple[Operand, Operand]
+
+
+class TemporalIntersects(_Operation):
+    op: Literal["t_intersects"]
+    args: Tuple[Operand, Operand]
+
+
+Expression = Annotated[
+    Union[
+        And,
+        Or,
+        Not,
+        Comparison,
+        Like,
+        Between,
+        In,
+        IsNull,
+        SpatialIntersects,
+        TemporalIntersects,
+    ],
+    Field(discriminator="op"),
+]
+
+And.model_rebuild()
+Or.model_rebuild()
+Not.model_rebuild()
+
+_expression_adapter: TypeAdapter = TypeAdapter(Expression)
+
+
+# Geometries, as their points, segments (points as degenerate segments) and
+# polygons (lists of rings)
+Point2D = Tuple[float, float]
+Segment = Tuple[Point2D, Point2D]
+
+
+class _Shape(NamedTuple):
+    bbox: Tuple[float, float, float, float]
+    points: List[Point2D]
+    segments: List[Segment]
+    polygons: List[List[List[Point2D]]]
+
+
+def _shape(geometry: Any) -> Optional[_Shape]:  # noqa: C901
+    """Decompose a GeoJSON geometry (dictionary or model), None if empty."""
+    points: List[Point2D] = []
+    segments: List[Segment] = []
+    polygons: List[List[List[Point2D]]] = []
+
+    def line(coordinates: Sequence[Sequence[float]]) -> List[Point2D]:
+        path = [(c[0], c[1]) for c in coordinates]
+        points.extend(path)
+        segments.extend(zip(path, path[1:]))
+        return path
+
+    def add(geometry: Any) -> None:
+        kind = get_value(geometry, "type")
+        coordinates = get_value(geometry, "coordinates")
+        if kind == "GeometryCollection":
+            for member in get_value(geometry, "geometries") or ():
+                add(member)
+        elif kind in ("Point", "MultiPoint"):
+            for c in [coordinates] if kind == "Point" else coordinates:
+                points.append((c[0], c[1]))
+                segments.append((points[-1], points[-1]))
+        elif kind in ("LineString", "MultiLineString"):
+            for coords in [coordinates] if kind == "LineString" else coordinates:
+                line(coords)
+        elif kind in ("Polygon", "MultiPolygon"):
+            for rings in [coordinates] if kind == "Polygon" else coordinates:
+                polygons.append([line(ring) for ring in rings])
+
+    if geometry is not None:
+        add(geometry)
+    if not points:
+        return None
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return _Shape((min(xs), min(ys), max(xs), max(ys)), points, segments, polygons)
+
+
+def _orientation(a: Point2D, b: Point2D, c: Point2D) -> int:
+    v = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+    return (v > 0) - (v < 0)
+
+
+def _on_segment(a: Point2D, b: Point2D, c: Point2D) -> bool:
+    """Whether `c`, collinear with `a` and `b`, is between them."""
+    return min(a[0], b[0]) <= c[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= c[
+        1
+    ] <= max(a[1], b[1])
+
+
+def _segments_intersect(s: Segment, t: Segment) -> bool:
+    (p1, p2), (q1, q2) = s, t
+    o1 = _orientation(p1, p2, q1)
+    o2 = _orientation(p1, p2, q2)
+    o3 = _orientation(q1, q2, p1)
+    o4 = _orientation(q1, q2, p2)
+    if o1 != o2 and o3 != o4:
+        return True
+    return (
+        (o1 == 0 and _on_segment(p1, p2, q1))
+        or (o2 == 0 and _on_segment(p1, p2, q2))
+        or (o3 == 0 and _on_segment(q1, q2, p1))
+        or (o4 == 0 and _on_segment(q1, q2, p2))
+    )
+
+
+def _in_ring(point: Point2D, ring: List[Point2D]) -> bool:
+    x, y = point
+    inside = False
+    for (x1, y1), (x2, y2) in zip(ring, ring[1:]):
+        if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            inside = not inside
+    return inside
+
+
+def _in_polygon(point: Point2D, rings: List[List[Point2D]]) -> bool:
+    return _in_ring(point, rings[0]) and not any(
+        _in_ring(point, hole) for hole in rings[1:]
+    )
+
+
+def _intersects(a: _Shape, b: _Shape) -> bool:
+    ax1, ay1, ax2, ay2 = a.bbox
+    bx1, by1, bx2, by2 = b.bbox
+    if ax1 > bx2 or bx1 > ax2 or ay1 > by2 or by1 > ay2:
+        return False
+    for s in a.segments:
+        sx1, sx2 = (s[0][0], s[1][0]) if s[0][0] <= s[1][0] else (s[1][0], s[0][0])
+        if sx1 > bx2 or sx2 < bx1:
+            continue
+        if any(_segments_intersect(s, t) for t in b.segments):
+            return True
+    # Without crossing boundaries, one is inside a polygon of the other
+    return any(_in_polygon(a.points[0], rings) for rings in b.polygons) or any(
+        _in_polygon(b.points[0], rings) for rings in a.polygons
+    )
+
+
+# Compiled operands: a function of the Item, or a constant (`get` is None)
+class _Operand(NamedTuple):
+    get: Optional[Callable[[Any], Any]]
+    value: Any = None
+    temporal: bool = False
+
+
+class _Compiled(NamedTuple):
+    # A constant (True, False or None for UNKNOWN) or a function of the Item
+    predicate: Union[Optional[bool], TriStatePredicate]
+    selectivity: float
+    cost: float
+
+
+def _property_getter(name: str) -> Callable[[Any], Any]:
+    if name.startswith("properties."):
+        name = name[len("properties.") :]
+    elif name in ITEM_FIELDS:
+
+        def get_field(item: Any) -> Any:
+            if isinstance(item, dict):
+                return item.get(name)
+            return getattr(item, name, None)
+
+        return get_field
+
+    def get_property(item: Any) -> Any:
+        if isinstance(item, dict):
+            properties = item.get("properties")
+            return properties.get(name) if properties else None
+        return getattr(getattr(item, "properties", None), name, None)
+
+    return get_property
+
+
+def _operand(arg: Any) -> _Operand:
+    if isinstance(arg, PropertyRef):
+        return _Operand(_property_getter(arg.property))
+    if isinstance(arg, Timestamp):
+        return _Operand(None, arg.timestamp, temporal=True)
+    if isinstance(arg, Date):
+        return _Operand(None, _instant(arg.date_), temporal=True)
+    if isinstance(arg, Interval):
+        raise ValueError("Intervals are only supported by t_intersects")
+    if isinstance(arg, BaseModel):
+        # Geometry
+        return _Operand(None, arg)
+    return _Operand(None, arg)
+
+
+def _temporal(operand: _Operand) -> _Operand:
+    """Parse the values of an operand to datetimes."""
+    if operand.get is None:
+        return _Operand(None, _instant(operand.value), temporal=True)
+    get = operand.get
+    return _Operand(lambda item: _instant(get(item)), temporal=True)
+
+
+def _resolve(operand: _Operand) -> Callable[[Any], Any]:
+    if operand.get is not None:
+        return operand.get
+    value = operand.value
+    return lambda item: value
+
+
+def _safe(func: Callable[[Any, Any], Any], x: Any, y: Any) -> Optional[bool]:
+    """`func(x, y)`, UNKNOWN (None) with a null or incomparable operand."""
+    if x is None or y is None:
+        return None
+    try:
+        return bool(func(x, y))
+    except (TypeError, AttributeError):
+        return None
+
+
+def _binary(
+    name: str, func: Callable[[Any, Any], Any], a: _Operand, b: _Operand
+) -> _Compiled:
+    selectivity = _SELECTIVITY[name]
+    cost = _COST.get(name, 1.0)
+    if a.temporal or b.temporal:
+        a, b = _temporal(a), _temporal(b)
+    get_a, get_b = a.get, b.get
+    if get_a is not None and get_b is not None:
+
+        def predicate(item: Any) -> Optional[bool]:
+            return _safe(func, get_a(item), get_b(item))
+
+    elif get_a is not None:
+        b_value = b.value
+
+        def predicate(item: Any) -> Optional[bool]:
+            return _safe(func, get_a(item), b_value)
+
+    elif get_b is not None:
+        a_value = a.value
+
+        def predicate(item: Any) -> Optional[bool]:
+            return _safe(func, a_value, get_b(item))
+
+    else:
+        return _Compiled(_safe(func, a.value, b.value), selectivity, cost)
+
+    return _Compiled(predicate, selectivity, cost)
+
+
+@lru_cache(maxsize=256)
+def _like_regex(pattern: str) -> "re.Pattern[str]":
+    parts = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            parts.append(re.escape(char))
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.DOTALL)
+
+
+def _like(value: Any, pattern: Any) -> bool:
+    return _like_regex(pattern).fullmatch(value) is not None
+
+
+def _between(expression: Between) -> _Compiled:
+    value, low, high = (_operand(arg) for arg in expression.args)
+    if any(o.temporal for o in (value, low, high)):
+        value, low, high = _temporal(value), _temporal(low), _temporal(high)
+    if value.get is None and low.get is None and high.get is None:
+        return _Compiled(
+            _and(
+                _safe(op.le, low.value, value.value),
+                _safe(op.le, value.value, high.value),
+            ),
+            _SELECTIVITY["between"],
+            _COST["between"],
+        )
+    get, get_low, get_high = _resolve(value), _resolve(low), _resolve(high)
+
+    def predicate(item: Any) -> Optional[bool]:
+        x = get(item)
+        return _and(_safe(op.le, get_low(item), x), _safe(op.le, x, get_high(item)))
+
+    return _Compiled(predicate, _SELECTIVITY["between"], _COST["between"])
+
+
+def _in(expression: In) -> _Compiled:
+    value = _operand(expression.args[0])
+    members = [_operand(arg) for arg in expression.args[1]]
+    selectivity = min(0.9, _SELECTIVITY["in"] * max(len(members), 1))
+    if any(m.get is not None for m in members):
+        getters = [_resolve(m) for m in members]
+        get = _resolve(value)
+
+        def predicate(item: Any) -> Optional[bool]:
+            x = get(item)
+            if x is None:
+                return None
+            unknown = False
+            for g in getters:
+                equal = _safe(op.eq, x, g(item))
+                if equal:
+                    return True
+                unknown = unknown or equal is None
+            return None if unknown else False
+
+        return _Compiled(predicate, selectivity, 1.0)
+
+    values: Any = [m.value for m in members]
+    try:
+        # Built once for the whole query
+        values = frozenset(values)
+    except TypeError:
+        pass
+    return _binary("in", lambda x, y: x in y, value, _Operand(None, values))._replace(
+        selectivity=selectivity
+    )
+
+
+def _is_null(expression: IsNull) -> _Compiled:
+    value = _operand(expression.args[0])
+    if value.get is None:
+        return _Compiled(value.value is None, _SELECTIVITY["isNull"], 0.5)
+    get = value.get
+    return _Compiled(
+        lambda item: get(item) is None, _SELECTIVITY["isNull"], _COST["isNull"]
+    )
+
+
+def _spatial_operand(arg: Any) -> _Operand:
+    operand = _operand(arg)
+    if operand.get is None:
+        return _Operand(None, _shape(operand.value))
+    get = operand.get
+    return _Operand(lambda item: _shape(get(item)))
+
+
+def _interval_operand(arg: Any) -> _Operand:
+    """An operand as a (start, end) interval, with None for open ends."""
+    if isinstance(arg, Interval):
+        # None for open ends
+        bounds = [
+            None if bound == ".." else _temporal(_operand(bound))
+            for bound in arg.interval
+        ]
+        if all(bound is None or bound.get is None for bound in bounds):
+            return _Operand(
+                None, tuple(None if bound is None else bound.value for bound in bounds)
+            )
+        getters = [None if bound is None else _resolve(bound) for bound in bounds]
+
+        def get_interval(item: Any) -> Any:
+            values: List[Optional[datetime]] = []
+            for get in getters:
+                if get is None:
+                    values.append(None)
+                    continue
+                value = get(item)
+                # Null properties, unlike open ends, match nothing
+                if value is None:
+                    return None
+                values.append(value)
+            return tuple(values)
+
+        return _Operand(get_interval)
+    if isinstance(arg, Date):
+        day = _instant(arg.date_)
+        assert day is not None
+        return _Operand(None, (day, day + timedelta(days=1, microseconds=-1)))
+
+    instant = _temporal(_operand(arg))
+    if instant.get is None:
+        return _Operand(None, None if instant.value is None else (instant.value,) * 2)
+    get = instant.get
+
+    def get_instant(item: Any) -> Any:
+        value = get(item)
+        return None if value is None else (value, value)
+
+    return _Operand(get_instant)
+
+
+def _intervals_intersect(a: Any, b: Any) -> bool:
+    (a_start, a_end), (b_start, b_end) = a, b
+    return (a_start is None or b_end is None or a_start <= b_end) and (
+        b_start is None or a_end is None or b_start <= a_end
+    )
+
+
+def _compile_expression(expression: Any) -> _Compiled:  # noqa: C901
+    if isinstance(expression, (And, Or)):
+        return _logical(expression)
+    if isinstance(expression, Not):
+        compiled = _compile_expression(expression.args[0])
+        inner = compiled.predicate
+        selectivity = 1 - compiled.selectivity
+        if not callable(inner):
+            return _Compiled(None if inner is None else not inner, selectivity, 0.0)
+
+        def negated(item: Any) -> Optional[bool]:
+            value = inner(item)
+            return None if value is None else not value
+
+        return _Compiled(negated, selectivity, compiled.cost)
+    if isinstance(expression, Comparison):
+        a, b = (_operand(arg) for arg in expression.args)
+        return _binary(expression.op, _COMPARISONS[expression.op], a, b)
+    if isinstance(expression, Like):
+        a, b = (_operand(arg) for arg in expression.args)
+        return _binary("like", _like, a, b)
+    if isinstance(expression, Between):
+        return _between(expression)
+    if isinstance(expression, In):
+        return _in(expression)
+    if isinstance(expression, IsNull):
+        return _is_null(expression)
+    if isinstance(expression, SpatialIntersects):
+        a, b = (_spatial_operand(arg) for arg in expression.args)
+        return _binary("s_intersects", _intersects, a, b)
+    if isinstance(expression, TemporalIntersects):
+        a, b = (_interval_operand(arg) for arg in expression.args)
+        return _binary("t_intersects", _intervals_intersect, a, b)
+    raise ValueError(  # pragma: no cover
+        f"Unsupported filter expression {expression!r}"
+    )
+
+
+def _logical(expression: Union[And, Or]) -> _Compiled:  # noqa: C901
+    is_and = isinstance(expression, And)
+    compiled = [_compile_expression(arg) for arg in expression.args]
+    # `and` is false as soon as one argument is false, `or` true as soon as
+    # one is true
+    if any(c.predicate is (not is_and) for c in compiled):
+        return _Compiled(not is_and, 0.0 if is_and else 1.0, 0.0)
+    # Otherwise, UNKNOWN if one argument is
+    unknown = any(c.predicate is None for c in compiled)
+    compiled = [c for c in compiled if callable(c.predicate)]
+    if not compiled:
+        return _Compiled(None if unknown else is_and, 1.0 if is_and else 0.0, 0.0)
+
+    # Evaluate first the arguments most likely to end the evaluation, for
+    # their cost
+    if is_and:
+        compiled.sort(key=lambda c: c.cost / max(1 - c.selectivity, 1e-6))
+    else:
+        compiled.sort(key=lambda c: c.cost / max(c.selectivity, 1e-6))
+    cost = sum(c.cost for c in compiled)
+    selectivity = 1.0
+    for c in compiled:
+        selectivity *= c.selectivity if is_and else 1 - c.selectivity
+    if not is_and:
+        selectivity = 1 - selectivity
+    if len(compiled) == 1 and not unknown:
+        return compiled[0]._replace(selectivity=selectivity)
+
+    predicates = tuple(cast(TriStatePredicate, c.predicate) for c in compiled)
+    # The result when no argument ends the evaluation
+    default = None if unknown else is_and
+    if is_and:
+
+        def predicate(item: Any) -> Optional[bool]:
+            result: Optional[bool] = default
+            for p in predicates:
+                value = p(item)
+                if value is False:
+                    return False
+                if value is None:
+                    result = None
+            return result
+
+    else:
+
+        def predicate(item: Any) -> Optional[bool]:
+            result: Optional[bool] = default
+            for p in predicates:
+                value = p(item)
+                if value:
+                    return True
+                if value is None:
+                    result = None
+            return result
+
+    return _Compiled(predicate, selectivity, cost)
+
+
+def parse_filter(expression: Any) -> Any:
+    """Validate a CQL2-JSON expression (e.g. a dictionary) to its model.
+
+    CQL2 text filters (strings) are not parsed, and raise a `ValueError`.
+    """
+    if isinstance(expression, BaseModel):
+        return expression
+    if isinstance(expression, str):
+        raise ValueError(
+            f"{FILTER_LANG_TEXT} filters are not supported, only {FILTER_LANG}: "
+            f"{expression!r}"
+        )
+    return _expression_adapter.validate_python(expression)
+
+
+def compile_filter(expression: Any) -> Predicate:
+    """Compile a CQL2-JSON expression (a model, or a dictionary) to a function
+    matching Items (models or dictionaries): those for which the expression
+    is true, not false or UNKNOWN. CQL2 text filters raise a `ValueError`."""
+    predicate = _compile_expression(parse_filter(expression)).predicate
+    if not callable(predicate):
+        value = predicate is True
+        return lambda item: value
+    tri_state = predicate
+    return lambda item: tri_state(item) is True
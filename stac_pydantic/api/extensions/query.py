@@ -1,30 +1,63 @@
-"""Query Extension."""
+"""Query Extension.
 
+`compile_query` turns a `query` (as in `ExtendedSearch.query`) into a
+function matching Item properties, with the operands prepared once (`in`
+lists as sets, datetime strings parsed for datetime properties).
+`filter_items` applies it to Items and `query_mask` to columns of property
+values. A missing (or null) property, or a value of a type the operator does
+not apply to, does not match.
+"""
+
+import operator as op
 import warnings
+from datetime import datetime
 from enum import auto
 from types import DynamicClassAttribute
-from typing import Any, Callable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ValidationError
 
+from stac_pydantic.shared import SearchDatetime
 from stac_pydantic.utils import AutoValueEnum
 
-# TODO: These are defined in the spec but aren't currently implemented by the operator syntax
-UNSUPPORTED_OPERATORS = {"startsWith", "endsWith", "contains", "in"}
-
-_OPERATIONS = {
-    "eq": lambda x, y: x == y,
-    "ne": lambda x, y: x != y,  # deprecated
-    "neq": lambda x, y: x != y,
-    "lt": lambda x, y: x < y,
-    "le": lambda x, y: x <= y,  # deprecated
-    "lte": lambda x, y: x <= y,
-    "gt": lambda x, y: x > y,
-    "ge": lambda x, y: x >= y,  # deprecated
-    "gte": lambda x, y: x >= y,
-    "startsWith": lambda x, y: x.startsWith(y),
-    "endsWith": lambda x, y: x.endsWith(y),
+# All the operators defined in the spec are implemented
+UNSUPPORTED_OPERATORS: Set[str] = set()
+
+_OPERATIONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": op.eq,
+    "ne": op.ne,  # deprecated
+    "neq": op.ne,
+    "lt": op.lt,
+    "le": op.le,  # deprecated
+    "lte": op.le,
+    "gt": op.gt,
+    "ge": op.ge,  # deprecated
+    "gte": op.ge,
+    "startsWith": lambda x, y: x.startswith(y),
+    "endsWith": lambda x, y: x.endswith(y),
     "contains": lambda x, y: y in x,
+    "in": lambda x, y: x in y,
 }
 
+# Deprecated operators and the operators replacing them
+_DEPRECATED = {"ne": "neq", "le": "lte", "ge": "gte"}
+
+Query = Mapping[str, Mapping["Operator", Any]]
+Check = Callable[[Any], bool]
+T = TypeVar("T")
+
 
 class Operator(str, AutoValueEnum):
     """
@@ -43,16 +76,129 @@ class Operator(str, AutoValueEnum):
     startsWith = auto()
     endsWith = auto()
     contains = auto()
+    in_ = "in"
+
+    # Set once for each member, below the class
+    _operation: Callable[[Any, Any], bool]
+    _replacement: Optional[str]
 
     @DynamicClassAttribute
     def operator(self) -> Callable[[Any, Any], bool]:
         """Return python operator"""
-        if self._value_ in ["ne", "ge", "le"]:
-            newvalue = self._value_.replace("e", "te")
+        if self._replacement is not None:
             warnings.warn(
-                f"`{self._value_}` is deprecated, please use `{newvalue}`",
+                f"`{self._value_}` is deprecated, please use `{self._replacement}`",
                 DeprecationWarning,
                 stacklevel=3,
             )
 
-        return _OPERATIONS[self._value_]
+        return self._operation
+
+
+for _value, _operation in _OPERATIONS.items():
+    Operator(_value)._operation = _operation
+    Operator(_value)._replacement = _DEPRECATED.get(_value)
+del _value, _operation
+
+
+def _operand(operator: Operator, value: Any) -> Any:
+    if operator is Operator.in_:
+        values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+        try:
+            return frozenset(values)
+        except TypeError:
+            # Unhashable values (e.g. lists) are compared one by one
+            return values
+    return value
+
+
+def _parsed_datetime(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or len(value) < 10 or value[4] != "-":
+        return None
+    try:
+        return SearchDatetime.validate_strings(value, strict=True)
+    except ValidationError:
+        return None
+
+
+def _check(operator: Operator, value: Any) -> Check:
+    """Return a function checking a property value against `value`."""
+    func = operator.operator
+    operand = _operand(operator, value)
+    # Compared to datetime properties of models instead of the string
+    operand_datetime = _parsed_datetime(operand)
+
+    def check(x: Any) -> bool:
+        if x is None:
+            return False
+        y = operand
+        if operand_datetime is not None and isinstance(x, datetime):
+            y = operand_datetime
+        try:
+            return bool(func(x, y))
+        except (TypeError, AttributeError):
+            return False
+
+    return check
+
+
+def _checks(query: Query) -> List[Tuple[str, List[Check]]]:
+    return [
+        (name, [_check(Operator(o), value) for o, value in operators.items()])
+        for name, operators in query.items()
+    ]
+
+
+def compile_query(query: Query) -> Callable[[Any], bool]:
+    """Return a function matching Item properties (a dictionary or model)
+    against all the operators of `query`."""
+    checks = _checks(query)
+
+    def match(properties: Any) -> bool:
+        mapping = isinstance(properties, Mapping)
+        for name, property_checks in checks:
+            if mapping:
+                value = properties.get(name)
+            else:
+                value = getattr(properties, name, None)
+            for check in property_checks:
+                if not check(value):
+                    return False
+        return True
+
+    return match
+
+
+def _item_properties(item: Any) -> Any:
+    if isinstance(item, BaseModel):
+        return item.properties  # type: ignore[attr-defined]
+    return item["properties"]
+
+
+def filter_items(items: Iterable[T], query: Query) -> List[T]:
+    """Return the Items (dictionaries or models) matching `query`."""
+    match = compile_query(query)
+    return [item for item in items if match(_item_properties(item))]
+
+
+def query_mask(columns: Mapping[str, Sequence[Any]], query: Query) -> List[bool]:
+    """Evaluate `query` on columns of property values, by property name.
+
+    Returns whether each row matches, in a single pass over the rows, which
+    are only checked against the remaining operators while they match. A
+    missing column matches no row.
+    """
+    size = len(next(iter(columns.values()))) if columns else 0
+    checks: List[Check] = []
+    values: List[Sequence[Any]] = []
+    for name, property_checks in _checks(query):
+        column = columns.get(name)
+        if column is None:
+            return [False] * size
+        checks.extend(property_checks)
+        values.extend(column for _ in property_checks)
+    if not checks:
+        return [True] * size
+    return [
+        all(check(value) for check, value in zip(checks, row)) for row in zip(*values)
+    ]
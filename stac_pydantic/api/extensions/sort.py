@@ -1,9 +1,49 @@
+"""Sort Extension.
+
+`sort_items` sorts a stream of Items (models or dictionaries) by a `sortby`,
+keeping at most `buffer_size` Items in memory: the `limit` first Items are
+selected with a heap when `limit` is small, otherwise sorted runs of Items
+are written to temporary files and merged.
+
+Missing (or null, or NaN) values are sorted last, in both directions. Values
+of different types are ordered by type (booleans, numbers, strings,
+datetimes, then other values by their string), instead of raising.
+"""
+
+import heapq
+import pickle
+import tempfile
+from datetime import datetime, timezone
 from enum import auto
+from itertools import count, islice
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from pydantic import BaseModel, Field
 
 from stac_pydantic.utils import AutoValueEnum
 
+T = TypeVar("T")
+SortKey = Tuple[Any, ...]
+
+# Items kept in memory by `sort_items` by default
+BUFFER_SIZE = 100_000
+
+# Order of the types of sorted values
+_BOOL, _NUMBER, _STRING, _DATETIME, _OTHER = range(5)
+_MISSING = (1, 0, None)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 class SortDirections(str, AutoValueEnum):
     asc = auto()
@@ -17,3 +57,145 @@ class SortExtension(BaseModel):
 
     field: str = Field(..., alias="field", min_length=1)
     direction: SortDirections
+
+
+def _field_getter(field: str) -> Callable[[Any], Any]:
+    """Value of a sort field: `properties.` fields and those missing from the
+    top level of the Item are read from its properties."""
+    if field.startswith("properties."):
+        name, top_level = field[len("properties.") :], False
+    else:
+        name, top_level = field, True
+
+    def get(item: Any) -> Any:
+        if isinstance(item, dict):
+            if top_level and name in item:
+                return item[name]
+            return (item.get("properties") or {}).get(name)
+        if top_level and name in type(item).model_fields:
+            return getattr(item, name)
+        return getattr(getattr(item, "properties", None), name, None)
+
+    return get
+
+
+def _typed(value: Any) -> Optional[Tuple[int, Any]]:
+    """The type rank and comparable value of `value`, None if missing."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return _BOOL, value
+    if isinstance(value, (int, float)):
+        return None if value != value else (_NUMBER, value)
+    if isinstance(value, str):
+        return _STRING, value
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return _DATETIME, value
+    return _OTHER, str(value)
+
+
+def _descending(rank: int, value: Any) -> Any:
+    """A value sorting in the reverse order of `value` (of type `rank`)."""
+    if rank <= _NUMBER:
+        return -value
+    if rank == _DATETIME:
+        return -(value - _EPOCH).total_seconds()
+    # Strings as their negated code points, ended by a value sorting after
+    # them so that longer strings sort before their prefixes
+    return (*(-c for c in map(ord, value)), 1)
+
+
+def sort_key(sortby: Sequence[SortExtension]) -> Callable[[Any], SortKey]:
+    """Return a function computing the sort key of an Item for `sortby`.
+
+    Keys are flat tuples of (missing, type rank, value) for each field.
+    """
+    getters = [
+        (_field_getter(sort.field), sort.direction == SortDirections.desc)
+        for sort in sortby
+    ]
+
+    def key(item: Any) -> SortKey:
+        components: List[Any] = []
+        for get, descending in getters:
+            typed = _typed(get(item))
+            if typed is None:
+                components.extend(_MISSING)
+            elif descending:
+                rank, value = typed
+                components.extend((0, -rank, _descending(rank, value)))
+            else:
+                components.extend((0, typed[0], typed[1]))
+        return tuple(components)
+
+    return key
+
+
+def _write_run(run: List[Any], tmpdir: Optional[str]) -> IO[bytes]:
+    file = tempfile.TemporaryFile(dir=tmpdir)
+    pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL)
+    for entry in run:
+        pickler.dump(entry)
+        # Otherwise the pickler keeps a reference to every entry
+        pickler.clear_memo()
+    file.seek(0)
+    return file
+
+
+def _read_run(file: IO[bytes]) -> Iterator[Any]:
+    unpickler = pickle.Unpickler(file)
+    while True:
+        try:
+            yield unpickler.load()
+        except EOFError:
+            return
+
+
+def sort_items(
+    items: Iterable[T],
+    sortby: Sequence[SortExtension],
+    limit: Optional[int] = None,
+    *,
+    buffer_size: int = BUFFER_SIZE,
+    tmpdir: Optional[str] = None,
+) -> Iterator[T]:
+    """Sort Items (models or dictionaries) by `sortby`, yielding the first `limit`.
+
+    The sort is stable. With a `limit` of at most `buffer_size`, only the
+    `limit` first Items are kept, in a heap. Otherwise, once more than
+    `buffer_size` Items are read, sorted runs of `buffer_size` Items are
+    pickled to temporary files (in `tmpdir`), merged while iterating and
+    removed once the iterator is exhausted or closed.
+    """
+    key = sort_key(sortby)
+    sequence = count()
+    entries = ((key(item), next(sequence), item) for item in items)
+
+    if limit is not None and limit <= buffer_size:
+        for _, _, item in heapq.nsmallest(limit, entries):
+            yield item
+        return
+
+    runs: List[IO[bytes]] = []
+    try:
+        while True:
+            run = list(islice(entries, buffer_size))
+            run.sort()
+            if not runs and len(run) < buffer_size:
+                # Everything fits in memory
+                merged: Iterable[Any] = run
+                break
+            if run:
+                runs.append(_write_run(run, tmpdir))
+            if len(run) < buffer_size:
+                merged = heapq.merge(*(_read_run(file) for file in runs))
+                break
+            del run
+
+        for _, _, item in islice(merged, limit):
+            yield item
+    finally:
+        for file in runs:
+            file.close()
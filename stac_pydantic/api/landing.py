@@ -2,13 +2,19 @@ from typing import List
 
 from pydantic import AnyUrl, HttpUrl, model_validator
 
+from stac_pydantic.api.conformance import (
+    COLLECTIONS,
+    CORE,
+    ITEM_SEARCH,
+    OGC_FEATURES_CORE,
+    _Conformant,
+)
 from stac_pydantic.api.links import Links
-from stac_pydantic.api.version import STAC_API_VERSION
 from stac_pydantic.catalog import Catalog
 from stac_pydantic.links import Relations
 
 
-class LandingPage(Catalog):
+class LandingPage(Catalog, _Conformant):
     """
     https://github.com/radiantearth/stac-api-spec/tree/v1.0.0/core
     https://github.com/radiantearth/stac-api-spec/tree/v1.0.0/ogcapi-features#landing-page-
@@ -16,8 +22,8 @@ class LandingPage(Catalog):
     """
 
     conformsTo: List[AnyUrl] = [
-        HttpUrl("https://api.stacspec.org/v1.0.0/core"),
-        HttpUrl("http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core"),
+        HttpUrl(CORE),
+        HttpUrl(OGC_FEATURES_CORE),
     ]
     links: Links
 
@@ -34,20 +40,14 @@ class LandingPage(Catalog):
                 rel in links_rel
             ), f"STAC API conform Landing pages must include a `{rel}` link."
 
-        if (
-            AnyUrl(f"https://api.stacspec.org/v{STAC_API_VERSION}/collections")
-            in self.conformsTo
-        ):
+        if COLLECTIONS in self.conformance_classes:
             required_collections_rels = [Relations.data]
             for rel in required_collections_rels:
                 assert (
                     rel in links_rel
                 ), f"STAC API COLLECTION conform Landing pages must include a `{rel}` link."
 
-        if (
-            AnyUrl(f"https://api.stacspec.org/v{STAC_API_VERSION}/item-search")
-            in self.conformsTo
-        ):
+        if ITEM_SEARCH in self.conformance_classes:
             required_feature_rels = [Relations.search]
             for rel in required_feature_rels:
                 assert (
@@ -1,5 +1,5 @@
 from datetime import datetime as dt
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from geojson_pydantic.geometries import (
     GeometryCollection,
@@ -10,22 +10,49 @@ from geojson_pydantic.geometries import (
     Point,
     Polygon,
 )
-from pydantic import AfterValidator, BaseModel, Field, model_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, model_validator
 from typing_extensions import Annotated
 
 from stac_pydantic.api.extensions.fields import FieldsExtension
+from stac_pydantic.api.extensions.filter import (
+    FILTER_CRS,
+    FILTER_LANG,
+    FILTER_LANG_TEXT,
+    Expression,
+)
 from stac_pydantic.api.extensions.query import Operator
 from stac_pydantic.api.extensions.sort import SortExtension
+from stac_pydantic.hashing import canonical_datetime, canonical_hash
 
 # TODO: remove in 4.0
 from stac_pydantic.shared import SearchDatetime  # noqa
 from stac_pydantic.shared import (
+    DEFER_BUILD,
     BBox,
     str_to_datetimes,
     validate_bbox,
     validate_datetime,
 )
 
+# Deprecated query operators and the operators replacing them
+_OPERATOR_ALIASES = {
+    Operator.ne: Operator.neq,
+    Operator.le: Operator.lte,
+    Operator.ge: Operator.gte,
+}
+
+
+def _round(value: Any, precision: int) -> Any:
+    """Round the numbers of a (nested) list or dictionary to floats."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(float(value), precision)
+    if isinstance(value, (list, tuple)):
+        return [_round(v, precision) for v in value]
+    if isinstance(value, dict):
+        return {k: _round(v, precision) for k, v in value.items()}
+    return value
+
+
 Intersection = Union[
     Point,
     MultiPoint,
@@ -44,6 +71,8 @@ class Search(BaseModel):
     https://github.com/radiantearth/stac-api-spec/blob/v1.0.0/item-search/README.md#query-parameter-table
     """
 
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
     collections: Optional[List[str]] = None
     ids: Optional[List[str]] = None
     bbox: Annotated[Optional[BBox], AfterValidator(validate_bbox)] = None
@@ -73,6 +102,39 @@ class Search(BaseModel):
             raise ValueError("intersects and bbox parameters are mutually exclusive")
         return values
 
+    def canonical(self, precision: int = 7) -> Dict[str, Any]:
+        """Return the search parameters in a deterministic, normalized form.
+
+        Equivalent searches give the same dictionary: `collections` and `ids`
+        are sorted and deduplicated, `bbox` and `intersects` coordinates are
+        floats rounded to `precision` decimals, `datetime` bounds are in UTC
+        (`..` for open ends) and the default `limit` is included. Parameters
+        set to None are left out.
+        """
+        params: Dict[str, Any] = {}
+        if self.collections is not None:
+            params["collections"] = sorted(set(self.collections))
+        if self.ids is not None:
+            params["ids"] = sorted(set(self.ids))
+        if self.bbox is not None:
+            params["bbox"] = _round(self.bbox, precision)
+        if self.intersects is not None:
+            params["intersects"] = _round(
+                self.intersects.model_dump(exclude_none=True), precision
+            )
+        if self.datetime is not None:
+            params["datetime"] = "/".join(
+                canonical_datetime(d) if d else ".."
+                for d in str_to_datetimes(self.datetime)
+            )
+        if self.limit is not None:
+            params["limit"] = self.limit
+        return params
+
+    def cache_key(self, precision: int = 7, algorithm: str = "sha256") -> str:
+        """Return a hash of the `canonical` parameters, equal for equivalent searches."""
+        return canonical_hash(self.canonical(precision), algorithm)
+
     @property
     def spatial_filter(self) -> Optional[Intersection]:
         """Return a geojson-pydantic object representing the spatial filter for the search request.
@@ -95,3 +157,58 @@ class ExtendedSearch(Search):
     field: Optional[FieldsExtension] = Field(None, alias="fields")
     query: Optional[Dict[str, Dict[Operator, Any]]] = None
     sortby: Optional[List[SortExtension]] = None
+    # Filter extension, with CQL2-JSON expressions (or CQL2 text, left unparsed)
+    filter: Optional[Union[Expression, str]] = None
+    filter_lang: Optional[Literal["cql2-json", "cql2-text"]] = Field(
+        None, alias="filter-lang"
+    )
+    filter_crs: Optional[str] = Field(None, alias="filter-crs")
+
+    def canonical(self, precision: int = 7) -> Dict[str, Any]:
+        """Return the search parameters in a deterministic, normalized form.
+
+        In addition to `Search.canonical`, `fields` includes and excludes are
+        sorted, deprecated `query` operators replaced (`ne` by `neq`, ...) and
+        `filter` timestamps written in UTC (CQL2 text filters are kept as is).
+        `filter-lang` and `filter-crs` are included, with their defaults, along
+        with a `filter`, and otherwise only when not set to their defaults.
+        """
+        params = super().canonical(precision)
+        if self.field is not None:
+            params["fields"] = {
+                key: sorted(values)
+                for key, values in (
+                    ("includes", self.field.includes),
+                    ("excludes", self.field.excludes),
+                )
+                if values is not None
+            }
+        if self.query is not None:
+            params["query"] = {
+                name: {
+                    _OPERATOR_ALIASES.get(op, op).value: value
+                    for op, value in operators.items()
+                }
+                for name, operators in self.query.items()
+            }
+        if self.sortby is not None:
+            params["sortby"] = [
+                {"field": sort.field, "direction": sort.direction.value}
+                for sort in self.sortby
+            ]
+        filter_lang = FILTER_LANG
+        if isinstance(self.filter, str):
+            params["filter"] = self.filter
+            filter_lang = FILTER_LANG_TEXT
+        elif self.filter is not None:
+            params["filter"] = self.filter.model_dump(
+                mode="json", by_alias=True, exclude_none=True
+            )
+        for key, value, default in (
+            ("filter-lang", self.filter_lang, filter_lang),
+            ("filter-crs", self.filter_crs, FILTER_CRS),
+        ):
+            value = value or default
+            if self.filter is not None or value != default:
+                params[key] = value
+        return params
@@ -0,0 +1,258 @@
+"""Compile searches to parameterized SQL, to filter Items in the database.
+
+`compile_search` translates the parameters of a `Search` (or `ExtendedSearch`)
+into a `WHERE`, `ORDER BY` and `LIMIT` clause, with the values passed as bind
+parameters, for a table of Items described by `Columns`::
+
+    columns = Columns(properties={"eo:cloud_cover": "cloud_cover"})
+    clause = compile_search(search, columns)
+    cursor.execute(f"SELECT * FROM items {clause.sql}", clause.params)
+
+The column names and expressions of `Columns` are written as is, the values
+of the search only as parameters. Parameters that can not be expressed with
+the columns (`intersects` without an `intersects` expression, properties
+without a column) raise a `ValueError`, instead of being left to be filtered
+after fetching the rows.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime as dt
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from stac_pydantic.api.extensions.query import Operator
+from stac_pydantic.api.extensions.sort import SortDirections, SortExtension
+from stac_pydantic.api.search import ExtendedSearch, Search
+
+PARAMSTYLES = ("qmark", "numeric", "format")
+
+_COMPARISONS = {
+    Operator.eq: "=",
+    Operator.ne: "<>",
+    Operator.neq: "<>",
+    Operator.lt: "<",
+    Operator.le: "<=",
+    Operator.lte: "<=",
+    Operator.gt: ">",
+    Operator.ge: ">=",
+    Operator.gte: ">=",
+}
+
+# LIKE patterns of the string operators, around the escaped value
+_PATTERNS = {
+    Operator.startsWith: "{}%",
+    Operator.endsWith: "%{}",
+    Operator.contains: "%{}%",
+}
+
+
+@dataclass
+class Columns:
+    """Columns (or SQL expressions) of a table of Items.
+
+    `datetime` holds the datetime of the Items, or with `end_datetime`, the
+    start of their range (`start_datetime`, or `datetime` for Items without
+    a range, as `end_datetime` then). `bbox` are the xmin, ymin, xmax and
+    ymax columns of their bounding box.
+
+    `intersects` is an expression testing the geometry against the GeoJSON
+    `{geometry}` parameter, e.g. `ST_Intersects(geometry,
+    ST_GeomFromGeoJSON({geometry}))`. `properties` maps property names (for
+    `query` and `sortby`) to columns, and `property_expression` is used for
+    the others, with a `{name}` parameter, e.g. `properties ->> {name}` for
+    PostgreSQL. `datetime_value` converts datetimes before binding them, e.g.
+    to strings for SQLite.
+    """
+
+    id: str = "id"
+    collection: str = "collection"
+    datetime: str = "datetime"
+    end_datetime: Optional[str] = None
+    bbox: Optional[Tuple[str, str, str, str]] = ("xmin", "ymin", "xmax", "ymax")
+    intersects: Optional[str] = None
+    properties: Dict[str, str] = field(default_factory=dict)
+    property_expression: Optional[str] = None
+    datetime_value: Optional[Callable[[dt], Any]] = None
+
+
+@dataclass
+class SqlClause:
+    """A compiled search: the `where` condition, `order_by` expressions and
+    `limit` placeholder (empty or None if not set), and the parameters, in
+    their order in `sql`."""
+
+    where: str
+    order_by: str
+    limit: Optional[str]
+    params: List[Any]
+
+    @property
+    def sql(self) -> str:
+        """The `WHERE ... ORDER BY ... LIMIT ...` clause."""
+        parts = []
+        if self.where:
+            parts.append(f"WHERE {self.where}")
+        if self.order_by:
+            parts.append(f"ORDER BY {self.order_by}")
+        if self.limit:
+            parts.append(f"LIMIT {self.limit}")
+        return " ".join(parts)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class _Compiler:
+    def __init__(self, columns: Columns, paramstyle: str):
+        if paramstyle not in PARAMSTYLES:
+            raise ValueError(
+                f"Unsupported paramstyle {paramstyle!r}, must be one of {PARAMSTYLES}"
+            )
+        self.columns = columns
+        self.paramstyle = paramstyle
+        self.params: List[Any] = []
+
+    def param(self, value: Any) -> str:
+        if isinstance(value, dt) and self.columns.datetime_value is not None:
+            value = self.columns.datetime_value(value)
+        self.params.append(value)
+        if self.paramstyle == "qmark":
+            return "?"
+        if self.paramstyle == "numeric":
+            return f":{len(self.params)}"
+        return "%s"
+
+    def params_list(self, values: Sequence[Any]) -> str:
+        return ", ".join(self.param(value) for value in values)
+
+    def column(self, name: str) -> str:
+        """Column of a top level field (`id`, `collection`) or property."""
+        columns = self.columns
+        if name in ("id", "collection"):
+            return getattr(columns, name)
+        if name.startswith("properties."):
+            name = name[len("properties.") :]
+        if name in columns.properties:
+            return columns.properties[name]
+        if name == "datetime":
+            return columns.datetime
+        if columns.property_expression is not None:
+            return columns.property_expression.replace("{name}", self.param(name))
+        raise ValueError(f"No column for property {name!r}")
+
+    def bbox(self, bbox: Sequence[float]) -> List[str]:
+        if self.columns.bbox is None:
+            raise ValueError("bbox search without bbox columns")
+        xmin, ymin, xmax, ymax = self.columns.bbox
+        if len(bbox) == 6:
+            bbox = (bbox[0], bbox[1], bbox[3], bbox[4])
+        west, south, east, north = bbox
+        # Items whose bbox crosses the antimeridian (xmin > xmax) span the
+        # longitudes from xmin to 180 and from -180 to xmax
+        crossing = f"{xmin} > {xmax}"
+        if west > east:
+            # Crossing the antimeridian, as all the crossing Items
+            longitude = (
+                f"({crossing} OR {xmax} >= {self.param(west)}"
+                f" OR {xmin} <= {self.param(east)})"
+            )
+        else:
+            longitude = (
+                f"({xmax} >= {self.param(west)} AND {xmin} <= {self.param(east)}"
+                f" OR {crossing} AND ({xmax} >= {self.param(west)}"
+                f" OR {xmin} <= {self.param(east)}))"
+            )
+        return [
+            longitude,
+            f"{ymax} >= {self.param(south)} AND {ymin} <= {self.param(north)}",
+        ]
+
+    def datetime(self, start: Optional[dt], end: Optional[dt]) -> List[str]:
+        columns = self.columns
+        conditions = []
+        if start is not None:
+            column = columns.end_datetime or columns.datetime
+            conditions.append(f"{column} >= {self.param(start)}")
+        if end is not None:
+            conditions.append(f"{columns.datetime} <= {self.param(end)}")
+        return conditions
+
+    def comparison(self, name: str, operator: Operator, value: Any) -> str:
+        if operator is Operator.in_:
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            if not values:
+                # `IN ()` is not valid SQL, and matches nothing
+                return "1 = 0"
+            return f"{self.column(name)} IN ({self.params_list(list(values))})"
+        column = self.column(name)
+        if operator in _PATTERNS:
+            pattern = _PATTERNS[operator].format(_escape_like(str(value)))
+            return f"{column} LIKE {self.param(pattern)} ESCAPE '\\'"
+        return f"{column} {_COMPARISONS[operator]} {self.param(value)}"
+
+    def query(self, query: Dict[str, Dict[Operator, Any]]) -> List[str]:
+        return [
+            self.comparison(name, operator, value)
+            for name, operators in query.items()
+            for operator, value in operators.items()
+        ]
+
+    def sortby(self, sortby: List[SortExtension]) -> List[str]:
+        return [
+            f"{self.column(sort.field)} "
+            + ("DESC" if sort.direction == SortDirections.desc else "ASC")
+            for sort in sortby
+        ]
+
+
+def compile_search(
+    search: Search, columns: Optional[Columns] = None, paramstyle: str = "qmark"
+) -> SqlClause:
+    """Compile a search to a parameterized `WHERE`, `ORDER BY` and `LIMIT` clause.
+
+    `collections` and `ids` match any of the values (empty lists are not
+    filtered on), `bbox` the Items whose bounding box intersects it (either
+    may cross the antimeridian, with `xmin > xmax` in the columns) and
+    `datetime` those whose datetime (or range) intersects the searched
+    instant or range, with `..` or empty ends open as in
+    `str_to_datetimes`. For an `ExtendedSearch`, `query` operators compare
+    the property columns (the `LIKE` of `startsWith`, `endsWith` and
+    `contains` is case-insensitive in some databases) and `sortby` orders
+    the rows.
+
+    `paramstyle` is the DB-API placeholder style: `qmark` (`?`, sqlite3),
+    `numeric` (`:1`) or `format` (`%s`, psycopg).
+    """
+    compiler = _Compiler(columns or Columns(), paramstyle)
+    conditions: List[str] = []
+
+    if search.collections:
+        conditions.append(
+            f"{compiler.columns.collection} IN ({compiler.params_list(search.collections)})"
+        )
+    if search.ids:
+        conditions.append(
+            f"{compiler.columns.id} IN ({compiler.params_list(search.ids)})"
+        )
+    if search.bbox:
+        conditions.extend(compiler.bbox(search.bbox))
+    if search.intersects is not None:
+        if compiler.columns.intersects is None:
+            raise ValueError("intersects search without an intersects expression")
+        geometry = compiler.param(search.intersects.model_dump_json(exclude_none=True))
+        conditions.append(compiler.columns.intersects.replace("{geometry}", geometry))
+    if search.datetime:
+        conditions.extend(compiler.datetime(search.start_date, search.end_date))
+
+    order_by: List[str] = []
+    if isinstance(search, ExtendedSearch):
+        if search.filter is not None:
+            lang = "cql2-text" if isinstance(search.filter, str) else "cql2-json"
+            raise ValueError(f"filter ({lang}) searches are not supported")
+        conditions.extend(compiler.query(search.query or {}))
+        order_by.extend(compiler.sortby(search.sortby or []))
+
+    where = " AND ".join(conditions)
+    order = ", ".join(order_by)
+    limit = compiler.param(search.limit) if search.limit is not None else None
+    return SqlClause(where, order, limit, compiler.params)
@@ -0,0 +1,251 @@
+"""Bounding boxes of GeoJSON geometries.
+
+`geometry_bbox` computes the bbox of a geometry (a geojson-pydantic model or
+a GeoJSON dictionary), with NumPy when it is installed and the geometry is
+large, and `bbox_covers` checks that a bbox covers another. Both handle
+bboxes crossing the antimeridian (`west > east`): the bbox of a geometry
+split at the antimeridian, as recommended by RFC 7946 (with parts touching
+it), crosses it when that is the narrowest bbox covering its parts.
+`bbox_covers_geometry` accepts any bbox covering every part of a geometry,
+crossing the antimeridian or not.
+
+Item validation uses them with the `bbox` key of the validation context
+(see `BBoxValidation`)::
+
+    collection = ItemCollection.model_validate(data, context={"bbox": "fill"})
+"""
+
+from enum import auto
+from functools import lru_cache
+from itertools import chain
+from types import ModuleType
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from stac_pydantic.shared import BBox
+from stac_pydantic.utils import AutoValueEnum, get_value
+
+# Geometries with fewer positions are handled in Python, faster than
+# building arrays
+NUMPY_MIN_POSITIONS = 256
+
+Position = Sequence[float]
+# (min, max) of each coordinate of a part of a geometry
+Extent = Tuple[List[float], List[float]]
+
+
+class BBoxValidation(str, AutoValueEnum):
+    """How Items validate their `bbox`, from the `bbox` key of the validation
+    context.
+
+    - `require` (default): a bbox is required with a geometry.
+    - `check`: `require`, and the bbox must cover the geometry.
+    - `fill`: a missing bbox is computed from the geometry, a given one must
+      cover it.
+    """
+
+    require = auto()
+    check = auto()
+    fill = auto()
+
+
+def bbox_validation(context: Any) -> BBoxValidation:
+    """Return the bbox validation of a validation context, `require` by default."""
+    if not isinstance(context, dict) or context.get("bbox") is None:
+        return BBoxValidation.require
+    value = context["bbox"]
+    try:
+        return BBoxValidation(value)
+    except ValueError:
+        raise ValueError(
+            f"Invalid bbox validation {value!r}, expected 'require', 'check' or 'fill'"
+        ) from None
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Optional[ModuleType]:
+    """NumPy, if installed, imported on first use to keep imports fast."""
+    try:
+        import numpy
+    except ImportError:  # pragma: nocover
+        return None
+    return numpy
+
+
+def _parts(geometry: Any) -> List[Sequence[Position]]:
+    """Positions of the parts of a geometry (exterior rings for polygons)."""
+    geometry_type = get_value(geometry, "type")
+    if geometry_type == "GeometryCollection":
+        return list(
+            chain.from_iterable(
+                _parts(g) for g in get_value(geometry, "geometries") or ()
+            )
+        )
+    coordinates = get_value(geometry, "coordinates")
+    if coordinates is None or len(coordinates) == 0:
+        return []
+    if geometry_type == "Point":
+        return [[coordinates]]
+    if geometry_type == "MultiPoint":
+        return [[position] for position in coordinates]
+    if geometry_type == "LineString":
+        return [coordinates]
+    if geometry_type == "MultiLineString":
+        return list(coordinates)
+    if geometry_type == "Polygon":
+        return [coordinates[0]]
+    if geometry_type == "MultiPolygon":
+        return [polygon[0] for polygon in coordinates if polygon]
+    raise ValueError(f"Unknown geometry type {geometry_type!r}")
+
+
+def _python_extents(parts: List[Sequence[Position]]) -> List[Extent]:
+    extents = []
+    for part in parts:
+        # Columns of the coordinates, truncated to the shortest position
+        columns = list(zip(*part))[:3]
+        extents.append(([min(c) for c in columns], [max(c) for c in columns]))
+    return extents
+
+
+def _numpy_extents(
+    numpy: ModuleType, parts: List[Sequence[Position]]
+) -> Optional[List[Extent]]:
+    """Extents of the parts, None if positions have different dimensions."""
+    sizes = [len(part) for part in parts]
+    dimensions = len(parts[0][0])
+    if all(isinstance(part, numpy.ndarray) for part in parts):
+        positions = numpy.concatenate(parts, dtype=float)
+    else:
+        positions = numpy.fromiter(
+            chain.from_iterable(chain.from_iterable(parts)), dtype=float
+        )
+    if positions.size != sum(sizes) * dimensions:
+        return None
+    positions = positions.reshape(-1, dimensions)[:, :3]
+    offsets = numpy.cumsum([0] + sizes[:-1])
+    mins = numpy.minimum.reduceat(positions, offsets, axis=0).tolist()
+    maxs = numpy.maximum.reduceat(positions, offsets, axis=0).tolist()
+    return list(zip(mins, maxs))
+
+
+def _longitudes(intervals: List[Tuple[float, float]]) -> Tuple[float, float]:
+    """West and east of the narrowest longitude range covering `intervals`.
+
+    The range excludes the largest gap between the intervals, which is the
+    antimeridian unless a larger gap is found between two intervals.
+    """
+    intervals.sort()
+    west, east = intervals[0][0], max(hi for _, hi in intervals)
+    largest_gap = west + 360 - east
+    reached = intervals[0][1]
+    for lo, hi in intervals[1:]:
+        if lo - reached > largest_gap:
+            largest_gap = lo - reached
+            west, east = lo, reached
+        reached = max(reached, hi)
+    return west, east
+
+
+def _extents(geometry: Any) -> List[Extent]:
+    """Extents of the parts (points, lines, polygons) of a geometry."""
+    if geometry is None:
+        return []
+    parts = [part for part in _parts(geometry) if len(part)]
+    if not parts:
+        return []
+
+    if sum(map(len, parts)) >= NUMPY_MIN_POSITIONS:
+        numpy = _numpy()
+        if numpy is not None:
+            extents = _numpy_extents(numpy, parts)
+            if extents is not None:
+                return extents
+    return _python_extents(parts)
+
+
+def geometry_bbox(geometry: Any, antimeridian: bool = True) -> Optional[BBox]:
+    """Return the bbox of a geometry, None for a null or empty geometry.
+
+    The bbox is 3D if all the positions have an elevation. With
+    `antimeridian`, and parts of the geometry (points, lines, polygons)
+    touching the antimeridian, the longitude range of the bbox is the
+    narrowest one covering all the parts, which crosses the antimeridian for
+    a geometry split at it. Otherwise it goes from the minimum to the
+    maximum longitude.
+    """
+    extents = _extents(geometry)
+    if not extents:
+        return None
+
+    dimensions = min(len(mins) for mins, _ in extents)
+    mins = [min(e[0][i] for e in extents) for i in range(dimensions)]
+    maxs = [max(e[1][i] for e in extents) for i in range(dimensions)]
+    if antimeridian and len(extents) > 1 and (mins[0] <= -180 or maxs[0] >= 180):
+        mins[0], maxs[0] = _longitudes([(e[0][0], e[1][0]) for e in extents])
+    if dimensions == 3:
+        return (mins[0], mins[1], mins[2], maxs[0], maxs[1], maxs[2])
+    return (mins[0], mins[1], maxs[0], maxs[1])
+
+
+def _longitude_range(bbox: Sequence[float]) -> Tuple[float, float]:
+    """West and width of a bbox, crossing the antimeridian if `west > east`."""
+    half = len(bbox) // 2
+    west, east = bbox[0], bbox[half]
+    return west, east - west if west <= east else east - west + 360
+
+
+def bbox_covers(
+    bbox: Sequence[float], other: Sequence[float], tolerance: float = 1e-9
+) -> bool:
+    """Whether `bbox` covers `other`, within `tolerance` (in degrees or units
+    of elevation). Elevations are only compared if both bboxes are 3D."""
+    half, other_half = len(bbox) // 2, len(other) // 2
+    if (
+        bbox[1] - tolerance > other[1]
+        or other[other_half + 1] > bbox[half + 1] + tolerance
+    ):
+        return False
+    if half == other_half == 3 and (
+        bbox[2] - tolerance > other[2] or other[5] > bbox[5] + tolerance
+    ):
+        return False
+
+    west, width = _longitude_range(bbox)
+    if width >= 360 - tolerance:
+        return True
+    other_west, other_width = _longitude_range(other)
+    offset = (other_west - west) % 360
+    if offset > 360 - tolerance:
+        # Slightly west of `bbox`
+        offset -= 360
+    return offset + other_width <= width + tolerance
+
+
+def bbox_covers_geometry(
+    bbox: Sequence[float], geometry: Any, tolerance: float = 1e-9
+) -> bool:
+    """Whether `bbox` covers every part of a geometry, within `tolerance`.
+
+    Unlike comparing it with `geometry_bbox`, any bbox covering the parts is
+    accepted: the one from the minimum to the maximum longitude as well as
+    one crossing the antimeridian.
+    """
+    for mins, maxs in _extents(geometry):
+        dimensions = min(len(mins), 3)
+        if not bbox_covers(bbox, mins[:dimensions] + maxs[:dimensions], tolerance):
+            return False
+    return True
+
+
+def bbox_mismatches(items: Iterable[Any], tolerance: float = 1e-9) -> List[str]:
+    """Return the ids of the Items (models or dictionaries) whose bbox is
+    missing or does not cover their geometry."""
+    mismatches = []
+    for item in items:
+        geometry = get_value(item, "geometry")
+        if not _extents(geometry):
+            continue
+        bbox = get_value(item, "bbox")
+        if bbox is None or not bbox_covers_geometry(bbox, geometry, tolerance):
+            mismatches.append(get_value(item, "id"))
+    return mismatches
@@ -3,11 +3,11 @@ from typing import List, Literal, Optional
 from pydantic import AnyUrl, ConfigDict, Field
 
 from stac_pydantic.links import Links
-from stac_pydantic.shared import SEMVER_REGEX, StacBaseModel
+from stac_pydantic.shared import SEMVER_REGEX, _SubtreeHashCache
 from stac_pydantic.version import STAC_VERSION
 
 
-class _Catalog(StacBaseModel):
+class _Catalog(_SubtreeHashCache):
     """
     https://github.com/radiantearth/stac-spec/blob/v1.0.0/catalog-spec/catalog-spec.md
     """
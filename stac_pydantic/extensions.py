@@ -1,5 +1,8 @@
+import json
+import os
 from functools import lru_cache
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlparse
 
 from stac_pydantic.catalog import Catalog
 from stac_pydantic.collection import Collection
@@ -23,15 +26,37 @@ def _fetch_and_cache_schema(url: str) -> dict:
     return req.json()
 
 
+@lru_cache(maxsize=128)
+def _load_and_cache_schema(url: str, schema_dir: str) -> dict:
+    """Load the JSON schema from a local mirror, if not already cached.
+
+    The schema of `https://{host}/{path}` is read from `{schema_dir}/{host}/{path}`.
+    URLs whose path (e.g. with `..` segments) is outside of `schema_dir` raise
+    a ValueError.
+    """
+    parsed = urlparse(url)
+    root = os.path.abspath(schema_dir)
+    path = os.path.normpath(os.path.join(root, parsed.netloc, *parsed.path.split("/")))
+    if os.path.commonpath([root, path]) != root or path == root:
+        raise ValueError(f"Schema {url!r} is outside of the schema directory")
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
 def validate_extensions(
     stac_obj: Union[Item, Collection, Catalog, Dict[str, Any]],
     reraise_exception: bool = False,
+    schema_dir: Optional[str] = None,
 ) -> bool:
     """
     Fetch the remote JSON schema, if not already cached, and validate the STAC
     object against that schema.
+
+    When `schema_dir` is set, schemas are read from that local mirror instead
+    (see `_load_and_cache_schema`) and no network access is made.
     """
-    assert requests is not None, "requests must be installed to validate extensions"
+    if schema_dir is None:
+        assert requests is not None, "requests must be installed to validate extensions"
     assert jsonschema is not None, "jsonschema must be installed to validate extensions"
 
     if isinstance(stac_obj, dict):
@@ -42,7 +67,11 @@ def validate_extensions(
     try:
         if stac_dict["stac_extensions"]:
             for ext in stac_dict["stac_extensions"]:
-                schema = _fetch_and_cache_schema(ext)
+                schema = (
+                    _fetch_and_cache_schema(ext)
+                    if schema_dir is None
+                    else _load_and_cache_schema(ext, schema_dir)
+                )
                 jsonschema.validate(instance=stac_dict, schema=schema)
     except Exception:
         if reraise_exception:
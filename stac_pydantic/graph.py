@@ -0,0 +1,261 @@
+"""Navigate in-memory Catalogs, Collections and Items through their links."""
+
+import posixpath
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+from typing import Collection as AbstractCollection
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from stac_pydantic.catalog import Catalog
+from stac_pydantic.collection import Collection
+from stac_pydantic.item import Item
+from stac_pydantic.links import Relations
+
+StacObject = Union[Catalog, Collection, Item]
+Node = Union[StacObject, str]
+
+# Links checked by `CatalogGraph.dangling_links` by default
+STRUCTURAL_RELS = frozenset({"root", "parent", "child", "item", "collection"})
+
+
+@dataclass(frozen=True)
+class DanglingLink:
+    """A link of the object at `source` to an `href` missing from the graph."""
+
+    source: str
+    rel: str
+    href: str
+
+
+def _normalize(href: str) -> str:
+    """Remove the `.` and `..` segments of an href path."""
+    parts = urlsplit(href)
+    if not parts.path:
+        return href
+    path = posixpath.normpath(parts.path)
+    if parts.path.endswith("/") and path != "/":
+        path += "/"
+    return urlunsplit(parts._replace(path=path))
+
+
+def _self_href(obj: StacObject) -> Optional[str]:
+    for link in obj.links.link_iterator():
+        if link.rel == Relations.self:
+            return link.href
+    return None
+
+
+class CatalogGraph:
+    """Catalogs, Collections and Items, indexed by href and id, with the
+    graph of their `parent`, `child`, `item` and `collection` links.
+
+    Objects are added with their href (by default, that of their `self`
+    link), against which their relative links are resolved. Links are
+    indexed when objects are added, so that `parent`, `children` and `items`
+    do not scan the links of the other objects. An edge is known from either
+    end: the `child` (or `item`) link of a parent or the `parent` link of the
+    child, and the `collection` link or field of an Item. Links to objects
+    not in the graph are kept, and followed once the objects are added.
+    """
+
+    def __init__(
+        self, objects: Iterable[Union[StacObject, Tuple[StacObject, str]]] = ()
+    ):
+        self._nodes: Dict[str, StacObject] = {}
+        # Hrefs of each object, by `id`, as it may be added at several hrefs
+        self._hrefs: Dict[int, Dict[str, None]] = {}
+        self._ids: Dict[str, Dict[str, None]] = {}
+        # Resolved links of each object
+        self._links: Dict[str, List[Tuple[str, str]]] = {}
+        # Number of links supporting each edge, by href
+        self._parents: Dict[str, Counter] = {}
+        self._children: Dict[str, Counter] = {}
+        self._items: Dict[str, Counter] = {}
+        # Items by the id in their `collection` field
+        self._collection_items: Dict[str, Dict[str, None]] = {}
+        for obj in objects:
+            if isinstance(obj, tuple):
+                self.add(*obj)
+            else:
+                self.add(obj)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[StacObject]:
+        return iter(self._nodes.values())
+
+    def __contains__(self, node: object) -> bool:
+        if isinstance(node, str):
+            return _normalize(node) in self._nodes
+        return id(node) in self._hrefs
+
+    def href(self, node: Node) -> str:
+        """The href of an object (or href) of the graph, the first it was
+        added at for an object at several hrefs."""
+        return self._node_hrefs(node)[0]
+
+    def _node_hrefs(self, node: Node) -> List[str]:
+        if isinstance(node, str):
+            href = _normalize(node)
+            if href not in self._nodes:
+                raise KeyError(node)
+            return [href]
+        try:
+            return list(self._hrefs[id(node)])
+        except KeyError:
+            raise KeyError(f"{node.type} {node.id!r} is not in the graph") from None
+
+    def by_href(self, href: str) -> Optional[StacObject]:
+        return self._nodes.get(_normalize(href))
+
+    def get(self, stac_id: str) -> Optional[StacObject]:
+        """The object with this id, None if missing.
+
+        Raises a ValueError when several objects have the id (e.g. Items of
+        different Collections), use `find` or `by_href` for those.
+        """
+        hrefs = self._ids.get(stac_id)
+        if not hrefs:
+            return None
+        if len(hrefs) > 1:
+            raise ValueError(f"{len(hrefs)} objects have the id {stac_id!r}")
+        return self._nodes[next(iter(hrefs))]
+
+    def find(self, stac_id: str) -> List[StacObject]:
+        """All the objects with this id."""
+        return [self._nodes[href] for href in self._ids.get(stac_id, ())]
+
+    def _edges(self, href: str, obj: StacObject, step: int) -> None:
+        """Add (`step` 1) or remove (-1) the edges of the links of an object."""
+        is_item = obj.type == "Feature"
+        for rel, target in self._links[href]:
+            # (index, key, value): `value` is one of the `index[key]` hrefs
+            if rel == Relations.child:
+                edges = [(self._children, href, target), (self._parents, target, href)]
+            elif rel == "item":
+                edges = [(self._items, href, target), (self._parents, target, href)]
+            elif rel == Relations.parent:
+                down = self._items if is_item else self._children
+                edges = [(down, target, href), (self._parents, href, target)]
+            elif rel == Relations.collection and is_item:
+                edges = [(self._items, target, href)]
+            else:
+                continue
+            for index, key, value in edges:
+                counter = index.setdefault(key, Counter())
+                counter[value] += step
+                if counter[value] <= 0:
+                    del counter[value]
+                    if not counter:
+                        del index[key]
+
+    def add(self, obj: StacObject, href: Optional[str] = None) -> str:
+        """Add an object, at `href` (by default, its `self` link), and index
+        its links. An object already at the href is replaced.
+
+        Returns the (normalized) href of the object.
+        """
+        href = href or _self_href(obj)
+        if not href:
+            raise ValueError(
+                f"{obj.type} {obj.id!r} has no self link, its href must be given"
+            )
+        href = _normalize(href)
+        if href in self._nodes:
+            self.remove(href)
+
+        self._nodes[href] = obj
+        self._hrefs.setdefault(id(obj), {})[href] = None
+        self._ids.setdefault(obj.id, {})[href] = None
+        self._links[href] = [
+            (link.rel, _normalize(urljoin(href, link.href)))
+            for link in obj.links.link_iterator()
+        ]
+        self._edges(href, obj, 1)
+        collection_id = getattr(obj, "collection", None)
+        if obj.type == "Feature" and collection_id:
+            self._collection_items.setdefault(collection_id, {})[href] = None
+        return href
+
+    def remove(self, node: Node) -> StacObject:
+        """Remove the object at an href, or an object (at all its hrefs), and
+        its links.
+
+        The links of other objects to it are kept, and reported by
+        `dangling_links`.
+        """
+        for href in self._node_hrefs(node):
+            obj = self._remove(href)
+        return obj
+
+    def _remove(self, href: str) -> StacObject:
+        obj = self._nodes.pop(href)
+        _discard(self._hrefs, id(obj), href)
+        self._edges(href, obj, -1)
+        del self._links[href]
+        _discard(self._ids, obj.id, href)
+        collection_id = getattr(obj, "collection", None)
+        if collection_id:
+            _discard(self._collection_items, collection_id, href)
+        return obj
+
+    def _present(self, hrefs: Iterable[str]) -> List[StacObject]:
+        return [self._nodes[href] for href in hrefs if href in self._nodes]
+
+    def parent(self, node: Node) -> Optional[Union[Catalog, Collection]]:
+        """The parent of an object: the target of its `parent` link if in the
+        graph, otherwise an object linking to it as a child or item."""
+        href = self.href(node)
+        for rel, target in self._links[href]:
+            if rel == Relations.parent and target in self._nodes:
+                return self._nodes[target]  # type: ignore[return-value]
+        parents = self._present(self._parents.get(href, ()))
+        return parents[0] if parents else None  # type: ignore[return-value]
+
+    def children(self, node: Node) -> List[Union[Catalog, Collection]]:
+        """The Catalogs and Collections below a Catalog or Collection."""
+        href = self.href(node)
+        return self._present(self._children.get(href, ()))  # type: ignore[return-value]
+
+    def items(self, collection: Union[Node, str]) -> List[Item]:
+        """The Items of a Collection (or Catalog), by id, href or model.
+
+        These are the Items linked from or to it with an `item`, `parent` or
+        `collection` link, and with a Collection id, those whose `collection`
+        field is the id.
+        """
+        if isinstance(collection, str) and collection not in self:
+            hrefs = list(self._ids.get(collection, ()))
+            collection_id: Optional[str] = collection
+        else:
+            hrefs = [self.href(collection)]
+            obj = self._nodes[hrefs[0]]
+            collection_id = obj.id if obj.type == "Collection" else None
+        found: Dict[str, None] = {}
+        for href in hrefs:
+            found.update(dict.fromkeys(self._items.get(href, ())))
+        if collection_id is not None:
+            found.update(self._collection_items.get(collection_id, {}))
+        return self._present(found)  # type: ignore[return-value]
+
+    def dangling_links(
+        self, rels: AbstractCollection[str] = STRUCTURAL_RELS
+    ) -> List[DanglingLink]:
+        """The links (with one of the `rels`) to hrefs missing from the graph."""
+        return [
+            DanglingLink(source, rel, target)
+            for source, links in self._links.items()
+            for rel, target in links
+            if rel in rels and target not in self._nodes
+        ]
+
+
+def _discard(index: Dict[Any, Dict[str, None]], key: Any, href: str) -> None:
+    hrefs = index.get(key)
+    if hrefs is not None:
+        hrefs.pop(href, None)
+        if not hrefs:
+            del index[key]
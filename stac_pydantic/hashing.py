@@ -0,0 +1,208 @@
+"""Stable content hashes of STAC documents and models.
+
+The canonical encoding is JSON like, written straight into the hash object:
+
+- object keys are sorted,
+- datetimes (objects, and strings in RFC 3339 format) are written in UTC as
+  `YYYY-MM-DDTHH:MM:SS[.ffffff]Z`, without trailing zeros in the fraction
+  (naive datetimes are taken as UTC),
+- enums are written as their value, floats with an integral value as
+  integers and tuples as lists.
+
+So the hash does not depend on key order, datetime formatting or enums
+being used instead of strings.
+
+Models are hashed as their dump with all their fields, the unset ones at
+their default value, except the fields which are None: a field explicitly
+set to its default hashes as if it was unset, and a document without
+nulls hashes as its model. `canonical_hash(model)` equals
+`model.canonical_hash()`.
+"""
+
+import hashlib
+import re
+from datetime import date, datetime, timezone
+from enum import Enum
+from json.encoder import encode_basestring  # type: ignore[attr-defined]
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+# Top level fields hashed separately by `subtree_hashes` by default
+SUBTREES = ("geometry", "assets", "properties")
+
+_RFC3339 = re.compile(
+    r"\d{4}-\d\d-\d\d[Tt ]\d\d:\d\d:\d\d(\.\d+)?([Zz]|[+-]\d\d:\d\d)\Z"
+)
+# Number of encoded parts written to the hash at once
+_BUFFER_SIZE = 1 << 12
+
+
+def canonical_datetime(value: datetime) -> str:
+    """A datetime in the canonical format, in UTC (naive datetimes are taken
+    as UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    text = value.strftime("%Y-%m-%dT%H:%M:%S")
+    if value.microsecond:
+        text += f".{value.microsecond:06d}".rstrip("0")
+    return text + "Z"
+
+
+def _string(value: str) -> str:
+    if len(value) >= 20 and value[4] == "-" and _RFC3339.match(value):
+        text = value[:-1] + "+00:00" if value[-1] in "Zz" else value
+        # Fractions of more than 6 digits are only parsed from Python 3.11
+        fraction = re.search(r"\.(\d+)", text)
+        if fraction and len(fraction.group(1)) > 6:
+            text = text.replace(fraction.group(0), fraction.group(0)[:7], 1)
+        try:
+            return canonical_datetime(datetime.fromisoformat(text.replace("t", "T")))
+        except ValueError:
+            pass
+    return value
+
+
+def _dump(model: BaseModel, **kwargs: Any) -> Dict[str, Any]:
+    """The canonical dump of a model, independent of the fields set."""
+    return model.model_dump(exclude_unset=False, exclude_none=True, **kwargs)
+
+
+def _float(value: float) -> str:
+    if value != value or value in (float("inf"), float("-inf")):
+        raise ValueError(f"{value} can not be hashed")
+    return "%d" % value if value.is_integer() else repr(value)
+
+
+def _sorted_keys(value: Dict[Any, Any]) -> List[Any]:
+    try:
+        return sorted(value)
+    except TypeError:
+        return sorted(value, key=str)
+
+
+def _encoder(  # noqa: C901
+    hasher: Any,
+) -> Tuple[Callable[[Any], None], Callable[[], None]]:
+    """Return functions writing the canonical encoding of values to `hasher`
+    in chunks, and flushing the last chunk."""
+    parts: List[str] = []
+    append = parts.append
+
+    def flush() -> None:
+        hasher.update("".join(parts).encode())
+        parts.clear()
+
+    def encode(value: Any) -> None:  # noqa: C901
+        kind = type(value)
+        if kind is str:
+            append(encode_basestring(_string(value)))
+        elif kind is float:
+            append(_float(value))
+        elif kind is list or kind is tuple:
+            append("[")
+            first = True
+            for item in value:
+                if first:
+                    first = False
+                else:
+                    append(",")
+                encode(item)
+            append("]")
+        elif kind is dict:
+            append("{")
+            first = True
+            for key in _sorted_keys(value):
+                if first:
+                    first = False
+                else:
+                    append(",")
+                append(encode_basestring(str(key)))
+                append(":")
+                encode(value[key])
+            append("}")
+            if len(parts) >= _BUFFER_SIZE:
+                flush()
+        elif value is None:
+            append("null")
+        elif value is True:
+            append("true")
+        elif value is False:
+            append("false")
+        elif kind is int:
+            append("%d" % value)
+        elif isinstance(value, Enum):
+            encode(value.value)
+        elif isinstance(value, datetime):
+            append(encode_basestring(canonical_datetime(value)))
+        elif isinstance(value, date):
+            append(encode_basestring(value.isoformat()))
+        elif isinstance(value, BaseModel):
+            encode(_dump(value))
+        # Subclasses of the builtin types
+        elif isinstance(value, str):
+            encode(str(value))
+        elif isinstance(value, float):
+            encode(float(value))
+        elif isinstance(value, int):
+            encode(int(value))
+        elif isinstance(value, dict):
+            encode(dict(value))
+        elif isinstance(value, (list, tuple)):
+            # e.g. named tuples (geometry positions)
+            encode(list(value))
+        else:
+            # URLs, ...
+            append(encode_basestring(str(value)))
+
+    return encode, flush
+
+
+def canonical_hash(data: Any, algorithm: str = "sha256") -> str:
+    """Return the hex digest of the canonical encoding of `data`.
+
+    `data` is a JSON like document (dictionaries, lists, strings, numbers,
+    ...), which may hold datetimes, enums and models. `algorithm` is any
+    `hashlib` algorithm.
+    """
+    hasher = hashlib.new(algorithm)
+    encode, flush = _encoder(hasher)
+    encode(data)
+    flush()
+    return hasher.hexdigest()
+
+
+def subtree_hashes(
+    model: BaseModel,
+    fields: Iterable[str] = SUBTREES,
+    algorithm: str = "sha256",
+    cache: Optional[Dict[Tuple[str, str], str]] = None,
+) -> Dict[str, str]:
+    """Return the canonical hashes of top level fields of `model`, by field name.
+
+    Hashes already in `cache` (by field name and algorithm) are reused, and
+    the others added to it. Fields missing from the dump (unknown, or None)
+    are left out.
+    """
+    if cache is None:
+        cache = {}
+    hashes: Dict[str, str] = {}
+    missing = []
+    for name in fields:
+        digest = cache.get((name, algorithm))
+        if digest is None:
+            missing.append(name)
+        else:
+            hashes[name] = digest
+
+    if missing:
+        model_fields = type(model).model_fields
+        data = _dump(model, include=set(missing))
+        for name in missing:
+            info = model_fields.get(name)
+            key = (info.alias if info else None) or name
+            if key in data:
+                hashes[name] = cache[(name, algorithm)] = canonical_hash(
+                    data[key], algorithm
+                )
+    return hashes
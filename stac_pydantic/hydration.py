@@ -0,0 +1,126 @@
+"""Store Items without the values they share with their Collection.
+
+`dehydrate` removes from an Item (as a dictionary) the values equal to those
+of a base document, typically built from the Collection with `item_base`
+(its `item_assets`, `stac_version`, id, ...), and `hydrate` merges them back.
+Dictionaries are compared key by key, other values (lists included) as a
+whole. Keys of the base missing from the Item are kept as
+`DO_NOT_MERGE_MARKER`, so that hydration does not add them back.
+
+The format is the one used by pgstac, so that dehydrated Items can be
+exchanged with it.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from stac_pydantic.collection import Collection
+    from stac_pydantic.item import Item
+
+DO_NOT_MERGE_MARKER = "𒍟※"
+
+
+def item_base(
+    collection: "Collection", defaults: Optional[Mapping[str, Any]] = None
+) -> Dict[str, Any]:
+    """Return the base document of the Items of `collection`.
+
+    Holds the values shared by all the Items: type, `stac_version`,
+    collection id and, when the collection defines them, the `item_assets`
+    as assets. `defaults` (e.g. `{"properties": {"platform": "sentinel-2a"}}`)
+    are added to it.
+    """
+    base: Dict[str, Any] = {
+        "type": "Feature",
+        "stac_version": collection.stac_version,
+        "collection": collection.id,
+    }
+    item_assets = (collection.model_extra or {}).get("item_assets")
+    if item_assets:
+        base["assets"] = item_assets
+    if defaults:
+        base.update(defaults)
+    return base
+
+
+def dehydrate(data: Mapping[str, Any], base: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return `data` without the values equal to those of `base`."""
+    dehydrated: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key in base:
+            base_value = base[key]
+            if value == base_value:
+                continue
+            if isinstance(value, dict) and isinstance(base_value, dict):
+                dehydrated[key] = dehydrate(value, base_value)
+                continue
+        dehydrated[key] = value
+
+    for key in base:
+        if key not in data:
+            dehydrated[key] = DO_NOT_MERGE_MARKER
+    return dehydrated
+
+
+def hydrate(data: Mapping[str, Any], base: Mapping[str, Any]) -> Dict[str, Any]:
+    """Merge the values of `base` back into dehydrated `data`.
+
+    Values taken from `base` are not copied and are shared between the
+    hydrated documents.
+    """
+    hydrated: Dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, str) and value == DO_NOT_MERGE_MARKER:
+            continue
+        base_value = base.get(key)
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            hydrated[key] = hydrate(value, base_value)
+        else:
+            hydrated[key] = value
+
+    for key, base_value in base.items():
+        if key not in data:
+            hydrated[key] = base_value
+    return hydrated
+
+
+def dehydrate_items(
+    items: Iterable[Union["Item", Mapping[str, Any]]], base: Mapping[str, Any]
+) -> Iterator[Dict[str, Any]]:
+    """Dehydrate a stream of Items, models or dictionaries, one at a time."""
+    for item in items:
+        if isinstance(item, Mapping):
+            yield dehydrate(item, base)
+        else:
+            yield item.dehydrate(base)
+
+
+def hydrate_items(
+    rows: Iterable[Mapping[str, Any]],
+    base: Mapping[str, Any],
+    model: Optional[Type["Item"]] = None,
+    *,
+    trusted: bool = False,
+) -> Iterator["Item"]:
+    """Hydrate and validate a stream of dehydrated Items, one at a time.
+
+    `model` defaults to `stac_pydantic.Item`; with `trusted`, the Items are
+    built with `from_trusted` instead of being validated.
+    """
+    if model is None:
+        from stac_pydantic.item import Item
+
+        model = Item
+
+    for row in rows:
+        yield model.hydrate(row, base, trusted=trusted)
@@ -0,0 +1,190 @@
+"""Share repeated strings and URLs between validated models.
+
+Large sets of Items repeat the same collection ids, STAC versions, extension
+URLs, asset and link media types, roles, relations and property names, each
+stored as a new object. With an `InternPool` in the validation context, these
+values are replaced by a single shared instance::
+
+    pool = InternPool()
+    items = [Item.model_validate(data, context={"intern": pool}) for data in rows]
+
+`context={"intern": True}` uses the module level `DEFAULT_POOL`, which is
+bounded to `DEFAULT_POOL_SIZE` values for long running processes. Interning
+is done by validators compiled from the core schema of the models, so the
+default validation path is unchanged.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationInfo
+from pydantic_core import CoreSchema, SchemaValidator
+
+from stac_pydantic.trusted import (
+    _FUNCTION_SCHEMAS,
+    _SKIPPED_KEYS,
+    _compile,
+    fast_schema,
+)
+
+# Fields whose values are interned, by model name. Subclasses of these models
+# (e.g. the `api` models) intern the same fields.
+INTERNED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "Item": ("stac_version", "stac_extensions", "collection", "assets"),
+    "Collection": ("stac_version", "stac_extensions", "type", "license"),
+    "Catalog": ("stac_version", "stac_extensions", "type"),
+    "Asset": ("type", "roles"),
+    "Link": ("rel", "type"),
+    "Provider": ("roles",),
+}
+
+
+# Values kept by `DEFAULT_POOL`
+DEFAULT_POOL_SIZE = 100_000
+
+
+class InternPool:
+    """Shared instances of equal, hashable values (strings, URLs, ...).
+
+    With a `max_size`, the pool is cleared when it is full, so that a pool
+    used for the life of a process does not keep every value it has seen:
+    values pooled afterwards are shared again from then on. Without one, the
+    pool grows until it is dropped or cleared.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._values: Dict[Any, Any] = {}
+        self.max_size = max_size
+
+    def __call__(self, value: Any) -> Any:
+        """Return the pooled instance equal to `value`, adding it if missing."""
+        values = self._values
+        pooled = values.get(value)
+        if pooled is None:
+            if self.max_size is not None and len(values) >= self.max_size:
+                values.clear()
+            values[value] = pooled = value
+        return pooled
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+DEFAULT_POOL = InternPool(max_size=DEFAULT_POOL_SIZE)
+
+
+def intern_pool(context: Any) -> Optional[InternPool]:
+    """Return the pool given by the `intern` key of a validation context, if any."""
+    if not isinstance(context, dict):
+        return None
+    pool = context.get("intern")
+    if pool is True:
+        return DEFAULT_POOL
+    return pool if isinstance(pool, InternPool) else None
+
+
+def _intern_value(value: Any, info: ValidationInfo) -> Any:
+    pool = intern_pool(info.context)
+    if pool is None or value is None:
+        return value
+    if isinstance(value, list):
+        return [pool(v) for v in value]
+    if isinstance(value, dict):
+        # Only the keys, e.g. asset names
+        return {pool(k): v for k, v in value.items()}
+    return pool(value)
+
+
+def _intern_keys(value: Any, info: ValidationInfo) -> Any:
+    pool = intern_pool(info.context)
+    if pool is None or not isinstance(value, dict):
+        return value
+    return {pool(k) if isinstance(k, str) else k: v for k, v in value.items()}
+
+
+def _interned_fields(cls: Any) -> Tuple[str, ...]:
+    for base in getattr(cls, "__mro__", ()):
+        if base.__module__.startswith("stac_pydantic") and base.__name__ in (
+            INTERNED_FIELDS
+        ):
+            return INTERNED_FIELDS[base.__name__]
+    return ()
+
+
+def _with_info(function: Any) -> Dict[str, Any]:
+    return {"type": "with-info", "function": function}
+
+
+def _interning_value(schema: Any) -> Any:
+    # Defaults are only used by a `default` schema at the top of the field
+    if schema.get("type") == "default":
+        return {**schema, "schema": _interning_value(schema["schema"])}
+    return {
+        "type": "function-after",
+        "function": _with_info(_intern_value),
+        "schema": schema,
+    }
+
+
+def _interning_fields(schema: Any, fields_names: Tuple[str, ...], keys: bool) -> Any:
+    """Intern fields of a `model-fields` schema, under any model validators."""
+    if schema.get("type") in _FUNCTION_SCHEMAS:
+        return {
+            **schema,
+            "schema": _interning_fields(schema["schema"], fields_names, keys),
+        }
+    if schema.get("type") != "model-fields":
+        return schema
+
+    fields = dict(schema["fields"])
+    for name in fields_names:
+        if name in fields:
+            fields[name] = {
+                **fields[name],
+                "schema": _interning_value(fields[name]["schema"]),
+            }
+    schema = {**schema, "fields": fields}
+    if keys:
+        return {
+            "type": "function-before",
+            "function": _with_info(_intern_keys),
+            "schema": schema,
+        }
+    return schema
+
+
+def _interning(schema: Any) -> Any:
+    """Copy a core schema, interning the values of `INTERNED_FIELDS` and the
+    names of extra fields (e.g. Item properties)."""
+    if isinstance(schema, list):
+        return [_interning(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    copy = {
+        key: value if key in _SKIPPED_KEYS else _interning(value)
+        for key, value in schema.items()
+    }
+    if copy.get("type") == "model":
+        extra = copy.get("config", {}).get("extra_fields_behavior") == "allow"
+        copy["schema"] = _interning_fields(
+            copy["schema"], _interned_fields(copy["cls"]), extra
+        )
+    return copy
+
+
+@lru_cache(maxsize=None)
+def interning_validator(model: Type[BaseModel], fast: bool = False) -> SchemaValidator:
+    """Return a validator of `model` interning values in the context pool.
+
+    With `fast`, built from the schema of the `fast` validation level.
+    """
+    model.model_rebuild()
+    schema: CoreSchema = fast_schema(model) if fast else model.__pydantic_core_schema__
+    return _compile(_interning(schema), model.__name__)
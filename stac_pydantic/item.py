@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from geojson_pydantic import Feature
 from pydantic import (
@@ -7,12 +7,27 @@ from pydantic import (
     Field,
     SerializationInfo,
     SerializerFunctionWrapHandler,
+    ValidationInfo,
     model_serializer,
     model_validator,
 )
+from typing_extensions import Self
 
+from stac_pydantic.bbox import (
+    BBoxValidation,
+    bbox_covers_geometry,
+    bbox_validation,
+    geometry_bbox,
+)
+from stac_pydantic.hydration import dehydrate, hydrate
 from stac_pydantic.links import Links
-from stac_pydantic.shared import SEMVER_REGEX, Asset, StacBaseModel, StacCommonMetadata
+from stac_pydantic.precision import reduce_geometry, round_bbox, serialization_precision
+from stac_pydantic.shared import (
+    SEMVER_REGEX,
+    Asset,
+    StacCommonMetadata,
+    _SubtreeHashCache,
+)
 from stac_pydantic.version import STAC_VERSION
 
 
@@ -24,7 +39,7 @@ class ItemProperties(StacCommonMetadata):
     model_config = ConfigDict(extra="allow")
 
 
-class Item(Feature, StacBaseModel):
+class Item(Feature, _SubtreeHashCache):
     """
     https://github.com/radiantearth/stac-spec/blob/v1.0.0/item-spec/item-spec.md
     """
@@ -39,12 +54,59 @@ class Item(Feature, StacBaseModel):
 
     @model_validator(mode="before")
     @classmethod
-    def validate_bbox(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        if isinstance(values, dict):
-            if values.get("geometry") and values.get("bbox") is None:
+    def validate_bbox(
+        cls, values: Dict[str, Any], info: ValidationInfo
+    ) -> Dict[str, Any]:
+        if isinstance(values, dict) and values.get("geometry"):
+            if (
+                values.get("bbox") is None
+                and bbox_validation(info.context) is not BBoxValidation.fill
+            ):
                 raise ValueError("bbox is required if geometry is not null")
         return values
 
+    @model_validator(mode="after")
+    def check_bbox(self, info: ValidationInfo) -> Self:
+        """Check or fill the bbox from the validated geometry, with the `check`
+        and `fill` bbox validations."""
+        if self.geometry is None:
+            return self
+        if bbox_validation(info.context) is BBoxValidation.require:
+            return self
+        if self.bbox is None:
+            self.bbox = geometry_bbox(self.geometry)
+        elif not bbox_covers_geometry(self.bbox, self.geometry):
+            computed = geometry_bbox(self.geometry)
+            raise ValueError(
+                f"bbox {list(self.bbox)} does not cover the geometry {list(computed or ())}"
+            )
+        return self
+
+    def dehydrate(self, base: Mapping[str, Any]) -> Dict[str, Any]:
+        """Dump the item without the values equal to those of `base`.
+
+        See `stac_pydantic.hydration`.
+        """
+        return dehydrate(self.model_dump(mode="json"), base)
+
+    @classmethod
+    def hydrate(
+        cls,
+        data: Mapping[str, Any],
+        base: Mapping[str, Any],
+        *,
+        trusted: bool = False,
+    ) -> Self:
+        """Build the item from a dehydrated item and its `base`.
+
+        With `trusted`, the item is built with `from_trusted` instead of being
+        validated.
+        """
+        hydrated = hydrate(data, base)
+        if trusted:
+            return cls.from_trusted(hydrated)
+        return cls.model_validate(hydrated)
+
     # https://github.com/developmentseed/geojson-pydantic/issues/147
     @model_serializer(when_used="always", mode="wrap")
     def _serialize(
@@ -61,4 +123,14 @@ class Item(Feature, StacBaseModel):
             if info.exclude_none and "geometry" not in (info.exclude or {}):
                 data["geometry"] = None
 
+        # Requires pydantic 2.7+ for the serialization context
+        precision, tolerance = serialization_precision(getattr(info, "context", None))
+        if precision is not None or tolerance:
+            if data.get("geometry") is not None:
+                data["geometry"] = reduce_geometry(
+                    data["geometry"], precision, tolerance
+                )
+            if precision is not None and data.get("bbox") is not None:
+                data["bbox"] = round_bbox(data["bbox"], precision)
+
         return data
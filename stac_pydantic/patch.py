@@ -0,0 +1,176 @@
+"""Apply JSON Merge Patches (RFC 7396) and JSON Patches (RFC 6902) to models.
+
+Patches are applied to a shallow copy of the model, as a dictionary of its
+set fields (like `model_dump(exclude_unset=True)`). Nested models are only
+copied, to dictionaries and lists, along the paths touched by the patch and
+the untouched ones are kept as model instances. Validating the result with
+`model_validate` then only validates the touched subtrees, and the model
+validators of the models along them, while the new model shares the
+untouched nested models with the original one.
+"""
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+from pydantic import BaseModel, RootModel
+from pydantic_core import to_jsonable_python
+
+Patch = Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]
+
+
+def shallow(value: Any) -> Any:
+    """Copy a model, dictionary or list one level deep, as a dictionary or list.
+
+    Models become a dictionary of their set fields (by alias) and extra
+    fields, root models a copy of their root.
+    """
+    if isinstance(value, RootModel):
+        return shallow(value.root)
+    if isinstance(value, BaseModel):
+        fields = type(value).model_fields
+        extra = value.__pydantic_extra__ or {}
+        data: Dict[str, Any] = {}
+        for name in value.model_fields_set:
+            if name in fields:
+                data[fields[name].alias or name] = value.__dict__[name]
+            elif name in extra:
+                data[name] = extra[name]
+        return data
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return value
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """Apply a JSON Merge Patch to `target`, copying only the patched objects."""
+    if not isinstance(patch, Mapping):
+        return patch
+
+    target = shallow(target)
+    if not isinstance(target, dict):
+        target = {}
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        else:
+            target[key] = merge_patch(target.get(key), value)
+    return target
+
+
+def _tokens(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer {pointer!r}")
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    ]
+
+
+def _index(container: List[Any], token: str, pointer: str, add: bool = False) -> int:
+    if add and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise ValueError(f"Invalid array index {token!r} in {pointer!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not add):
+        raise ValueError(f"Array index {index} out of range in {pointer!r}")
+    return index
+
+
+def _get(container: Any, token: str, pointer: str) -> Any:
+    if isinstance(container, list):
+        return container[_index(container, token, pointer)]
+    if isinstance(container, dict) and token in container:
+        return container[token]
+    raise ValueError(f"Path {pointer!r} does not exist")
+
+
+def _resolve(document: Any, pointer: str) -> Any:
+    """Value at `pointer`, without copying anything."""
+    value = document
+    for token in _tokens(pointer):
+        value = _get(shallow(value), token, pointer)
+    return value
+
+
+def _parent(document: Dict[str, Any], pointer: str) -> Tuple[Any, str]:
+    """Copy the containers along `pointer`, returning its parent and last token."""
+    tokens = _tokens(pointer)
+    if not tokens:
+        raise ValueError("Operations on the whole document are not supported")
+
+    node: Any = document
+    for token in tokens[:-1]:
+        child = shallow(_get(node, token, pointer))
+        if not isinstance(child, (dict, list)):
+            raise ValueError(f"Path {pointer!r} does not exist")
+        if isinstance(node, list):
+            node[_index(node, token, pointer)] = child
+        else:
+            node[token] = child
+        node = child
+    return node, tokens[-1]
+
+
+def _add(document: Dict[str, Any], pointer: str, value: Any) -> None:
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, list):
+        parent.insert(_index(parent, token, pointer, add=True), value)
+    else:
+        parent[token] = value
+
+
+def _remove(document: Dict[str, Any], pointer: str) -> Any:
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, token, pointer))
+    if token not in parent:
+        raise ValueError(f"Path {pointer!r} does not exist")
+    return parent.pop(token)
+
+
+def json_patch(
+    document: Dict[str, Any], operations: Sequence[Mapping[str, Any]]
+) -> Dict[str, Any]:
+    """Apply the operations of a JSON Patch to a shallow copy of `document`.
+
+    Raises `ValueError` for an invalid operation or path, or a failed `test`.
+    """
+    document = dict(document)
+    for operation in operations:
+        op = operation.get("op")
+        path = operation.get("path")
+        if not isinstance(path, str):
+            raise ValueError(f"Missing path in JSON Patch operation {operation!r}")
+
+        if op == "add":
+            _add(document, path, operation["value"])
+        elif op == "remove":
+            _remove(document, path)
+        elif op == "replace":
+            _remove(document, path)
+            _add(document, path, operation["value"])
+        elif op == "move":
+            _add(document, path, _remove(document, operation["from"]))
+        elif op == "copy":
+            _add(document, path, _resolve(document, operation["from"]))
+        elif op == "test":
+            actual = to_jsonable_python(_resolve(document, path), by_alias=True)
+            if actual != to_jsonable_python(operation["value"]):
+                raise ValueError(f"Test of {path!r} failed")
+        else:
+            raise ValueError(f"Invalid JSON Patch operation {op!r}")
+    return document
+
+
+def patched(model: BaseModel, patch: Patch) -> Dict[str, Any]:
+    """Return the shallow dictionary of `model` with `patch` applied.
+
+    A mapping is applied as a JSON Merge Patch, a sequence of operations as a
+    JSON Patch.
+    """
+    if isinstance(patch, Mapping):
+        return merge_patch(model, patch)
+    return json_patch(shallow(model), patch)
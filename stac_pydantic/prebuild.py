@@ -0,0 +1,294 @@
+"""Build and exercise model schemas ahead of time, off the request path."""
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, Literal, Optional, Sequence, Type, Union, overload
+
+from pydantic import BaseModel
+
+_LINKS = [
+    {"rel": "self", "href": "https://stac.example.com/search"},
+    {"rel": "root", "href": "https://stac.example.com/"},
+    {"rel": "parent", "href": "https://stac.example.com/"},
+    {"rel": "collection", "href": "https://stac.example.com/collections/sample"},
+    {"rel": "service-desc", "href": "https://stac.example.com/api"},
+    {"rel": "data", "href": "https://stac.example.com/collections"},
+    {"rel": "search", "href": "https://stac.example.com/search"},
+]
+
+_ITEM = {
+    "type": "Feature",
+    "id": "sample",
+    "stac_version": "1.0.0",
+    "stac_extensions": ["https://stac-extensions.github.io/eo/v1.0.0/schema.json"],
+    "collection": "sample",
+    "geometry": {
+        "type": "Polygon",
+        "coordinates": [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]],
+    },
+    "bbox": [0.0, 0.0, 1.0, 1.0],
+    "properties": {
+        "datetime": "2020-01-01T00:00:00Z",
+        "created": "2020-01-01T00:00:00.000+01:00",
+        "eo:cloud_cover": 10,
+    },
+    "assets": {
+        "data": {
+            "href": "https://stac.example.com/data.tif",
+            "type": "image/tiff; application=geotiff",
+            "roles": ["data"],
+        }
+    },
+    "links": _LINKS,
+}
+
+_COLLECTION = {
+    "type": "Collection",
+    "id": "sample",
+    "stac_version": "1.0.0",
+    "description": "Sample collection",
+    "license": "proprietary",
+    "extent": {
+        "spatial": {"bbox": [[-180.0, -90.0, 180.0, 90.0]]},
+        "temporal": {"interval": [["2020-01-01T00:00:00Z", None]]},
+    },
+    "links": _LINKS,
+}
+
+_CATALOG = {
+    "type": "Catalog",
+    "id": "sample",
+    "stac_version": "1.0.0",
+    "description": "Sample catalog",
+    "links": _LINKS,
+}
+
+# Sample documents, by model name, used to exercise validators and serializers.
+# Subclasses of these models (e.g. the `api` models) use the same documents.
+SAMPLES: Dict[str, Dict[str, Any]] = {
+    "Item": _ITEM,
+    "Collection": _COLLECTION,
+    "Catalog": _CATALOG,
+    "LandingPage": {
+        **_CATALOG,
+        "conformsTo": ["https://api.stacspec.org/v1.0.0/core"],
+    },
+    "ItemCollection": {
+        "type": "FeatureCollection",
+        "features": [_ITEM],
+        "links": _LINKS,
+    },
+    "Collections": {"collections": [_COLLECTION], "links": _LINKS},
+    "Conformance": {"conformsTo": ["https://api.stacspec.org/v1.0.0/core"]},
+    "Search": {
+        "collections": ["sample"],
+        "ids": ["sample"],
+        "bbox": [0.0, 0.0, 1.0, 1.0],
+        "datetime": "2020-01-01T00:00:00Z/..",
+        "limit": 10,
+    },
+    "ExtendedSearch": {
+        "collections": ["sample"],
+        "intersects": _ITEM["geometry"],
+        "datetime": "2020-01-01T00:00:00Z",
+        "fields": {"includes": ["id"], "excludes": ["assets"]},
+        "query": {"eo:cloud_cover": {"lt": 50}},
+        "sortby": [{"field": "properties.datetime", "direction": "desc"}],
+    },
+}
+
+
+# Validators compiled on first use, which `warmup` can build ahead of time
+VALIDATORS = ("fast", "trusted", "interning", "patch")
+
+
+def default_models() -> Sequence[Type[BaseModel]]:
+    """Models warmed up by `warmup` when none are given."""
+    from stac_pydantic import Catalog, Collection, Item, ItemCollection, api
+    from stac_pydantic.api.search import ExtendedSearch, Search
+
+    return (
+        Item,
+        Collection,
+        Catalog,
+        ItemCollection,
+        api.Item,
+        api.Collection,
+        api.Collections,
+        api.ItemCollection,
+        api.LandingPage,
+        api.Conformance,
+        Search,
+        ExtendedSearch,
+    )
+
+
+@dataclass
+class WarmupReport:
+    """Time taken by each warm-up step, in seconds."""
+
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+
+def _model_name(model: Type[BaseModel]) -> str:
+    module = model.__module__
+    if module.startswith("stac_pydantic."):
+        module = module[len("stac_pydantic.") :]
+    return f"{module}.{model.__qualname__}"
+
+
+def _sample(model: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+    for cls in model.__mro__:
+        if cls.__name__ in SAMPLES:
+            return SAMPLES[cls.__name__]
+    return None
+
+
+def _timed(report: WarmupReport, step: str, func: Any, *args: Any) -> Any:
+    start = time.perf_counter()
+    result = func(*args)
+    report.timings[step] = time.perf_counter() - start
+    return result
+
+
+def _compiled_validators(validators: Sequence[str]) -> Dict[str, Any]:
+    """The functions building the `validators`, by name."""
+    unknown = set(validators) - set(VALIDATORS)
+    if unknown:
+        raise ValueError(
+            f"Unknown validators {sorted(unknown)}, must be among {VALIDATORS}"
+        )
+    from stac_pydantic.interning import interning_validator
+    from stac_pydantic.trusted import fast_validator, patch_validator, trusted_validator
+
+    builders = {
+        "fast": fast_validator,
+        "trusted": trusted_validator,
+        "interning": interning_validator,
+        "patch": patch_validator,
+    }
+    return {name: builders[name] for name in validators}
+
+
+def _warmup(
+    models: Sequence[Type[BaseModel]],
+    extension_schemas: Sequence[str],
+    schema_dir: Optional[str],
+    validators: Sequence[str],
+) -> WarmupReport:
+    report = WarmupReport()
+    builders = _compiled_validators(validators)
+    for model in models:
+        name = _model_name(model)
+        # Deferred models (see `STAC_PYDANTIC_DEFER_BUILD`) are built here
+        _timed(report, f"{name}:build", model.model_rebuild)
+
+        sample = _sample(model)
+        for validator_name, builder in builders.items():
+            validator = _timed(report, f"{name}:{validator_name}", builder, model)
+            if sample is not None and validator_name in ("fast", "trusted"):
+                validator.validate_python(sample)
+
+        if sample is None:
+            continue
+        obj = _timed(report, f"{name}:validate", model.model_validate, sample)
+        _timed(
+            report,
+            f"{name}:validate_json",
+            model.model_validate_json,
+            obj.model_dump_json(),
+        )
+        _timed(report, f"{name}:dump", obj.model_dump)
+        _timed(report, f"{name}:dump_json", obj.model_dump_json)
+
+    if extension_schemas:
+        from stac_pydantic.extensions import (
+            _fetch_and_cache_schema,
+            _load_and_cache_schema,
+        )
+
+        for url in extension_schemas:
+            if schema_dir is None:
+                _timed(report, f"schema:{url}", _fetch_and_cache_schema, url)
+            else:
+                _timed(report, f"schema:{url}", _load_and_cache_schema, url, schema_dir)
+
+    return report
+
+
+@overload
+def warmup(
+    models: Optional[Sequence[Type[BaseModel]]] = ...,
+    *,
+    background: Literal[False] = ...,
+    extension_schemas: Sequence[str] = ...,
+    schema_dir: Optional[str] = ...,
+    validators: Sequence[str] = ...,
+) -> WarmupReport: ...
+
+
+@overload
+def warmup(
+    models: Optional[Sequence[Type[BaseModel]]] = ...,
+    *,
+    background: Literal[True],
+    extension_schemas: Sequence[str] = ...,
+    schema_dir: Optional[str] = ...,
+    validators: Sequence[str] = ...,
+) -> "Future[WarmupReport]": ...
+
+
+def warmup(
+    models: Optional[Sequence[Type[BaseModel]]] = None,
+    *,
+    background: bool = False,
+    extension_schemas: Sequence[str] = (),
+    schema_dir: Optional[str] = None,
+    validators: Sequence[str] = (),
+) -> Union[WarmupReport, "Future[WarmupReport]"]:
+    """Build and exercise the validators and serializers of `models` up front.
+
+    Each model is built (if its schema was deferred), then a sample document
+    is validated from Python and JSON and dumped to Python and JSON, so that
+    the first real request does not pay for any lazy initialization. Defaults
+    to the core and API Item, Collection, Catalog, ItemCollection, Search and
+    ExtendedSearch models and the other `stac_pydantic.api` models.
+
+    `extension_schemas` URLs are pre-loaded into the extension schema cache
+    used by `stac_pydantic.extensions.validate_extensions`, from `schema_dir`
+    if given.
+
+    `validators` are the names of the validators compiled on first use to
+    build as well for each model, among `VALIDATORS`: `fast` (the `fast`
+    validation level), `trusted` (`from_trusted`), `interning` (the `intern`
+    context key) and `patch` (`apply_patch`). The `fast` and `trusted`
+    validators are also exercised with the sample document.
+
+    Returns a `WarmupReport` with the time taken by each step, or with
+    `background=True`, a `Future` resolved with that report once the warm-up,
+    run in a daemon thread, is done.
+    """
+    selected = default_models() if models is None else models
+    if not background:
+        return _warmup(selected, extension_schemas, schema_dir, validators)
+
+    future: "Future[WarmupReport]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(
+                _warmup(selected, extension_schemas, schema_dir, validators)
+            )
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="stac-pydantic-warmup", daemon=True).start()
+    return future
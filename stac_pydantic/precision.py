@@ -0,0 +1,282 @@
+"""Precision of serialized geometries.
+
+Item dumps reduce the precision of their geometry and bbox with the
+`precision` and `simplify` keys of the serialization context (pydantic 2.7+)::
+
+    collection.model_dump_json(context={"precision": 6, "simplify": 1e-5})
+
+- `precision`: coordinates are rounded to this number of decimals (quantized
+  to a grid of `10 ** -precision`), bboxes outwards so that they still cover
+  their geometry.
+- `simplify`: lines and rings are simplified with the Douglas-Peucker
+  algorithm, dropping the positions closer than this tolerance (in
+  coordinate units) to the simplified line. Topology is not preserved, and
+  rings which would have less than 4 positions are kept as they are.
+
+Geometries with many positions are rounded with NumPy, if installed, in a
+single array per geometry.
+"""
+
+from itertools import chain
+from math import isfinite
+from types import ModuleType
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from stac_pydantic.bbox import NUMPY_MIN_POSITIONS, Position, _numpy
+
+# Depth of the lists of positions in the coordinates of each geometry type
+_LINE_DEPTH = {
+    "MultiPoint": 0,
+    "LineString": 0,
+    "MultiLineString": 1,
+    "Polygon": 1,
+    "MultiPolygon": 2,
+}
+_POLYGONS = ("Polygon", "MultiPolygon")
+
+
+def serialization_precision(context: Any) -> Tuple[Optional[int], Optional[float]]:
+    """Return the `precision` and `simplify` tolerance of a serialization
+    context, None when missing."""
+    if not isinstance(context, dict):
+        return None, None
+    precision, tolerance = context.get("precision"), context.get("simplify")
+    if precision is not None and (
+        isinstance(precision, bool) or not isinstance(precision, int)
+    ):
+        raise ValueError(
+            f"Invalid precision {precision!r}, expected a number of decimals"
+        )
+    if tolerance is not None and (
+        isinstance(tolerance, bool)
+        or not isinstance(tolerance, (int, float))
+        or tolerance < 0
+    ):
+        raise ValueError(
+            f"Invalid simplify tolerance {tolerance!r}, expected a positive number"
+        )
+    return precision, tolerance or None
+
+
+def _lines(coordinates: Any, depth: int) -> Iterator[Sequence[Position]]:
+    if depth == 0:
+        yield coordinates
+    else:
+        for part in coordinates:
+            yield from _lines(part, depth - 1)
+
+
+def _rebuild(coordinates: Any, depth: int, lines: Iterator[Any]) -> Any:
+    """The coordinates with their lists of positions replaced by `lines`."""
+    if depth == 0:
+        return next(lines)
+    return [_rebuild(part, depth - 1, lines) for part in coordinates]
+
+
+def _simplify_python(line: Sequence[Position], squared: float) -> List[bool]:
+    """Positions of `line` kept by the Douglas-Peucker algorithm."""
+    xs = [p[0] for p in line]
+    ys = [p[1] for p in line]
+    keep = [False] * len(line)
+    keep[0] = keep[-1] = True
+    ranges = [(0, len(line) - 1)]
+    while ranges:
+        start, end = ranges.pop()
+        ax, ay = xs[start], ys[start]
+        dx, dy = xs[end] - ax, ys[end] - ay
+        length = dx * dx + dy * dy
+        farthest, index = squared, 0
+        for i in range(start + 1, end):
+            px, py = xs[i] - ax, ys[i] - ay
+            if length:
+                # Distance to the nearest point of the segment
+                t = (px * dx + py * dy) / length
+                if t >= 1.0:
+                    px, py = px - dx, py - dy
+                elif t > 0.0:
+                    px, py = px - t * dx, py - t * dy
+            distance = px * px + py * py
+            if distance > farthest:
+                farthest, index = distance, i
+        if index:
+            keep[index] = True
+            ranges.append((start, index))
+            ranges.append((index, end))
+    return keep
+
+
+def _simplify_numpy(
+    numpy: ModuleType, line: Sequence[Position], squared: float
+) -> List[bool]:
+    """`_simplify_python`, splitting all the ranges at once: each pass
+    computes the distance of every position to the segment of its range,
+    and keeps the farthest position of the ranges where it is beyond the
+    tolerance."""
+    columns = list(zip(*line))
+    xs = numpy.array(columns[0], dtype=float)
+    ys = numpy.array(columns[1], dtype=float)
+    positions = numpy.arange(len(line))
+    keep = numpy.zeros(len(line), dtype=bool)
+    keep[0] = keep[-1] = True
+    while True:
+        kept = numpy.flatnonzero(keep)
+        # Range of each position, between the kept positions around it
+        ranges = numpy.minimum(
+            numpy.searchsorted(kept, positions, side="right") - 1, len(kept) - 2
+        )
+        starts, ends = kept[ranges], kept[ranges + 1]
+        ax, ay = xs[starts], ys[starts]
+        dx, dy = xs[ends] - ax, ys[ends] - ay
+        px, py = xs - ax, ys - ay
+        length = dx * dx + dy * dy
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            t = numpy.where(length > 0, (px * dx + py * dy) / length, 0.0)
+        t = numpy.clip(t, 0.0, 1.0)
+        distances = (px - t * dx) ** 2 + (py - t * dy) ** 2
+        distances[keep] = 0.0
+        farthest = numpy.maximum.reduceat(distances, kept[:-1])
+        candidates = numpy.flatnonzero(
+            (distances > squared) & (distances == farthest[ranges])
+        )
+        if not candidates.size:
+            return keep.tolist()
+        # The first farthest position of each range
+        _, first = numpy.unique(ranges[candidates], return_index=True)
+        keep[candidates[first]] = True
+
+
+def simplify_line(
+    line: Sequence[Position], tolerance: float, minimum: int = 2
+) -> Sequence[Position]:
+    """Simplify a line (or closed ring) with the Douglas-Peucker algorithm.
+
+    Returns `line` itself when the simplified line would have less than
+    `minimum` positions.
+    """
+    if len(line) < 3:
+        return line
+    squared = tolerance * tolerance
+    numpy = _numpy() if len(line) >= NUMPY_MIN_POSITIONS else None
+    if numpy is not None:
+        keep = _simplify_numpy(numpy, line, squared)
+    else:
+        keep = _simplify_python(line, squared)
+    simplified = [position for position, kept in zip(line, keep) if kept]
+    return simplified if len(simplified) >= minimum else line
+
+
+def _round_python(
+    lines: List[Sequence[Position]], precision: int
+) -> List[List[List[float]]]:
+    # As NumPy does, faster than `round(c, precision)`
+    scale = 10.0**precision
+    try:
+        return [
+            [[round(c * scale) / scale for c in position] for position in line]
+            for line in lines
+        ]
+    except (OverflowError, ValueError):
+        # Infinite or NaN coordinates
+        return [
+            [[round(c, precision) for c in position] for position in line]
+            for line in lines
+        ]
+
+
+def _round_numpy(
+    numpy: ModuleType, lines: List[Sequence[Position]], precision: int
+) -> Optional[List[List[List[float]]]]:
+    """The rounded lines, None if positions have different dimensions."""
+    sizes = [len(line) for line in lines]
+    dimensions = len(lines[0][0])
+    values = numpy.fromiter(
+        chain.from_iterable(chain.from_iterable(lines)), dtype=float
+    )
+    if values.size != sum(sizes) * dimensions:
+        return None
+    rounded = values.reshape(-1, dimensions).round(precision).tolist()
+    result, offset = [], 0
+    for size in sizes:
+        result.append(rounded[offset : offset + size])
+        offset += size
+    return result
+
+
+def round_lines(
+    lines: List[Sequence[Position]], precision: int
+) -> List[List[List[float]]]:
+    """Round the coordinates of lists of positions to `precision` decimals."""
+    if sum(map(len, lines)) >= NUMPY_MIN_POSITIONS and all(lines):
+        numpy = _numpy()
+        if numpy is not None:
+            rounded = _round_numpy(numpy, lines, precision)
+            if rounded is not None:
+                return rounded
+    return _round_python(lines, precision)
+
+
+def reduce_coordinates(
+    geometry_type: str,
+    coordinates: Any,
+    precision: Optional[int] = None,
+    tolerance: Optional[float] = None,
+) -> Any:
+    """Simplify (with a `tolerance`) and round (to `precision` decimals) the
+    coordinates of a geometry of type `geometry_type`."""
+    if geometry_type == "Point":
+        if precision is None:
+            return coordinates
+        return _round_python([[coordinates]], precision)[0][0]
+    if geometry_type not in _LINE_DEPTH:
+        raise ValueError(f"Unknown geometry type {geometry_type!r}")
+    depth = _LINE_DEPTH[geometry_type]
+    lines = list(_lines(coordinates, depth))
+    if tolerance and geometry_type != "MultiPoint":
+        minimum = 4 if geometry_type in _POLYGONS else 2
+        lines = [simplify_line(line, tolerance, minimum) for line in lines]
+    if precision is not None and any(lines):
+        return _rebuild(coordinates, depth, iter(round_lines(lines, precision)))
+    return _rebuild(coordinates, depth, iter(lines))
+
+
+def round_bbox(bbox: Sequence[float], precision: int) -> List[float]:
+    """Round a bbox outwards to `precision` decimals: the minimums down and
+    the maximums up."""
+    scale = 10.0**precision
+    half = len(bbox) // 2
+    rounded = []
+    for i, value in enumerate(bbox):
+        if not isfinite(value):
+            rounded.append(value)
+            continue
+        # Multiple of the grid step nearest to the value, then the next one
+        # outwards if it is inside the bbox
+        step = round(value * scale)
+        if i < half and step / scale > value:
+            step -= 1
+        elif i >= half and step / scale < value:
+            step += 1
+        rounded.append(step / scale)
+    return rounded
+
+
+def reduce_geometry(
+    geometry: Any, precision: Optional[int] = None, tolerance: Optional[float] = None
+) -> Any:
+    """Return a GeoJSON geometry dictionary with its coordinates (and bbox)
+    reduced by `reduce_coordinates`. Other values are returned as they are."""
+    if not isinstance(geometry, dict):
+        return geometry
+    reduced = dict(geometry)
+    if geometry.get("type") == "GeometryCollection":
+        reduced["geometries"] = [
+            reduce_geometry(g, precision, tolerance)
+            for g in geometry.get("geometries") or ()
+        ]
+    elif geometry.get("coordinates") is not None:
+        reduced["coordinates"] = reduce_coordinates(
+            geometry["type"], geometry["coordinates"], precision, tolerance
+        )
+    if precision is not None and reduced.get("bbox") is not None:
+        reduced["bbox"] = round_bbox(reduced["bbox"], precision)
+    return reduced
@@ -0,0 +1,274 @@
+"""Opt-in profiling of the validators and serializers defined by stac-pydantic.
+
+`profile_validators` attributes validation cost to the model validators and
+serializers of this package (`Item.validate_bbox`, `required_links`, ...)
+while `time_fields` times the validation of each field of a model.
+"""
+
+import functools
+import threading
+import time
+import typing
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from stac_pydantic.interning import interning_validator
+from stac_pydantic.trusted import fast_validator, patch_validator, trusted_validator
+
+# Validators and serializers wrapped by `profile_validators` by default.
+PROFILED_DECORATORS = (
+    "validate_bbox",
+    "check_bbox",
+    "validate_datetime_or_start_end",
+    "validate_start_end",
+    "required_links",
+    "_serialize",
+    "include_datetime_null",
+)
+
+_lock = threading.Lock()
+_active = False
+
+
+@dataclass
+class ValidatorStats:
+    """Cumulative time and number of calls of a validator or serializer."""
+
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class ValidatorProfile:
+    """Statistics collected by `profile_validators`, keyed by function name."""
+
+    stats: Dict[str, ValidatorStats] = field(default_factory=dict)
+
+    def record(self, name: str, seconds: float) -> None:
+        with _lock:
+            stats = self.stats.setdefault(name, ValidatorStats())
+            stats.calls += 1
+            stats.seconds += seconds
+
+    def report(self) -> str:
+        """Return a table of the statistics, slowest validator first."""
+        lines = [
+            f"{'validator':<60} {'calls':>10} {'total (ms)':>12} {'per call (us)':>14}"
+        ]
+        for name, stats in sorted(
+            self.stats.items(), key=lambda kv: kv[1].seconds, reverse=True
+        ):
+            per_call = stats.seconds / stats.calls * 1e6 if stats.calls else 0.0
+            lines.append(
+                f"{name:<60} {stats.calls:>10} {stats.seconds * 1e3:>12.3f} {per_call:>14.2f}"
+            )
+        return "\n".join(lines)
+
+
+def _is_stac_model(cls: Type[BaseModel]) -> bool:
+    return any(
+        getattr(base, "__module__", "").startswith("stac_pydantic")
+        for base in cls.__mro__
+    )
+
+
+def _stac_models() -> List[Type[BaseModel]]:
+    """All loaded models defined by, or inheriting from, stac-pydantic models."""
+    models: List[Type[BaseModel]] = []
+    seen: Set[Type[BaseModel]] = set()
+    stack = list(BaseModel.__subclasses__())
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        stack.extend(cls.__subclasses__())
+        # Deferred models are built by the rebuild, others must be complete
+        if _is_stac_model(cls) and (
+            cls.__pydantic_complete__ or cls.model_config.get("defer_build")
+        ):
+            models.append(cls)
+    return models
+
+
+def _referenced_models(annotation: Any, models: Set[type]) -> Iterator[type]:
+    """Models of `models` used in a (possibly nested) type annotation."""
+    if isinstance(annotation, type) and annotation in models:
+        yield annotation
+    for arg in typing.get_args(annotation):
+        yield from _referenced_models(arg, models)
+
+
+def _rebuild_order(models: List[Type[BaseModel]]) -> List[Type[BaseModel]]:
+    """Sort models so that every model comes after the models its fields use.
+
+    Nested model schemas are copied into their parents, so parents must be
+    rebuilt after their children to pick up the new validator functions.
+    """
+    candidates = set(models)
+    ordered: List[Type[BaseModel]] = []
+    visited: Set[type] = set()
+
+    def visit(cls: Type[BaseModel]) -> None:
+        if cls in visited:
+            return
+        visited.add(cls)
+        for base in cls.__mro__[1:]:
+            if base in candidates:
+                visit(base)
+        for info in cls.model_fields.values():
+            for dependency in _referenced_models(info.annotation, candidates):
+                visit(dependency)
+        ordered.append(cls)
+
+    for cls in sorted(models, key=lambda m: (m.__module__, m.__qualname__)):
+        visit(cls)
+    return ordered
+
+
+def _is_stac_function(func: Callable) -> bool:
+    func = getattr(func, "__func__", func)
+    return getattr(func, "__module__", "").startswith("stac_pydantic")
+
+
+def _qualified_name(func: Callable) -> str:
+    func = getattr(func, "__func__", func)
+    module = func.__module__
+    if module.startswith("stac_pydantic."):
+        module = module[len("stac_pydantic.") :]
+    return f"{module}.{func.__qualname__}"
+
+
+def _timed(func: Callable, name: str, profile: ValidatorProfile) -> Callable:
+    # `functools.wraps` keeps the signature pydantic inspects to call the function
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.record(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _rebuild(models: Sequence[Type[BaseModel]]) -> None:
+    for cls in models:
+        cls.model_rebuild(force=True)
+    # Validators compiled from the schemas of the models call the functions
+    # they were compiled with
+    for cached in (fast_validator, trusted_validator, patch_validator):
+        cached.cache_clear()
+    interning_validator.cache_clear()
+
+
+@contextmanager
+def profile_validators(
+    names: Sequence[str] = PROFILED_DECORATORS,
+) -> Iterator[ValidatorProfile]:
+    """Record the time spent in stac-pydantic model validators and serializers.
+
+    Inside the context, every model validator or serializer called `names` of
+    the stac-pydantic models (and their subclasses) is timed and the
+    cumulative time and number of calls are collected, keyed by function name
+    (e.g. `item.Item.validate_bbox`)::
+
+        with profile_validators() as profile:
+            Item.model_validate(data).model_dump()
+        print(profile.report())
+
+    Schemas of the affected models are rebuilt, and the validators compiled
+    from them (`fast` level, trusted, interning and patch validators) cleared,
+    when entering and leaving the context, so it is expensive to enter and meant for diagnostics only. Models
+    defined outside of stac-pydantic that embed its models are not rebuilt and
+    keep calling the original functions.
+    """
+    global _active
+    with _lock:
+        if _active:
+            raise RuntimeError("profile_validators is already active")
+        _active = True
+
+    profile = ValidatorProfile()
+    originals: List[Tuple[Any, Callable]] = []
+    try:
+        models = _rebuild_order(_stac_models())
+        for cls in models:
+            decorators = cls.__pydantic_decorators__
+            for group in (decorators.model_validators, decorators.model_serializers):
+                for name, decorator in group.items():
+                    if name not in names or not _is_stac_function(decorator.func):
+                        continue
+                    originals.append((decorator, decorator.func))
+                    decorator.func = _timed(
+                        decorator.func, _qualified_name(decorator.func), profile
+                    )
+
+        _rebuild(models)
+        yield profile
+    finally:
+        for decorator, func in originals:
+            decorator.func = func
+        _rebuild(models)
+        with _lock:
+            _active = False
+
+
+@dataclass
+class ValidationTimings:
+    """Mean time to validate a whole model, and each of its fields, in seconds."""
+
+    total: float
+    fields: Dict[str, float]
+
+
+def time_fields(
+    model: Type[BaseModel],
+    data: Mapping[str, Any],
+    number: int = 100,
+) -> ValidationTimings:
+    """Time the validation of `data` by `model`, and of each of its fields.
+
+    Each field present in `data` (by alias or name) is validated on its own
+    with a `TypeAdapter` of its annotation, constraints included, `number`
+    times. Model validators run only as part of `total`, and keys that are not
+    fields (extra fields) are not timed separately.
+    """
+    total_start = time.perf_counter()
+    for _ in range(number):
+        model.model_validate(data)
+    total = (time.perf_counter() - total_start) / number
+
+    fields: Dict[str, float] = {}
+    for name, info in model.model_fields.items():
+        key: Optional[str] = None
+        for candidate in (info.alias, name):
+            if candidate is not None and candidate in data:
+                key = candidate
+                break
+        if key is None:
+            continue
+
+        adapter: TypeAdapter = TypeAdapter(info.rebuild_annotation())
+        value = data[key]
+        start = time.perf_counter()
+        for _ in range(number):
+            adapter.validate_python(value)
+        fields[name] = (time.perf_counter() - start) / number
+
+    return ValidationTimings(total=total, fields=fields)
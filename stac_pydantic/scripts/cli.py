@@ -1,9 +1,20 @@
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
 import click
 import requests
 from pydantic import ValidationError
 
 from stac_pydantic.extensions import validate_extensions
 from stac_pydantic.item import Item
+from stac_pydantic.utils import bounded_map
+from stac_pydantic.walk import catalog_walk, detect_model
 
 try:
     import requests
@@ -15,6 +26,98 @@ try:
 except ImportError:  # pragma: nocover
     jsonschema = None  # type: ignore
 
+# Files holding one JSON document per line
+NDJSON_SUFFIXES = (".ndjson", ".jsonl", ".geojsonl", ".geojsons")
+# Files picked up when a directory is given
+JSON_SUFFIXES = (".json", ".geojson")
+
+# A document to validate: its source (path, URL or `<stdin>:line`) and, for
+# NDJSON sources, its content
+Document = Tuple[str, Optional[str]]
+
+
+def _load_json(infile: str) -> Any:
+    """Load a JSON document from a local path or an http(s) URL."""
+    if infile.startswith(("http://", "https://")):
+        assert requests is not None, "requests must be installed to fetch remote files"
+        r = requests.get(infile)
+        r.raise_for_status()
+        return r.json()
+
+    with open(infile, "rb") as f:
+        return json.loads(f.read())
+
+
+def _ndjson_documents(name: str, lines: Iterable[str]) -> Iterator[Document]:
+    for lineno, line in enumerate(lines, 1):
+        if line.strip():
+            yield f"{name}:{lineno}", line
+
+
+def _directory_documents(directory: str) -> Iterator[Document]:
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(JSON_SUFFIXES):
+                yield os.path.join(root, name), None
+
+
+def _iter_documents(sources: Iterable[str]) -> Iterator[Document]:
+    """Expand files, directories, glob patterns, URLs and `-` (stdin) to documents."""
+    for source in sources:
+        if source == "-":
+            yield from _ndjson_documents("<stdin>", sys.stdin)
+
+        elif source.startswith(("http://", "https://")):
+            yield source, None
+
+        elif os.path.isdir(source):
+            yield from _directory_documents(source)
+
+        elif any(char in source for char in "*?["):
+            paths = sorted(glob.iglob(source, recursive=True))
+            yield from _iter_documents(path for path in paths if os.path.isfile(path))
+
+        elif source.endswith(NDJSON_SUFFIXES):
+            with open(source, "r") as f:
+                yield from _ndjson_documents(source, f)
+
+        else:
+            yield source, None
+
+
+def _validate_document(
+    document: Document,
+    extensions: bool = False,
+    schema_dir: Optional[str] = None,
+    api: bool = False,
+) -> Dict[str, Any]:
+    """Validate one document, returning its report record.
+
+    Module level so that it can be pickled by a `ProcessPoolExecutor`.
+    """
+    source, content = document
+    record: Dict[str, Any] = {"source": source, "type": None, "valid": False}
+    try:
+        data = json.loads(content) if content is not None else _load_json(source)
+        stac_type = data.get("type") if isinstance(data, dict) else None
+        record["type"] = stac_type
+        model = detect_model(data, api=api)
+        if model is None:
+            record["error"] = "Unknown STAC object type"
+            return record
+
+        record["model"] = model.__name__
+        model.model_validate(data)
+        if extensions:
+            validate_extensions(data, reraise_exception=True, schema_dir=schema_dir)
+    except Exception as e:
+        record["error"] = str(e)
+        return record
+
+    record["valid"] = True
+    return record
+
 
 @click.group(short_help="Validate STAC")
 def app() -> None:
@@ -26,13 +129,9 @@ def app() -> None:
 @click.argument("infile")
 def validate_item(infile: str) -> None:
     """Validate stac item"""
-    assert requests is not None, "requests must be installed to validate items"
     assert jsonschema is not None, "jsonschema must be installed to validate items"
 
-    r = requests.get(infile)
-    r.raise_for_status()
-
-    stac_item = r.json()
+    stac_item = _load_json(infile)
     try:
         item = Item.model_validate(stac_item)
         validate_extensions(item, reraise_exception=True)
@@ -42,3 +141,234 @@ def validate_item(infile: str) -> None:
 
     click.echo(f"{infile} is valid")
     return
+
+
+@app.command(short_help="Validate many STAC documents")
+@click.argument("sources", nargs=-1, required=True)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--extensions/--no-extensions",
+    default=False,
+    help="Also validate documents against their `stac_extensions` JSON schemas.",
+)
+@click.option(
+    "--schema-dir",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Read extension schemas from this local mirror ({schema_dir}/{host}/{path}) instead of fetching them.",
+)
+@click.option(
+    "--api/--no-api",
+    default=False,
+    help="Validate documents as STAC API responses (`stac_pydantic.api` models).",
+)
+@click.option(
+    "--report",
+    type=click.File("w"),
+    default="-",
+    help="Write the JSON lines report to this file. Defaults to stdout.",
+)
+def validate(
+    sources: Tuple[str, ...],
+    max_workers: Optional[int],
+    extensions: bool,
+    schema_dir: Optional[str],
+    api: bool,
+    report: IO[str],
+) -> None:
+    """Validate STAC Items, Collections and Catalogs.
+
+    SOURCES are files, directories (searched recursively for .json files),
+    glob patterns, URLs, NDJSON files or `-` to read NDJSON from stdin.
+
+    A JSON record is written for each document, followed by a summary on
+    stderr. Exits with status 1 if any document is invalid.
+    """
+    if extensions:
+        assert (
+            jsonschema is not None
+        ), "jsonschema must be installed to validate extensions"
+
+    validator = partial(
+        _validate_document, extensions=extensions, schema_dir=schema_dir, api=api
+    )
+    workers = max_workers or os.cpu_count() or 1
+    documents = _iter_documents(sources)
+
+    total = invalid = 0
+    start = time.perf_counter()
+
+    def write_report(records: Iterable[Dict[str, Any]]) -> None:
+        nonlocal total, invalid
+        for record in records:
+            total += 1
+            invalid += not record["valid"]
+            report.write(json.dumps(record) + "\n")
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            write_report(
+                bounded_map(executor, validator, documents, max_pending=workers * 16)
+            )
+    else:
+        write_report(map(validator, documents))
+
+    _echo_summary(total, invalid, time.perf_counter() - start)
+    if invalid:
+        sys.exit(1)
+
+
+def _echo_summary(total: int, invalid: int, elapsed: float) -> None:
+    rate = total / elapsed if elapsed else 0.0
+    click.echo(
+        f"{total} documents validated, {invalid} invalid in {elapsed:.2f}s ({rate:.1f} items/s)",
+        err=True,
+    )
+
+
+def _validate_single(infile: str, expected: Tuple[str, ...], api: bool) -> None:
+    """Validate one document whose detected model must be one of `expected`."""
+    record = _validate_document((infile, None), api=api)
+    if record.get("model") not in expected:
+        record["valid"] = False
+        record.setdefault(
+            "error",
+            f"Expected a {' or '.join(expected)}, found {record.get('model') or record['type']}",
+        )
+
+    if not record["valid"]:
+        click.echo(f"{infile}: {record['error']}")
+        sys.exit(1)
+
+    click.echo(f"{infile} is valid {record['model']}")
+
+
+def _validate_tree(
+    infile: str,
+    expected: Tuple[str, ...],
+    fail_fast: bool,
+    max_workers: Optional[int],
+) -> None:
+    """Validate a local catalog or collection and everything linked below it."""
+    total = invalid = 0
+    start = time.perf_counter()
+    workers = max_workers or os.cpu_count() or 1
+    walker = catalog_walk(infile, max_workers=workers, use_processes=workers > 1)
+    for result in walker:
+        total += 1
+        if total == 1 and not result.valid and result.type is None:
+            # The root could not be read
+            click.echo(f"{result.path}: {result.error}")
+            sys.exit(1)
+        if total == 1 and result.type not in expected:
+            click.echo(f"{infile}: Expected a {' or '.join(expected)}")
+            sys.exit(1)
+
+        if not result.valid:
+            invalid += 1
+            click.echo(f"{result.path}: {result.error}")
+            if fail_fast:
+                walker.close()
+                break
+
+    _echo_summary(total, invalid, time.perf_counter() - start)
+    if invalid:
+        sys.exit(1)
+
+
+def _tree_options(command: Callable) -> Callable:
+    """Options shared by the catalog and collection commands."""
+    options = [
+        click.argument("infile"),
+        click.option(
+            "--recursive/--no-recursive",
+            default=False,
+            help="Also validate the child catalogs, collections and items of a local file.",
+        ),
+        click.option(
+            "--fail-fast/--no-fail-fast",
+            default=False,
+            help="Stop at the first invalid document when validating recursively.",
+        ),
+        click.option(
+            "--max-workers",
+            type=click.IntRange(min=1),
+            default=None,
+            help="Number of worker processes used when validating recursively.",
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+@app.command(short_help="Validate STAC Catalog")
+@_tree_options
+def validate_catalog(
+    infile: str, recursive: bool, fail_fast: bool, max_workers: Optional[int]
+) -> None:
+    """Validate a STAC Catalog.
+
+    With --recursive, the `child` and `item` links of a local file are followed
+    and every linked document is validated concurrently.
+    """
+    if recursive:
+        _validate_tree(infile, ("Catalog",), fail_fast, max_workers)
+    else:
+        _validate_single(infile, ("Catalog",), api=False)
+
+
+@app.command(short_help="Validate STAC Collection")
+@_tree_options
+def validate_collection(
+    infile: str, recursive: bool, fail_fast: bool, max_workers: Optional[int]
+) -> None:
+    """Validate a STAC Collection, including its spatial and temporal extents.
+
+    With --recursive, the `child` and `item` links of a local file are followed
+    and every linked document is validated concurrently.
+    """
+    if recursive:
+        _validate_tree(infile, ("Collection",), fail_fast, max_workers)
+    else:
+        _validate_single(infile, ("Collection",), api=False)
+
+
+@app.command(short_help="Validate STAC ItemCollection")
+@click.argument("infile")
+@click.option(
+    "--api/--no-api",
+    default=False,
+    help="Validate as a STAC API response (`stac_pydantic.api.ItemCollection`).",
+)
+def validate_item_collection(infile: str, api: bool) -> None:
+    """Validate a STAC ItemCollection (GeoJSON FeatureCollection)."""
+    _validate_single(infile, ("ItemCollection",), api=api)
+
+
+@app.command(short_help="Validate STAC API response")
+@click.argument("infile")
+def validate_api(infile: str) -> None:
+    """Validate a STAC API response.
+
+    The document is detected as a LandingPage, Conformance, Collections,
+    Collection, Item or ItemCollection from its `type` and structure.
+    """
+    _validate_single(
+        infile,
+        (
+            "LandingPage",
+            "Conformance",
+            "Collections",
+            "Catalog",
+            "Collection",
+            "Item",
+            "ItemCollection",
+        ),
+        api=True,
+    )
@@ -1,7 +1,21 @@
+import os
+import random
 from datetime import datetime as dt
-from datetime import timezone
+from datetime import timedelta, timezone
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from warnings import warn
 
 from pydantic import (
@@ -10,14 +24,22 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
+    RootModel,
     SerializationInfo,
     SerializerFunctionWrapHandler,
     TypeAdapter,
+    ValidationError,
     model_serializer,
     model_validator,
 )
+from pydantic_core import InitErrorDetails, PydanticCustomError, SchemaValidator
 from typing_extensions import Annotated, Self
 
+from stac_pydantic.hashing import SUBTREES, canonical_hash, subtree_hashes
+from stac_pydantic.interning import intern_pool, interning_validator
+from stac_pydantic.patch import Patch, patched
+from stac_pydantic.trusted import fast_validator, patch_validator, trusted_validator
 from stac_pydantic.utils import AutoValueEnum
 
 NumType = Union[float, int]
@@ -26,15 +48,40 @@ BBox = Union[
     Tuple[NumType, NumType, NumType, NumType, NumType, NumType],  # 3D bbox
 ]
 
+# Build model schemas on first use rather than at import time, which makes
+# imports faster at the cost of a slower first validation.
+DEFER_BUILD = os.environ.get("STAC_PYDANTIC_DEFER_BUILD", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 SEMVER_REGEX = r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
 
+_UTC = timezone.utc
+_ZERO = timedelta(0)
+
+
+def _to_utc(value: dt) -> dt:
+    """Convert an aware datetime to UTC.
+
+    Values with a fixed zero offset (e.g. parsed from `...Z` strings) are
+    returned as is, their tzinfo comparing equal to `timezone.utc`, since
+    converting them is most of the cost of validating a datetime.
+    """
+    tzinfo = value.tzinfo
+    if tzinfo is _UTC or (tzinfo is not None and tzinfo.utcoffset(None) == _ZERO):
+        return value
+    return value.astimezone(_UTC)
+
+
 # Allows for some additional flexibility in the input datetime format. As long as
 # the input value has timezone information, it will be converted to UTC timezone.
 UtcDatetime = Annotated[
     # Input value must be in a format which has timezone information
     AwareDatetime,
     # Convert the input value to UTC timezone
-    AfterValidator(lambda d: d.astimezone(timezone.utc)),
+    AfterValidator(_to_utc),
 ]
 
 SearchDatetime: TypeAdapter = TypeAdapter(Optional[UtcDatetime])
@@ -94,7 +141,200 @@ class ProviderRoles(str, AutoValueEnum):
     host = auto()
 
 
+class ValidationLevel(str, AutoValueEnum):
+    """How thoroughly `model_validate` checks a document.
+
+    Selected with the `validation_level` key of the validation context, e.g.
+    `Item.model_validate(data, context={"validation_level": "fast"})`.
+
+    - `strict`: `standard`, plus these checks on the model and its nested models (`start_datetime`
+      not after `end_datetime`, no duplicated `stac_extensions`).
+    - `standard` (default): the models as defined, all their validators and
+      constraints.
+    - `fast`: structure and types are still validated (required fields,
+      geometries, datetimes, URLs, ...) but the validators listed in
+      `stac_pydantic.trusted.FAST_SKIPPED_VALIDATORS` (bbox values, polygon
+      closure, required API links) and the `pattern` constraints (e.g.
+      `stac_version`) are skipped. `stac_extensions` URLs are parsed once and
+      cached.
+    """
+
+    strict = auto()
+    standard = auto()
+    fast = auto()
+
+
+def _validation_level(context: Any) -> ValidationLevel:
+    """Read the validation level from a validation context, `standard` by default."""
+    if not isinstance(context, dict) or "validation_level" not in context:
+        return ValidationLevel.standard
+
+    value = context["validation_level"]
+    try:
+        return ValidationLevel(value)
+    except ValueError:
+        raise ValidationError.from_exception_data(
+            "ValidationLevel",
+            [
+                InitErrorDetails(
+                    type="enum",
+                    loc=("validation_level",),
+                    input=value,
+                    ctx={"expected": "'strict', 'standard' or 'fast'"},
+                )
+            ],
+        ) from None
+
+
+def _strict_error(loc: Tuple[Union[int, str], ...], message: str) -> InitErrorDetails:
+    return InitErrorDetails(
+        type=PydanticCustomError("strict_check", message), loc=loc, input=None
+    )
+
+
+def _nested_models(
+    value: Any, loc: Tuple[Union[int, str], ...]
+) -> Iterator[Tuple[Tuple[Union[int, str], ...], BaseModel]]:
+    """STAC models in a field value, directly or in a list or dict."""
+    if isinstance(value, (StacBaseModel, RootModel)):
+        yield loc, value
+    elif isinstance(value, (list, tuple)):
+        for i, child in enumerate(value):
+            if isinstance(child, (StacBaseModel, RootModel)):
+                yield loc + (i,), child
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            if isinstance(child, (StacBaseModel, RootModel)):
+                yield loc + (key,), child
+
+
+def _strict_errors(
+    model: BaseModel, loc: Tuple[Union[int, str], ...] = ()
+) -> List[InitErrorDetails]:
+    """Checks of the `strict` validation level, on `model` and its nested models.
+
+    Geometries are not visited.
+    """
+    errors: List[InitErrorDetails] = []
+    if isinstance(model, StacCommonMetadata):
+        start, end = model.start_datetime, model.end_datetime
+        if start and end and start > end:
+            errors.append(
+                _strict_error(loc, "start_datetime must not be after end_datetime")
+            )
+
+    fields = model.__dict__
+    extensions = fields.get("stac_extensions")
+    if extensions and len(set(extensions)) != len(extensions):
+        errors.append(
+            _strict_error(
+                loc + ("stac_extensions",),
+                "stac_extensions must not contain duplicates",
+            )
+        )
+
+    is_root = isinstance(model, RootModel)
+    for name, value in fields.items():
+        field_loc = loc if is_root else loc + (name,)
+        for child_loc, child in _nested_models(value, field_loc):
+            errors.extend(_strict_errors(child, child_loc))
+
+    return errors
+
+
 class StacBaseModel(BaseModel):
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
+
+    @classmethod
+    def model_validate(  # type: ignore[override]
+        cls, obj: Any, **kwargs: Any
+    ) -> Self:
+        """Validate `obj`, at the `validation_level` given in `context`.
+
+        See `ValidationLevel`, and `stac_pydantic.interning` for the `intern`
+        context key.
+        """
+        validator, level = cls._context_validator(kwargs.get("context"))
+        if validator is None:
+            model = super().model_validate(obj, **kwargs)
+        else:
+            model = validator.validate_python(obj, **kwargs)
+        if level is ValidationLevel.strict:
+            model._check_strict()
+        return model
+
+    @classmethod
+    def model_validate_json(  # type: ignore[override]
+        cls, json_data: Union[str, bytes, bytearray], **kwargs: Any
+    ) -> Self:
+        """Validate a JSON document, at the `validation_level` given in `context`."""
+        validator, level = cls._context_validator(kwargs.get("context"))
+        if validator is None:
+            model = super().model_validate_json(json_data, **kwargs)
+        else:
+            model = validator.validate_json(json_data, **kwargs)
+        if level is ValidationLevel.strict:
+            model._check_strict()
+        return model
+
+    @classmethod
+    def _context_validator(
+        cls, context: Any
+    ) -> Tuple[Optional[SchemaValidator], ValidationLevel]:
+        """Validator selected by the validation context, None for the default one."""
+        level = _validation_level(context)
+        if intern_pool(context) is not None:
+            return interning_validator(cls, level is ValidationLevel.fast), level
+        if level is ValidationLevel.fast:
+            return fast_validator(cls), level
+        return None, level
+
+    def _check_strict(self) -> None:
+        errors = _strict_errors(self)
+        if errors:
+            raise ValidationError.from_exception_data(type(self).__name__, errors)
+
+    @classmethod
+    def from_trusted(cls, data: Any, *, spot_check: float = 0.0) -> Self:
+        """Build the model, and all its nested models, from already validated data.
+
+        Only parsing is done (nested models, datetimes, URLs, ...): validators
+        and constraints are skipped, so this is meant for documents validated
+        before being stored, e.g. read back from a database. Invalid data gives
+        an invalid model.
+
+        `spot_check` is the fraction of calls, between 0 and 1, fully validated
+        with `model_validate` instead, to catch invalid data while debugging.
+        """
+        if spot_check and random.random() < spot_check:
+            return cls.model_validate(data)
+        return trusted_validator(cls).validate_python(data)
+
+    def apply_patch(self, patch: Patch) -> Self:
+        """Return a new model with a JSON Merge Patch (a mapping) or a JSON Patch
+        (a list of operations) applied.
+
+        Only the patched subtrees, and the model validators of the models
+        along them, are validated again: the untouched nested models are
+        shared with this model. See `stac_pydantic.patch`.
+        """
+        return patch_validator(type(self)).validate_python(patched(self, patch))
+
+    def canonical_hash(self, algorithm: str = "sha256") -> str:
+        """Return a stable hash of the model content, e.g. for ETags.
+
+        Independent of key order, datetime formatting and enums, see
+        `stac_pydantic.hashing`.
+        """
+        return canonical_hash(self, algorithm)
+
+    def subtree_hashes(
+        self, fields: Iterable[str] = SUBTREES, algorithm: str = "sha256"
+    ) -> Dict[str, str]:
+        """Return the canonical hashes of the `geometry`, `assets` and
+        `properties` (or other top level `fields`)."""
+        return subtree_hashes(self, fields, algorithm)
+
     def to_dict(
         self, by_alias: bool = True, exclude_unset: bool = True, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -130,6 +370,38 @@ class StacBaseModel(BaseModel):
         )
 
 
+class _SubtreeHashCache(StacBaseModel):
+    """Models caching their `subtree_hashes` (Catalogs, Collections and
+    Items), until one of their fields is assigned."""
+
+    _subtree_hashes: Optional[Dict[Tuple[str, str], str]] = PrivateAttr(None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._subtree_hashes = None
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._subtree_hashes = None
+        return copied
+
+    def subtree_hashes(
+        self, fields: Iterable[str] = SUBTREES, algorithm: str = "sha256"
+    ) -> Dict[str, str]:
+        """Return the canonical hashes of the `geometry`, `assets` and
+        `properties` (or other top level `fields`), cached on the instance.
+
+        The cache is reset when a field is assigned, but not when nested
+        models or values are modified in place.
+        """
+        if self._subtree_hashes is None:
+            self._subtree_hashes = {}
+        return subtree_hashes(self, fields, algorithm, self._subtree_hashes)
+
+
 class Provider(StacBaseModel):
     """
     https://github.com/radiantearth/stac-spec/blob/v1.0.0/collection-spec/collection-spec.md#provider-object
@@ -221,21 +493,17 @@ class Asset(StacBaseModel):
     )
 
 
+@lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> dt:
+    # Use the type adapter to validate the datetime strings, strict is necessary
+    # due to pydantic issues #8736 and #8762. Datetimes are immutable, so the
+    # parsed values of the (often repeated) search datetimes are cached.
+    return cast(dt, SearchDatetime.validate_strings(value, strict=True))
+
+
 def str_to_datetimes(value: str) -> List[Optional[dt]]:
     # Split on "/" and replace no value or ".." with None
-    values = [v if v and v != ".." else None for v in value.split("/")]
-
-    # Cast because pylance gets confused by the type adapter and annotated type
-    dates = cast(
-        List[Optional[dt]],
-        [
-            # Use the type adapter to validate the datetime strings, strict is necessary
-            # due to pydantic issues #8736 and #8762
-            SearchDatetime.validate_strings(v, strict=True) if v else None
-            for v in values
-        ],
-    )
-    return dates
+    return [_parse_datetime(v) if v and v != ".." else None for v in value.split("/")]
 
 
 def validate_datetime(v: Optional[str]) -> Optional[str]:
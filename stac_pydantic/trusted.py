@@ -0,0 +1,250 @@
+"""Build models from trusted, already validated, data.
+
+`model_construct` does not validate but only builds the top level model,
+leaving nested properties, assets, links and geometries as dictionaries.
+`trusted_validator` instead compiles a validator from the core schema of a
+model with the checks removed: the model and field validators of the models
+(`@model_validator`, `@field_validator`) and the `pattern`, `min_length`,
+`gt`, ... constraints. Parsing and building of the nested models, datetimes
+and URLs is kept, and done by pydantic-core, so that the result matches what
+`model_validate` returns for valid data.
+
+Nothing is checked: invalid data gives invalid models.
+
+`fast_validator`, used by the `fast` validation level, only removes the most
+expensive checks, and `patch_validator`, used by `apply_patch`, the ones
+undoing the reuse of untouched nested models.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type
+
+from pydantic import AnyUrl, BaseModel, TypeAdapter
+from pydantic_core import CoreConfig, CoreSchema, SchemaValidator
+
+_FUNCTION_SCHEMAS = ("function-before", "function-after", "function-wrap")
+_CONSTRAINTS = (
+    "pattern",
+    "min_length",
+    "max_length",
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "multiple_of",
+)
+# Keys of a schema that hold no validation schemas
+_SKIPPED_KEYS = ("serialization", "metadata", "cls", "function")
+
+# Validators removed by the `fast` validation level, by (end of) qualified name
+FAST_SKIPPED_VALIDATORS = (
+    # GeoJSON bbox: number of values, order and WGS84 bounds
+    "_GeoJsonBase.validate_bbox",
+    # Polygon rings closure and GeometryCollection warnings
+    "Polygon.check_closure",
+    "MultiPolygon.check_closure",
+    "GeometryCollection.check_geometries",
+    # Links required by the STAC API models
+    "required_links",
+)
+
+# Validators removed by `patch_validator`: untouched values of a patched model
+# are model instances, which they would dump and validate again
+PATCH_SKIPPED_VALIDATORS = ("Feature.set_geometry",)
+
+# Parsed `stac_extensions` URLs, shared by the models validated with `fast_validator`
+_extension_urls: Dict[str, Any] = {}
+_EXTENSION_URLS_SIZE = 1024
+
+
+def _unwrap(func: Callable) -> Callable:
+    return getattr(func, "__func__", func)
+
+
+def _models(schema: Any, models: Set[Type[BaseModel]]) -> None:
+    """Collect the classes of the models used in a core schema."""
+    if isinstance(schema, list):
+        for item in schema:
+            _models(item, models)
+    elif isinstance(schema, dict):
+        cls = schema.get("cls")
+        if schema.get("type") == "model" and isinstance(cls, type):
+            for base in cls.__mro__:
+                if issubclass(base, BaseModel):
+                    models.add(base)
+        for key, value in schema.items():
+            if key not in _SKIPPED_KEYS:
+                _models(value, models)
+
+
+def _validator_functions(
+    models: Set[Type[BaseModel]], names: Optional[Tuple[str, ...]] = None
+) -> Set[Callable]:
+    """Model and field validators of `models`, only those in `names` if given."""
+    functions: Set[Callable] = set()
+    for model in models:
+        decorators = model.__pydantic_decorators__
+        for group in (decorators.model_validators, decorators.field_validators):
+            for decorator in group.values():
+                func = _unwrap(decorator.func)
+                if names is None or _matches(func, names):
+                    functions.add(func)
+    return functions
+
+
+def _matches(func: Callable, names: Tuple[str, ...]) -> bool:
+    qualname = getattr(func, "__qualname__", "")
+    return any(qualname == name or qualname.endswith(f".{name}") for name in names)
+
+
+def _extension_url(value: Any) -> Any:
+    url = _extension_urls.get(value) if isinstance(value, str) else None
+    if url is None:
+        url = _url_adapter().validate_python(value)
+        if isinstance(value, str):
+            if len(_extension_urls) >= _EXTENSION_URLS_SIZE:
+                _extension_urls.clear()
+            _extension_urls[value] = url
+    return url
+
+
+@lru_cache(maxsize=None)
+def _url_adapter() -> TypeAdapter:
+    return TypeAdapter(AnyUrl)
+
+
+def _cached_urls(schema: Any) -> Any:
+    """Copy the schema of a list of URLs, parsing them with `_extension_url`."""
+    if not isinstance(schema, dict):
+        return schema
+    if schema.get("type") == "list":
+        return {
+            **schema,
+            "items_schema": {
+                "type": "function-plain",
+                "function": {"type": "no-info", "function": _extension_url},
+            },
+        }
+    if "schema" in schema:
+        return {**schema, "schema": _cached_urls(schema["schema"])}
+    return schema
+
+
+class _Stripper:
+    """Copy a core schema without some validator functions and constraints."""
+
+    def __init__(
+        self,
+        validators: Set[Callable],
+        constraints: Tuple[str, ...],
+        cache_extension_urls: bool = False,
+    ):
+        self.validators = validators
+        self.constraints = constraints
+        self.cache_extension_urls = cache_extension_urls
+
+    def __call__(self, schema: Any) -> Any:
+        if isinstance(schema, list):
+            return [self(item) for item in schema]
+        if not isinstance(schema, dict):
+            return schema
+
+        schema_type = schema.get("type")
+        if schema_type in _FUNCTION_SCHEMAS:
+            func = schema["function"]["function"]
+            inner = schema["schema"]
+            if _unwrap(func) in self.validators and not (
+                "ref" in schema and "ref" in inner
+            ):
+                stripped = self(inner)
+                # Definitions may point to the validator rather than the model
+                if "ref" in schema:
+                    stripped["ref"] = schema["ref"]
+                return stripped
+
+        copy = {
+            key: value if key in _SKIPPED_KEYS else self(value)
+            for key, value in schema.items()
+            if key not in self.constraints
+        }
+        if (
+            self.cache_extension_urls
+            and schema_type == "model-fields"
+            and "stac_extensions" in copy["fields"]
+        ):
+            field = copy["fields"]["stac_extensions"]
+            copy["fields"]["stac_extensions"] = {
+                **field,
+                "schema": _cached_urls(field["schema"]),
+            }
+        return copy
+
+
+def _compile(schema: Any, title: Optional[str] = None) -> SchemaValidator:
+    # Named like the validator of the model in validation errors
+    config = CoreConfig(title=title) if title else None
+    try:
+        # Otherwise the validators of already built nested models are reused
+        return SchemaValidator(schema, config, _use_prebuilt=False)
+    except TypeError:  # pragma: no cover
+        # pydantic-core < 2.33 (pydantic < 2.11) always reuses them, so the
+        # checks of nested models are still run there
+        return SchemaValidator(schema, config)
+
+
+def trusted_schema_validator(
+    schema: CoreSchema, title: Optional[str] = None
+) -> SchemaValidator:
+    """Compile a core schema, without its checks, to a validator for trusted data."""
+    models: Set[Type[BaseModel]] = set()
+    _models(schema, models)
+    stripper = _Stripper(_validator_functions(models), _CONSTRAINTS)
+    return _compile(stripper(schema), title)
+
+
+@lru_cache(maxsize=None)
+def trusted_validator(model: Type[BaseModel]) -> SchemaValidator:
+    """Return a validator building `model` from trusted data without checking it."""
+    # Deferred models (see `STAC_PYDANTIC_DEFER_BUILD`) must be built first
+    model.model_rebuild()
+    return trusted_schema_validator(model.__pydantic_core_schema__, model.__name__)
+
+
+def fast_schema(model: Type[BaseModel]) -> CoreSchema:
+    """Core schema of `model` for the `fast` validation level.
+
+    The validators named in `FAST_SKIPPED_VALIDATORS` and the `pattern`
+    constraints are removed and `stac_extensions` URLs are parsed once and
+    cached. Other checks are kept.
+    """
+    model.model_rebuild()
+    schema = model.__pydantic_core_schema__
+    models: Set[Type[BaseModel]] = set()
+    _models(schema, models)
+    stripper = _Stripper(
+        _validator_functions(models, FAST_SKIPPED_VALIDATORS),
+        ("pattern",),
+        cache_extension_urls=True,
+    )
+    return stripper(schema)
+
+
+@lru_cache(maxsize=None)
+def fast_validator(model: Type[BaseModel]) -> SchemaValidator:
+    """Return the validator of `model` for the `fast` validation level."""
+    return _compile(fast_schema(model), model.__name__)
+
+
+@lru_cache(maxsize=None)
+def patch_validator(model: Type[BaseModel]) -> SchemaValidator:
+    """Return the validator of `model` used by `apply_patch`.
+
+    The validators named in `PATCH_SKIPPED_VALIDATORS` are removed, so that
+    untouched nested models are kept as they are.
+    """
+    model.model_rebuild()
+    schema = model.__pydantic_core_schema__
+    models: Set[Type[BaseModel]] = set()
+    _models(schema, models)
+    stripper = _Stripper(_validator_functions(models, PATCH_SKIPPED_VALIDATORS), ())
+    return _compile(stripper(schema), model.__name__)
@@ -1,5 +1,21 @@
 from enum import Enum
-from typing import Any, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Set,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class AutoValueEnum(Enum):
@@ -7,3 +23,40 @@ class AutoValueEnum(Enum):
         name: str, start: int, count: int, last_values: List[Any]
     ) -> Any:
         return name
+
+
+def get_value(obj: Any, key: str) -> Any:
+    """Return the `key` of a dictionary or attribute of a model, None if missing."""
+    return obj.get(key) if isinstance(obj, Mapping) else getattr(obj, key, None)
+
+
+def bounded_map(
+    executor: "Executor",
+    fn: Callable[[T], R],
+    iterable: Iterable[T],
+    max_pending: int,
+) -> Iterator[R]:
+    """Apply `fn` to every element of `iterable` in `executor`.
+
+    Unlike `Executor.map`, the iterable is consumed lazily, with at most
+    `max_pending` calls submitted at any time, and results are yielded in
+    completion order.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    pending: Set["Future"] = set()
+    try:
+        for value in iterable:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(fn, value))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
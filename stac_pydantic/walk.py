@@ -0,0 +1,232 @@
+"""Crawl and validate static STAC catalogs stored on the local filesystem."""
+
+import json
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import unquote, urlparse
+
+from pydantic import BaseModel, ValidationError
+
+from stac_pydantic.catalog import Catalog
+from stac_pydantic.collection import Collection
+from stac_pydantic.item import Item
+from stac_pydantic.item_collection import ItemCollection
+from stac_pydantic.shared import StacBaseModel
+
+STAC_MODELS: Dict[str, Type[StacBaseModel]] = {
+    "Catalog": Catalog,
+    "Collection": Collection,
+    "Feature": Item,
+    "FeatureCollection": ItemCollection,
+}
+
+# Only catalogs and collections are crawled further; items are leaves.
+_FOLLOWED_RELS = ("child", "item")
+
+
+@dataclass
+class WalkResult:
+    """Outcome of loading and validating a single node of a static catalog."""
+
+    path: str
+    type: Optional[str] = None
+    model: Optional[BaseModel] = None
+    error: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+
+def detect_model(data: Any, api: bool = False) -> Optional[Type[BaseModel]]:
+    """Return the model matching a STAC document, from its `type` and structure.
+
+    With `api=True`, the `stac_pydantic.api` response models are used instead
+    (LandingPage, Conformance, Collections, Collection, Item and ItemCollection).
+    Returns None when the document is not recognized.
+    """
+    if not isinstance(data, dict):
+        return None
+
+    stac_type = data.get("type")
+    if not api:
+        return STAC_MODELS.get(stac_type) if isinstance(stac_type, str) else None
+
+    from stac_pydantic import api as api_models
+
+    if "conformsTo" in data:
+        if stac_type == "Catalog":
+            return api_models.LandingPage
+        return api_models.Conformance
+
+    if stac_type is None and isinstance(data.get("collections"), list):
+        return api_models.Collections
+
+    api_types: Dict[str, Type[BaseModel]] = {
+        "Catalog": Catalog,
+        "Collection": api_models.Collection,
+        "Feature": api_models.Item,
+        "FeatureCollection": api_models.ItemCollection,
+    }
+    return api_types.get(stac_type) if isinstance(stac_type, str) else None
+
+
+def _resolve_href(base_path: str, href: str) -> Optional[str]:
+    """Resolve a link href relative to the file it was found in.
+
+    Returns None for remote (non `file://`) links, which are not crawled.
+    """
+    parsed = urlparse(href)
+    # A single letter scheme is a Windows drive, not a URL scheme
+    if parsed.scheme and len(parsed.scheme) > 1:
+        if parsed.scheme != "file":
+            return None
+        href = unquote(parsed.path)
+
+    return os.path.normpath(os.path.join(os.path.dirname(base_path), href))
+
+
+def _child_paths(path: str, data: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Return the local (child, item) paths linked from a catalog or collection."""
+    children: List[str] = []
+    items: List[str] = []
+    links = data.get("links")
+    if not isinstance(links, list):
+        return children, items
+
+    for link in links:
+        if not isinstance(link, dict):
+            continue
+        rel = link.get("rel")
+        href = link.get("href")
+        if rel not in _FOLLOWED_RELS or not isinstance(href, str) or not href:
+            continue
+        resolved = _resolve_href(path, href)
+        if resolved is not None:
+            (children if rel == "child" else items).append(resolved)
+
+    return children, items
+
+
+def _load_node(path: str) -> Tuple[WalkResult, List[str], List[str]]:
+    """Load and validate one file, returning its result and the paths it links to.
+
+    Module level so that it can be pickled by a `ProcessPoolExecutor`.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError) as e:
+        return WalkResult(path=path, error=str(e)), [], []
+
+    stac_type = data.get("type") if isinstance(data, dict) else None
+    model = detect_model(data)
+    if model is None or model is ItemCollection:
+        return (
+            WalkResult(path=path, type=stac_type, error="Unknown STAC object type"),
+            [],
+            [],
+        )
+
+    # Links are followed from the raw document, so that the rest of the tree
+    # is still crawled when a catalog or collection fails validation.
+    children: List[str] = []
+    items: List[str] = []
+    if model in (Catalog, Collection):
+        children, items = _child_paths(path, data)
+
+    try:
+        obj = model.model_validate(data)
+    except ValidationError as e:
+        return WalkResult(path=path, type=stac_type, error=str(e)), children, items
+
+    return WalkResult(path=path, type=stac_type, model=obj), children, items
+
+
+def _unseen(paths: Iterable[str], seen: Set[str]) -> Iterator[str]:
+    """The paths not in `seen`, added to it as they are consumed."""
+    for path in paths:
+        if path not in seen:
+            seen.add(path)
+            yield path
+
+
+def catalog_walk(
+    root_path: str,
+    *,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    max_pending: Optional[int] = None,
+) -> Generator[WalkResult, None, None]:
+    """Crawl a static catalog from its root and validate every node.
+
+    `child` and `item` links of every Catalog and Collection are followed when
+    they point to the local filesystem. Each file is read and validated with
+    the model matching its `type` in a pool of `max_workers` workers (a process
+    pool when `use_processes` is set, which spreads validation over all cores).
+
+    Results are yielded as soon as they are available, in no particular order.
+    At most `max_pending` files are submitted to the pool at any time. Crawling
+    is depth first, with one iterator over the links of each catalog or
+    collection being crawled, consumed as the pool has room, instead of
+    queuing every path up front: memory grows with the depth of the catalog
+    and the links of the catalogs along the way, and with the paths of the
+    catalogs and collections already visited (which are only visited once
+    even if linked several times; item paths are not tracked).
+    """
+    workers = max_workers or os.cpu_count() or 1
+    pending_limit = max_pending or workers * 4
+    executor_class: Union[Type[ThreadPoolExecutor], Type[ProcessPoolExecutor]] = (
+        ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    )
+
+    root = os.path.normpath(root_path)
+    seen: Set[str] = set()
+    # Paths still to crawl, from the links of each crawled node
+    stack: List[Iterator[str]] = [_unseen([root], seen)]
+    pending: Set[Future] = set()
+
+    with executor_class(max_workers=workers) as executor:
+        try:
+            while stack or pending:
+                while stack and len(pending) < pending_limit:
+                    path = next(stack[-1], None)
+                    if path is None:
+                        stack.pop()
+                    else:
+                        pending.add(executor.submit(_load_node, path))
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result, children, items = future.result()
+                    if children:
+                        stack.append(_unseen(children, seen))
+                    if items:
+                        stack.append(iter(items))
+                    yield result
+        finally:
+            # The consumer may stop early, don't leave queued work behind
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,287 @@
+"""Write in-memory Catalogs, Collections and Items as a static STAC catalog."""
+
+import os
+import posixpath
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Tuple, Union
+
+from stac_pydantic.catalog import Catalog
+from stac_pydantic.collection import Collection
+from stac_pydantic.item import Item
+from stac_pydantic.links import Link, Relations
+from stac_pydantic.shared import MimeTypes, StacBaseModel
+from stac_pydantic.utils import bounded_map
+
+# Links generated by the writer, any existing link with these relations is dropped.
+STRUCTURAL_RELS = {
+    Relations.self,
+    Relations.root,
+    Relations.parent,
+    Relations.child,
+    "item",
+    Relations.collection,
+}
+
+LINK_TYPES = ("relative", "absolute")
+
+
+@dataclass
+class CatalogNode:
+    """A Catalog or Collection along with the children and items to write below it."""
+
+    stac_object: Union[Catalog, Collection]
+    children: List["CatalogNode"] = field(default_factory=list)
+    items: List[Item] = field(default_factory=list)
+
+
+@dataclass
+class WriteStats:
+    """Number of files and bytes written, and the time it took."""
+
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+def _check_segment(stac_object: Union[Catalog, Collection, Item]) -> None:
+    """Raise a ValueError if the id of the object can not be a directory name."""
+    stac_id = stac_object.id
+    if stac_id in ("", ".", "..") or any(c in stac_id for c in "/\\\0"):
+        raise ValueError(
+            f"{stac_object.type} id {stac_id!r} is not a valid path segment"
+        )
+
+
+def _check_ids(root: CatalogNode) -> None:
+    """Check the ids used as directory names, before writing any file.
+
+    Children and items share the directory of their parent, so their ids must
+    be unique among both.
+    """
+    nodes = [root]
+    while nodes:
+        node = nodes.pop()
+        seen: Set[str] = set()
+        stac_objects: List[Union[Catalog, Collection, Item]] = [
+            child.stac_object for child in node.children
+        ]
+        stac_objects.extend(node.items)
+        for stac_object in stac_objects:
+            _check_segment(stac_object)
+            if stac_object.id in seen:
+                raise ValueError(
+                    f"Duplicate id {stac_object.id!r} under "
+                    f"{node.stac_object.type} {node.stac_object.id!r}"
+                )
+            seen.add(stac_object.id)
+        nodes.extend(node.children)
+
+
+def _node_path(node: CatalogNode, parent_dir: str) -> str:
+    """Canonical path of a catalog or collection, relative to the root directory."""
+    filename = (
+        "collection.json"
+        if isinstance(node.stac_object, Collection)
+        else "catalog.json"
+    )
+    return posixpath.join(parent_dir, filename)
+
+
+def _item_path(item: Item, parent_dir: str) -> str:
+    """Canonical path of an item, relative to the root directory."""
+    return posixpath.join(parent_dir, item.id, f"{item.id}.json")
+
+
+class _Hrefs:
+    """Compute link hrefs between files of the catalog."""
+
+    def __init__(self, link_type: str, base_url: str):
+        self.link_type = link_type
+        self.base_url = base_url.rstrip("/") + "/"
+
+    def absolute(self, target: str) -> str:
+        return self.base_url + target
+
+    def __call__(self, source: str, target: str) -> str:
+        if self.link_type == "absolute":
+            return self.absolute(target)
+
+        href = posixpath.relpath(target, posixpath.dirname(source) or ".")
+        return href if href.startswith("../") else f"./{href}"
+
+
+def _with_links(
+    stac_object: StacBaseModel, path: str, links: List[Link], hrefs: _Hrefs
+) -> StacBaseModel:
+    """Return a copy of the object with its structural links replaced."""
+    if hrefs.link_type == "absolute":
+        links.insert(
+            0, Link(rel=Relations.self, href=hrefs.absolute(path), type=_media(path))
+        )
+
+    kept = [
+        link
+        for link in stac_object.links.link_iterator()  # type: ignore[attr-defined]
+        if link.rel not in STRUCTURAL_RELS
+    ]
+    links_type = type(stac_object.links)  # type: ignore[attr-defined]
+    return stac_object.model_copy(update={"links": links_type(links + kept)})
+
+
+def _media(path: str) -> str:
+    return (
+        MimeTypes.json
+        if path.endswith(("catalog.json", "collection.json"))
+        else MimeTypes.geojson
+    )
+
+
+def _plan(
+    node: CatalogNode,
+    path: str,
+    root_path: str,
+    parent_path: Optional[str],
+    hrefs: _Hrefs,
+) -> Iterator[Tuple[str, StacBaseModel]]:
+    """Generate the (path, object) pairs to write, with their links, depth first."""
+    directory = posixpath.dirname(path)
+    links = [Link(rel=Relations.root, href=hrefs(path, root_path), type=MimeTypes.json)]
+    if parent_path is not None:
+        links.append(
+            Link(
+                rel=Relations.parent, href=hrefs(path, parent_path), type=MimeTypes.json
+            )
+        )
+
+    child_paths = []
+    for child in node.children:
+        child_path = _node_path(child, posixpath.join(directory, child.stac_object.id))
+        child_paths.append(child_path)
+        links.append(
+            Link(
+                rel=Relations.child,
+                href=hrefs(path, child_path),
+                type=MimeTypes.json,
+                title=child.stac_object.title,
+            )
+        )
+
+    item_paths = []
+    for item in node.items:
+        item_path = _item_path(item, directory)
+        item_paths.append(item_path)
+        links.append(
+            Link(rel="item", href=hrefs(path, item_path), type=MimeTypes.geojson)
+        )
+
+    yield path, _with_links(node.stac_object, path, links, hrefs)
+
+    is_collection = isinstance(node.stac_object, Collection)
+    for item, item_path in zip(node.items, item_paths):
+        item_links = [
+            Link(
+                rel=Relations.root,
+                href=hrefs(item_path, root_path),
+                type=MimeTypes.json,
+            ),
+            Link(
+                rel=Relations.parent, href=hrefs(item_path, path), type=MimeTypes.json
+            ),
+        ]
+        if is_collection:
+            item_links.append(
+                Link(
+                    rel=Relations.collection,
+                    href=hrefs(item_path, path),
+                    type=MimeTypes.json,
+                )
+            )
+        yield item_path, _with_links(item, item_path, item_links, hrefs)
+
+    for child, child_path in zip(node.children, child_paths):
+        yield from _plan(child, child_path, root_path, path, hrefs)
+
+
+def _write_file(root_dir: str, path: str, stac_object: StacBaseModel) -> int:
+    """Atomically write the object as JSON, returning the number of bytes written."""
+    target = os.path.join(root_dir, *path.split("/"))
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+
+    content = stac_object.model_dump_json(exclude_none=True).encode("utf-8")
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    return len(content)
+
+
+def write_catalog(
+    root: CatalogNode,
+    root_dir: str,
+    *,
+    link_type: str = "relative",
+    base_url: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> WriteStats:
+    """Write a tree of Catalogs, Collections and Items as a static catalog.
+
+    The canonical layout is used: the root is written to `<root_dir>/catalog.json`
+    (or `collection.json`), each child to `<parent dir>/<id>/catalog.json` and
+    each item to `<parent dir>/<item id>/<item id>.json`.
+
+    `root`, `parent`, `child`, `item` and `collection` links are regenerated
+    for every object, other links are kept. With `link_type="relative"` hrefs
+    are relative and no `self` link is written (a self-contained catalog);
+    with `link_type="absolute"` hrefs are built from `base_url`, defaulting to
+    the `file://` URI of `root_dir`, and a `self` link is added.
+
+    Files are written by `max_workers` threads, each one to a temporary file
+    renamed over its target once complete. The input models are not modified.
+
+    Raises a ValueError, before writing anything, if the id of a child or
+    item is not a valid directory name (empty, `.`, `..` or with a path
+    separator), which would write outside of its parent directory.
+    """
+    if link_type not in LINK_TYPES:
+        raise ValueError(f"link_type must be one of {LINK_TYPES}, got {link_type!r}")
+    _check_ids(root)
+
+    if base_url is None:
+        base_url = Path(os.path.abspath(root_dir)).as_uri()
+    hrefs = _Hrefs(link_type, base_url)
+
+    root_path = _node_path(root, "")
+    stats = WriteStats()
+    start = time.perf_counter()
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for written in bounded_map(
+            executor,
+            lambda task: _write_file(root_dir, *task),
+            _plan(root, root_path, root_path, None, hrefs),
+            max_pending=workers * 4,
+        ):
+            stats.bytes += written
+            stats.files += 1
+
+    stats.seconds = time.perf_counter() - start
+    return stats
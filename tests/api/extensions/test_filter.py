@@ -0,0 +1,435 @@
+import pytest
+from pydantic import ValidationError
+
+from stac_pydantic.api.extensions.filter import (
+    And,
+    _compile_expression,
+    compile_filter,
+    parse_filter,
+)
+from stac_pydantic.api.search import ExtendedSearch
+from stac_pydantic.api.sql import compile_search
+from stac_pydantic.item import Item
+
+from ...conftest import request
+
+POLYGON = {
+    "type": "Polygon",
+    "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]],
+}
+
+
+def _item(id, geometry, **properties):
+    return {
+        "type": "Feature",
+        "id": id,
+        "collection": "c1" if id != "d" else "c2",
+        "geometry": geometry,
+        "properties": properties,
+    }
+
+
+ITEMS = [
+    _item(
+        "a",
+        {"type": "Point", "coordinates": [5, 5]},
+        datetime="2020-01-01T00:00:00Z",
+        platform="landsat-8",
+        cloud_cover=10,
+        gsd=30.0,
+    ),
+    _item(
+        "b",
+        {"type": "LineString", "coordinates": [[-5, 5], [15, 5]]},
+        datetime="2020-06-01T12:00:00+02:00",
+        platform="sentinel-2a",
+        cloud_cover=60,
+    ),
+    _item(
+        "c",
+        # Surrounding POLYGON, without crossing it
+        {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [[[-20, -20], [30, -20], [30, 30], [-20, 30], [-20, -20]]],
+            ],
+        },
+        datetime=None,
+        start_datetime="2019-01-01T00:00:00Z",
+        end_datetime="2021-01-01T00:00:00Z",
+        platform="landsat_9",
+        cloud_cover="n/a",
+    ),
+    _item(
+        "d",
+        {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [20, 20]},
+                # Inside the hole of the polygon below
+                {"type": "MultiPoint", "coordinates": [[40, 40]]},
+            ],
+        },
+        datetime="2021-03-01T00:00:00Z",
+    ),
+    _item("e", None, datetime="2022-01-01T00:00:00Z", cloud_cover=0),
+]
+
+
+def prop(name):
+    return {"property": name}
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ({"op": "=", "args": [prop("platform"), "landsat-8"]}, "a"),
+        ({"op": "<>", "args": [prop("platform"), "landsat-8"]}, "bc"),
+        ({"op": "<", "args": [prop("cloud_cover"), 50]}, "ae"),
+        ({"op": ">=", "args": [50, prop("cloud_cover")]}, "ae"),
+        ({"op": "=", "args": [prop("id"), prop("id")]}, "abcde"),
+        ({"op": "=", "args": [prop("collection"), "c2"]}, "d"),
+        ({"op": "like", "args": [prop("platform"), "landsat%"]}, "ac"),
+        ({"op": "like", "args": [prop("platform"), "landsat\\_9"]}, "c"),
+        ({"op": "like", "args": [prop("platform"), "sentinel-_a"]}, "b"),
+        ({"op": "between", "args": [prop("cloud_cover"), 0, 10]}, "ae"),
+        (
+            {"op": "between", "args": [prop("cloud_cover"), prop("gsd"), 100]},
+            "",
+        ),
+        ({"op": "in", "args": [prop("id"), ["a", "e", "z"]]}, "ae"),
+        ({"op": "in", "args": [prop("id"), [prop("platform"), "b"]]}, "b"),
+        # Unhashable values
+        ({"op": "in", "args": [prop("geometry"), [POLYGON]]}, ""),
+        ({"op": "isNull", "args": [prop("platform")]}, "de"),
+        ({"op": "not", "args": [{"op": "isNull", "args": [prop("platform")]}]}, "abc"),
+        # Comparisons with nulls and incomparable values are UNKNOWN, and so
+        # are their negations
+        (
+            {
+                "op": "not",
+                "args": [{"op": "=", "args": [prop("platform"), "landsat-8"]}],
+            },
+            "bc",
+        ),
+        ({"op": "not", "args": [{"op": "<", "args": [prop("cloud_cover"), 50]}]}, "b"),
+        (
+            {
+                "op": "not",
+                "args": [{"op": "between", "args": [prop("cloud_cover"), 5, 20]}],
+            },
+            "be",
+        ),
+        (
+            {"op": "not", "args": [{"op": "in", "args": [prop("platform"), ["x"]]}]},
+            "abc",
+        ),
+        (
+            {
+                "op": "not",
+                "args": [
+                    {
+                        "op": "and",
+                        "args": [
+                            {"op": "=", "args": [prop("platform"), "landsat-8"]},
+                            {"op": "<", "args": [prop("cloud_cover"), 50]},
+                        ],
+                    }
+                ],
+            },
+            "bc",
+        ),
+        (
+            {
+                "op": "not",
+                "args": [
+                    {
+                        "op": "or",
+                        "args": [
+                            {"op": "=", "args": [prop("platform"), "landsat-8"]},
+                            {"op": ">", "args": [prop("cloud_cover"), 50]},
+                        ],
+                    }
+                ],
+            },
+            "",
+        ),
+        ({"op": "not", "args": [{"op": "<", "args": ["a", 1]}]}, ""),
+        (
+            {
+                "op": "or",
+                "args": [
+                    {"op": "<", "args": ["a", 1]},
+                    {"op": "=", "args": [prop("id"), "a"]},
+                ],
+            },
+            "a",
+        ),
+        (
+            {
+                "op": "not",
+                "args": [
+                    {
+                        "op": "and",
+                        "args": [
+                            {"op": "<", "args": ["a", 1]},
+                            {"op": "=", "args": [prop("id"), "b"]},
+                        ],
+                    }
+                ],
+            },
+            "acde",
+        ),
+        (
+            {
+                "op": "and",
+                "args": [
+                    {"op": "<", "args": [prop("cloud_cover"), 100]},
+                    {"op": "like", "args": [prop("platform"), "%8"]},
+                ],
+            },
+            "a",
+        ),
+        (
+            {
+                "op": "or",
+                "args": [
+                    {"op": "=", "args": [prop("id"), "d"]},
+                    {"op": ">", "args": [prop("cloud_cover"), 50]},
+                ],
+            },
+            "bd",
+        ),
+        (
+            {
+                "op": ">",
+                "args": [prop("datetime"), {"timestamp": "2020-06-01T09:00:00Z"}],
+            },
+            "bde",
+        ),
+        ({"op": "<", "args": [prop("datetime"), {"date": "2020-01-02"}]}, "a"),
+        (
+            {
+                "op": "between",
+                "args": [
+                    prop("datetime"),
+                    {"timestamp": "2020-01-01T00:00:00Z"},
+                    {"date": "2021-03-01"},
+                ],
+            },
+            "abd",
+        ),
+        ({"op": "s_intersects", "args": [prop("geometry"), POLYGON]}, "abc"),
+        (
+            {
+                "op": "s_intersects",
+                "args": [
+                    prop("geometry"),
+                    {
+                        "type": "Polygon",
+                        "coordinates": [
+                            [[30, 30], [50, 30], [50, 50], [30, 50], [30, 30]],
+                            [[35, 35], [45, 35], [45, 45], [35, 45], [35, 35]],
+                        ],
+                    },
+                ],
+            },
+            "c",
+        ),
+        (
+            {
+                "op": "s_intersects",
+                "args": [prop("geometry"), {"type": "Point", "coordinates": [20, 20]}],
+            },
+            "cd",
+        ),
+        (
+            {
+                "op": "s_intersects",
+                "args": [
+                    prop("geometry"),
+                    {"type": "LineString", "coordinates": [[10, 0], [10, -5]]},
+                ],
+            },
+            "c",
+        ),
+        (
+            {
+                "op": "t_intersects",
+                "args": [prop("datetime"), {"interval": ["2020-01-01", "2020-12-31"]}],
+            },
+            "ab",
+        ),
+        (
+            {
+                "op": "t_intersects",
+                "args": [
+                    {"interval": [prop("start_datetime"), prop("end_datetime")]},
+                    {"interval": ["2020-06-01T00:00:00Z", ".."]},
+                ],
+            },
+            "c",
+        ),
+        (
+            {
+                "op": "t_intersects",
+                "args": [prop("datetime"), {"date": "2021-03-01"}],
+            },
+            "d",
+        ),
+        (
+            {
+                "op": "t_intersects",
+                "args": [{"timestamp": "2022-01-01T00:00:00Z"}, prop("datetime")],
+            },
+            "e",
+        ),
+    ],
+)
+def test_compile_filter(expression, expected):
+    match = compile_filter(expression)
+    assert "".join(item["id"] for item in ITEMS if match(item)) == expected
+
+
+def test_constant_folding():
+    always = {"op": "=", "args": [1, 1]}
+    never = {"op": "<", "args": [2, 1]}
+    on_id = {"op": "=", "args": [prop("id"), "a"]}
+
+    assert _compile_expression(parse_filter(always)).predicate is True
+    assert _compile_expression(parse_filter(never)).predicate is False
+    assert compile_filter(always)(ITEMS[0]) is True
+    assert compile_filter({"op": "not", "args": [always]})(ITEMS[0]) is False
+
+    compiled = _compile_expression(parse_filter({"op": "and", "args": [never, on_id]}))
+    assert compiled.predicate is False
+    compiled = _compile_expression(parse_filter({"op": "or", "args": [always, on_id]}))
+    assert compiled.predicate is True
+    compiled = _compile_expression(
+        parse_filter({"op": "and", "args": [always, always]})
+    )
+    assert compiled.predicate is True
+
+    # Only the comparison on `id` is left
+    match = compile_filter({"op": "and", "args": [always, on_id]})
+    assert [item["id"] for item in ITEMS if match(item)] == ["a"]
+
+    for expression in (
+        {"op": "between", "args": [5, 1, 10]},
+        {"op": "in", "args": ["a", ["a", "b"]]},
+        {"op": "isNull", "args": [{"timestamp": "2020-01-01T00:00:00Z"}]},
+        {
+            "op": "t_intersects",
+            "args": [{"date": "2020-01-01"}, {"timestamp": "2020-01-01T10:00:00Z"}],
+        },
+    ):
+        assert isinstance(_compile_expression(parse_filter(expression)).predicate, bool)
+
+
+def test_selectivity_order():
+    calls = []
+    spatial = {"op": "s_intersects", "args": [prop("geometry"), POLYGON]}
+    equal = {"op": "=", "args": [prop("id"), "a"]}
+    expression = parse_filter({"op": "and", "args": [spatial, equal]})
+    compiled = _compile_expression(expression)
+    assert compiled.cost > 20
+
+    # The cheap, selective comparison runs first and ends the evaluation
+    class Tracked(dict):
+        def get(self, key, default=None):
+            calls.append(key)
+            return super().get(key, default)
+
+    match = compile_filter(expression)
+    assert not match(Tracked(ITEMS[1]))
+    assert calls == ["id"]
+
+
+def test_items_models():
+    item = Item.model_validate(request("example-landsat8_eo-extension.json"))
+    assert compile_filter(
+        {
+            "op": "and",
+            "args": [
+                {"op": ">", "args": [prop("eo:cloud_cover"), 50]},
+                {
+                    "op": "t_intersects",
+                    "args": [prop("datetime"), {"interval": ["2018-10-01", ".."]}],
+                },
+                {
+                    "op": "s_intersects",
+                    "args": [
+                        prop("geometry"),
+                        {"type": "Point", "coordinates": [150.0, 60.0]},
+                    ],
+                },
+                {"op": "=", "args": [prop("properties.platform"), "landsat-8"]},
+            ],
+        }
+    )(item)
+    assert not compile_filter({"op": "<", "args": [prop("eo:cloud_cover"), 50]})(item)
+
+
+def test_invalid_filters():
+    with pytest.raises(ValidationError):
+        parse_filter({"op": "and", "args": [{"op": "=", "args": [1, 1]}]})
+    with pytest.raises(ValidationError):
+        parse_filter({"op": "unknown", "args": []})
+    with pytest.raises(ValidationError):
+        parse_filter({"op": "t_intersects", "args": [1, {"interval": ["x", ".."]}]})
+    with pytest.raises(ValueError, match="Intervals"):
+        compile_filter({"op": "=", "args": [{"interval": ["..", ".."]}, 1]})
+
+
+def test_search_filter():
+    search = ExtendedSearch(
+        **{
+            "filter-lang": "cql2-json",
+            "filter": {
+                "op": "and",
+                "args": [
+                    {"op": "=", "args": [prop("collection"), "c1"]},
+                    {
+                        "op": ">",
+                        "args": [
+                            prop("datetime"),
+                            {"timestamp": "2020-01-01T01:00:00+01:00"},
+                        ],
+                    },
+                ],
+            },
+        }
+    )
+    assert isinstance(search.filter, And)
+    assert search.model_dump(by_alias=True, exclude_none=True)["filter-lang"] == (
+        "cql2-json"
+    )
+    assert search.canonical()["filter"]["args"][1]["args"][1] == {
+        "timestamp": "2020-01-01T00:00:00Z"
+    }
+    match = compile_filter(search.filter)
+    assert [item["id"] for item in ITEMS if match(item)] == ["b", "e"]
+
+    with pytest.raises(ValueError, match="filter"):
+        compile_search(search)
+    with pytest.raises(ValidationError):
+        ExtendedSearch(**{"filter-lang": "cql2"})
+
+
+def test_search_filter_text():
+    search = ExtendedSearch.model_validate(
+        {"filter": "eo:cloud_cover < 10", "filter-lang": "cql2-text"}
+    )
+    assert search.filter == "eo:cloud_cover < 10"
+    assert search.filter_lang == "cql2-text"
+    assert search.canonical()["filter"] == "eo:cloud_cover < 10"
+    assert search.canonical()["filter-lang"] == "cql2-text"
+    # Text filters default to `cql2-text`
+    assert (
+        ExtendedSearch(filter="eo:cloud_cover < 10").cache_key() == search.cache_key()
+    )
+
+    with pytest.raises(ValueError, match="cql2-text filters are not supported"):
+        compile_filter(search.filter)
+    with pytest.raises(ValueError, match=r"filter \(cql2-text\) searches"):
+        compile_search(search)
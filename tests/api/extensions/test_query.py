@@ -1,7 +1,17 @@
 import pytest
 from pydantic import ValidationError
 
+from stac_pydantic.api.extensions.query import (
+    UNSUPPORTED_OPERATORS,
+    Operator,
+    compile_query,
+    filter_items,
+    query_mask,
+)
 from stac_pydantic.api.search import ExtendedSearch, Search
+from stac_pydantic.item import Item
+
+from ...conftest import request
 
 
 def test_api_query_extension():
@@ -22,3 +32,98 @@ def test_api_query_extension_invalid():
             collections=["collection1", "collection2"],
             query={"field": {"greater_than": 100}},
         )
+
+
+PROPERTIES = [
+    {
+        "datetime": "2020-01-01T00:00:00Z",
+        "platform": "landsat-8",
+        "eo:cloud_cover": 10,
+        "instruments": ["oli", "tirs"],
+    },
+    {
+        "datetime": "2021-06-01T00:00:00Z",
+        "platform": "sentinel-2a",
+        "eo:cloud_cover": 60,
+        "instruments": ["msi"],
+    },
+    {"datetime": "2022-01-01T00:00:00Z", "platform": None, "eo:cloud_cover": "n/a"},
+]
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ({}, [0, 1, 2]),
+        ({"eo:cloud_cover": {"lt": 50}}, [0]),
+        ({"eo:cloud_cover": {"gte": 10, "lte": 60}}, [0, 1]),
+        ({"eo:cloud_cover": {"neq": 10}}, [1, 2]),
+        ({"eo:cloud_cover": {"eq": "n/a"}}, [2]),
+        ({"platform": {"startsWith": "landsat"}}, [0]),
+        ({"platform": {"endsWith": "-2a"}}, [1]),
+        ({"platform": {"eq": "sent-inel-2a"}}, []),
+        ({"platform": {"contains": "t"}}, [0, 1]),
+        ({"instruments": {"contains": "oli"}}, [0]),
+        ({"platform": {"in": ["sentinel-2a", "landsat-9"]}}, [1]),
+        ({"platform": {"in": "landsat-8"}}, [0]),
+        ({"instruments": {"in": [["msi"]]}}, [1]),
+        ({"missing": {"eq": 1}}, []),
+        ({"datetime": {"gt": "2021-01-01T00:00:00Z"}}, [1, 2]),
+        (
+            {"eo:cloud_cover": {"lt": 100}, "platform": {"startsWith": "sentinel"}},
+            [1],
+        ),
+    ],
+)
+def test_compile_query(query, expected):
+    match = compile_query(ExtendedSearch(query=query).query or {})
+    assert [i for i, props in enumerate(PROPERTIES) if match(props)] == expected
+
+    items = [{"id": str(i), "properties": props} for i, props in enumerate(PROPERTIES)]
+    assert filter_items(items, query) == [items[i] for i in expected]
+
+    columns = {
+        name: [props.get(name) for props in PROPERTIES]
+        for name in ("datetime", "platform", "eo:cloud_cover", "instruments")
+    }
+    mask = query_mask(columns, query)
+    assert [i for i, m in enumerate(mask) if m] == expected
+
+
+def test_query_items():
+    item = Item.model_validate(request("example-landsat8_eo-extension.json"))
+    assert filter_items([item], {"eo:cloud_cover": {"gt": 50}}) == [item]
+    assert filter_items([item], {"platform": {"in": ["landsat-8"]}}) == [item]
+    # Datetime strings are compared to datetime properties as datetimes
+    assert filter_items([item], {"datetime": {"gte": "2018-10-01T01:08:32Z"}}) == [item]
+    assert filter_items([item], {"datetime": {"gt": "2018-10-01T02:00:00+01:00"}})
+    assert not filter_items([item], {"datetime": {"lt": "2018-10-01T00:00:00Z"}})
+
+
+def test_deprecated_operators():
+    with pytest.warns(DeprecationWarning, match="`ne` is deprecated"):
+        match = compile_query({"platform": {"ne": "landsat-8"}})
+    assert [match(props) for props in PROPERTIES] == [False, True, False]
+    assert Operator.lte.operator(1, 1)
+    assert Operator("in") is Operator.in_
+    assert not UNSUPPORTED_OPERATORS
+
+
+def test_query_mask_missing_column():
+    assert query_mask({"a": [1, 2]}, {"b": {"eq": 1}}) == [False, False]
+    assert query_mask({}, {"b": {"eq": 1}}) == []
+
+
+def test_query_mask_single_pass():
+    calls = []
+
+    class Value(int):
+        def __lt__(self, other):
+            calls.append(int(self))
+            return int(self) < other
+
+    columns = {"a": [Value(1), Value(5), Value(2)], "b": ["x", "y", "z"]}
+    query = {"a": {"lt": 3}, "b": {"in": ["x", "y"]}}
+    assert query_mask(columns, query) == [True, False, False]
+    assert calls == [1, 5, 2]
+    assert query_mask(columns, {}) == [True, True, True]
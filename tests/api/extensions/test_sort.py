@@ -1,7 +1,13 @@
+from datetime import datetime, timezone
+
 import pytest
 from pydantic import ValidationError
 
+from stac_pydantic.api.extensions.sort import SortExtension, sort_items, sort_key
 from stac_pydantic.api.search import ExtendedSearch
+from stac_pydantic.item import Item
+
+from ...conftest import request
 
 
 def test_api_sort_extension():
@@ -21,3 +27,126 @@ def test_api_sort_extension_invalid():
             collections=["collection1", "collection2"],
             sortby=[{"field": "field1", "direction": "ascending"}],
         )
+
+
+def _items():
+    values = [5, None, 2.5, "b", 7, float("nan"), "a", True, 5, None, 2]
+    return [
+        {
+            "id": f"item-{i}",
+            "collection": "c2" if i % 3 else "c1",
+            "properties": {"value": value, "rank": i % 4} if value is not None else {},
+        }
+        for i, value in enumerate(values)
+    ]
+
+
+def _ids(items):
+    return [item["id"] for item in items]
+
+
+def test_sort_key():
+    items = _items()
+    asc = [SortExtension(field="properties.value", direction="asc")]
+    desc = [SortExtension(field="value", direction="desc")]
+    # Booleans, numbers, strings, then missing values
+    assert [item["properties"].get("value") for item in sort_items(items, asc)][:8] == [
+        True,
+        2,
+        2.5,
+        5,
+        5,
+        7,
+        "a",
+        "b",
+    ]
+    assert _ids(sort_items(items, asc))[8:] == ["item-1", "item-5", "item-9"]
+    assert [item["properties"].get("value") for item in sort_items(items, desc)][
+        :8
+    ] == ["b", "a", 7, 5, 5, 2.5, 2, True]
+    # Missing values are last in both directions, and the sort is stable
+    assert _ids(sort_items(items, desc))[8:] == ["item-1", "item-5", "item-9"]
+    assert _ids(sort_items(items, desc))[3:5] == ["item-0", "item-8"]
+
+
+@pytest.mark.parametrize("buffer_size", [1, 2, 3, 11, 100])
+@pytest.mark.parametrize("limit", [None, 0, 1, 4, 20])
+def test_sort_items(tmp_path, buffer_size, limit):
+    items = _items() * 3
+    sortby = [
+        SortExtension(field="collection", direction="desc"),
+        SortExtension(field="rank", direction="asc"),
+        SortExtension(field="properties.value", direction="desc"),
+    ]
+    key = sort_key(sortby)
+    expected = sorted(items, key=key)[:limit]
+    result = list(
+        sort_items(iter(items), sortby, limit, buffer_size=buffer_size, tmpdir=tmp_path)
+    )
+    # Spilled Items are copies, and NaN values are not equal to themselves
+    assert _ids(result) == _ids(expected)
+    assert not list(tmp_path.iterdir())
+
+
+def test_sort_items_spill(tmp_path, monkeypatch):
+    from stac_pydantic.api.extensions import sort
+
+    runs = []
+    write_run = sort._write_run
+    monkeypatch.setattr(
+        sort,
+        "_write_run",
+        lambda run, tmpdir: runs.append(len(run)) or write_run(run, tmpdir),
+    )
+    items = _items() * 10
+    sortby = [SortExtension(field="id", direction="asc")]
+    result = sort_items(items, sortby, buffer_size=25)
+    assert next(result)["id"] == "item-0"
+    assert runs == [25, 25, 25, 25, 10]
+    # Closing the iterator removes the runs
+    result.close()
+
+    assert len(list(sort_items(items, sortby, limit=25, buffer_size=25))) == 25
+    assert runs == [25, 25, 25, 25, 10]
+
+
+def test_sort_models():
+    items = [
+        Item.model_validate(request(name))
+        for name in (
+            "example-landsat8_eo-extension.json",
+            "example-item_sci-extension.json",
+            "example-item_datacube-extension.json",
+        )
+    ]
+    sortby = [SortExtension(field="properties.datetime", direction="desc")]
+    assert [item.id for item in sort_items(items, sortby, buffer_size=1)] == [
+        "LC08_L1TP_107018_20181001_20181001_01_RT",
+        "datacube-123",
+        "MERRAclim.2_5m_min_80s",
+    ]
+    sortby = [
+        SortExtension(field="collection", direction="asc"),
+        SortExtension(field="eo:cloud_cover", direction="asc"),
+        SortExtension(field="id", direction="desc"),
+    ]
+    assert [item.id for item in sort_items(items, sortby)][0] == (
+        "LC08_L1TP_107018_20181001_20181001_01_RT"
+    )
+
+
+def test_sort_datetimes_and_other_types():
+    items = [
+        {"id": "a", "properties": {"value": datetime(2020, 1, 2)}},
+        {"id": "b", "properties": {"value": ["x"]}},
+        {"id": "c", "properties": {"value": datetime(2020, 1, 1, tzinfo=timezone.utc)}},
+        {"id": "d", "properties": {"value": "2020-01-03"}},
+    ]
+    sortby = [SortExtension(field="value", direction="asc")]
+    assert _ids(sort_items(items, sortby)) == ["d", "c", "a", "b"]
+
+
+def test_sort_strings_descending():
+    items = [{"id": value} for value in ("ab", "", "abc", "b", "é", "a")]
+    sortby = [SortExtension(field="id", direction="desc")]
+    assert _ids(sort_items(items, sortby)) == ["é", "b", "abc", "ab", "a", ""]
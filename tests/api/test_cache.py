@@ -0,0 +1,224 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stac_pydantic.api import ItemCollection
+from stac_pydantic.api.cache import ResponseCache
+from stac_pydantic.api.search import ExtendedSearch, Search
+
+from ..conftest import request
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_set():
+    cache = ResponseCache()
+    assert cache.get("a") is None
+    assert cache.set("a", b"1") == b"1"
+    assert cache.get("a") == b"1"
+    assert len(cache) == 1
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.entries, stats.size) == (1, 1, 1, 1)
+
+    cache.delete("a")
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_search_keys():
+    cache = ResponseCache()
+    cache.set(Search(collections=["a", "b"]), b"page")
+    assert cache.get(Search(collections=["b", "a"], limit=10)) == b"page"
+    assert cache.get(ExtendedSearch(collections=["b", "a"])) == b"page"
+    assert cache.get(Search(collections=["a"])) is None
+
+
+def test_item_collection():
+    cache = ResponseCache(compress=True)
+    page = ItemCollection.model_validate(request("itemcollection-sample-full.json"))
+    data = cache.set("page", page)
+    assert data == page.model_dump_json().encode()
+    assert cache.get("page") == data
+    assert json.loads(cache.get("page"))["type"] == "FeatureCollection"
+
+    stored = cache.get("page", decompress=False)
+    assert gzip.decompress(stored) == data
+    assert cache.stats.size == len(stored) < len(data)
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    # "a" is now the most recently used
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.stats.evictions == 1
+    assert cache.stats.size == 8
+
+    # Replaced entries are not counted twice
+    cache.set("c", b"12")
+    assert cache.stats.size == 6
+
+    # Too large to be stored
+    assert cache.set("d", b"12345678901") == b"12345678901"
+    assert cache.get("d") is None
+
+    cache.clear()
+    assert cache.stats.size == len(cache) == 0
+
+
+def test_max_entries():
+    cache = ResponseCache(max_entries=2)
+    for key in "abc":
+        cache.set(key, b"1")
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+
+def test_ttl():
+    clock = Clock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    cache.set("a", b"1")
+    clock.now = 9.9
+    assert cache.get("a") == b"1"
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert cache.stats.size == 0
+
+    cache = ResponseCache(ttl=None, clock=clock)
+    cache.set("a", b"1")
+    clock.now = 1e12
+    assert cache.get("a") == b"1"
+
+
+def test_get_or_set_single_flight():
+    cache = ResponseCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def produce():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return b"page"
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(cache.get_or_set, "a", produce)]
+        started.wait(5)
+        futures += [executor.submit(cache.get_or_set, "a", produce) for _ in range(7)]
+        # Let the waiters reach the flight
+        while cache.stats.coalesced < 7:
+            time.sleep(0.001)
+        release.set()
+        assert [f.result() for f in futures] == [b"page"] * 8
+
+    assert len(calls) == 1
+    assert cache.get_or_set("a", produce) == b"page"
+    assert len(calls) == 1
+    stats = cache.stats
+    assert (stats.misses, stats.coalesced, stats.hits) == (8, 7, 1)
+
+
+def test_get_or_set_error():
+    cache = ResponseCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def produce():
+        started.set()
+        release.wait(5)
+        raise ValueError("search failed")
+
+    with ThreadPoolExecutor(2) as executor:
+        first = executor.submit(cache.get_or_set, "a", produce)
+        started.wait(5)
+        second = executor.submit(cache.get_or_set, "a", produce)
+        while cache.stats.coalesced < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (first, second):
+            with pytest.raises(ValueError, match="search failed"):
+                future.result()
+
+    # Errors are not cached
+    assert cache.get_or_set("a", lambda: b"page") == b"page"
+
+
+def test_aget_or_set():
+    cache = ResponseCache(compress=True)
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b"page"
+
+    async def main():
+        results = await asyncio.gather(
+            *(cache.aget_or_set("a", produce) for _ in range(5))
+        )
+        assert results == [b"page"] * 5
+        assert await cache.aget_or_set("a", produce) == b"page"
+
+    asyncio.run(main())
+    assert len(calls) == 1
+    stats = cache.stats
+    assert (stats.misses, stats.coalesced, stats.hits) == (5, 4, 1)
+
+
+def test_aget_or_set_error():
+    cache = ResponseCache()
+
+    async def produce():
+        await asyncio.sleep(0.01)
+        raise ValueError("search failed")
+
+    async def main():
+        results = await asyncio.gather(
+            *(cache.aget_or_set("a", produce) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        # A failure without waiters
+        with pytest.raises(ValueError):
+            await cache.aget_or_set("b", produce)
+
+    asyncio.run(main())
+    assert len(cache) == 0
+
+
+def test_aget_or_set_cancelled():
+    cache = ResponseCache()
+
+    async def produce():
+        await asyncio.sleep(10)
+        return b"page"
+
+    async def main():
+        owner = asyncio.ensure_future(cache.aget_or_set("a", produce))
+        waiter = asyncio.ensure_future(cache.aget_or_set("a", produce))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert await cache.aget_or_set("a", lambda: asyncio.sleep(0, b"new")) == b"new"
+
+    asyncio.run(main())
@@ -1,4 +1,7 @@
-from stac_pydantic.api import Collections
+import pytest
+from pydantic import ValidationError
+
+from stac_pydantic.api import Collection, Collections, LazyCollections
 from stac_pydantic.api.version import STAC_API_VERSION
 
 from ..conftest import dict_match, request
@@ -11,3 +14,119 @@ def test_collection_list():
     test_collection_list = request(EXAMPLE_COLLECTION_LIST, PATH)
     valid_collection_list = Collections(**test_collection_list).model_dump(mode="json")
     dict_match(test_collection_list, valid_collection_list)
+
+
+def test_lazy_collections():
+    test_collection_list = request(EXAMPLE_COLLECTION_LIST, PATH)
+    collections = LazyCollections.model_validate(test_collection_list)
+    assert collections.ids == [
+        "aster-l1t",
+        "landsat-8-c2-l2",
+        "sentinel-2-l2a",
+        "naip",
+    ]
+    assert all(isinstance(c, dict) for c in collections.collections)
+
+    naip = collections.get("naip")
+    assert isinstance(naip, Collection)
+    assert collections.get("naip") is naip
+    assert collections.get("missing") is None
+    # Only the accessed collection is validated
+    assert [isinstance(c, Collection) for c in collections.collections] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+    assert [c.id for c in collections.page(1, 2)] == [
+        "landsat-8-c2-l2",
+        "sentinel-2-l2a",
+    ]
+    assert [c.id for c in collections.page(3)] == ["naip"]
+    assert collections.page(4) == []
+    assert [c.id for c in collections.iter_collections()] == collections.ids
+
+    valid_collection_list = collections.model_dump(mode="json")
+    dict_match(test_collection_list, valid_collection_list)
+    dict_match(
+        Collections.model_validate(test_collection_list).model_dump(mode="json"),
+        valid_collection_list,
+    )
+
+
+def test_lazy_collections_dump_unvalidated():
+    test_collection_list = request(EXAMPLE_COLLECTION_LIST, PATH)
+    collections = LazyCollections.model_validate(test_collection_list)
+    collections.get("aster-l1t")
+    dict_match(test_collection_list, collections.model_dump(mode="json"))
+
+
+def test_lazy_collections_errors():
+    test_collection_list = request(EXAMPLE_COLLECTION_LIST, PATH)
+    test_collection_list["collections"].append(test_collection_list["collections"][0])
+    with pytest.raises(ValidationError, match="Duplicate collection id"):
+        LazyCollections.model_validate(test_collection_list)
+
+    test_collection_list["collections"][-1] = {"title": "no id"}
+    with pytest.raises(ValidationError, match="string `id`"):
+        LazyCollections.model_validate(test_collection_list)
+
+    test_collection_list = request(EXAMPLE_COLLECTION_LIST, PATH)
+    del test_collection_list["collections"][0]["extent"]
+    collections = LazyCollections.model_validate(test_collection_list)
+    # Invalid collections only fail once accessed
+    assert collections.get("naip") is not None
+    with pytest.raises(ValidationError):
+        collections.get("aster-l1t")
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        ({}, ["aster-l1t", "landsat-8-c2-l2", "sentinel-2-l2a", "naip"]),
+        ({"q": "LANDSAT"}, ["landsat-8-c2-l2"]),
+        ({"q": ["united states", "copernicus"]}, ["sentinel-2-l2a", "naip"]),
+        ({"bbox": (0, 0, 1, 1)}, ["aster-l1t", "landsat-8-c2-l2", "sentinel-2-l2a"]),
+        (
+            {"bbox": (170, 30, -100, 40)},
+            ["aster-l1t", "landsat-8-c2-l2", "sentinel-2-l2a", "naip"],
+        ),
+        (
+            {"bbox": (170, 30, -130, 40)},
+            ["aster-l1t", "landsat-8-c2-l2", "sentinel-2-l2a"],
+        ),
+        (
+            {"datetime": "2018-01-01T00:00:00Z"},
+            ["landsat-8-c2-l2", "sentinel-2-l2a", "naip"],
+        ),
+        ({"datetime": "../2005-01-01T00:00:00Z"}, ["aster-l1t"]),
+        ({"datetime": "2007-01-01T00:00:00Z/2011-01-01T00:00:00Z"}, ["naip"]),
+        (
+            {"q": "usgs", "datetime": "2001-01-01T00:00:00Z/.."},
+            ["aster-l1t", "landsat-8-c2-l2"],
+        ),
+    ],
+)
+def test_lazy_collections_filter(kwargs, expected):
+    test_collection_list = request(EXAMPLE_COLLECTION_LIST, PATH)
+    collections = LazyCollections.model_validate(test_collection_list)
+    assert collections.filter(**kwargs) == expected
+    # Same results once validated
+    list(collections.iter_collections())
+    assert collections.filter(**kwargs) == expected
+
+
+def test_lazy_collections_filter_invalid_extent():
+    test_collection_list = request(EXAMPLE_COLLECTION_LIST, PATH)
+    del test_collection_list["collections"][1]["extent"]["temporal"]
+    test_collection_list["collections"][2]["extent"]["spatial"]["bbox"] = [[0, 1]]
+    collections = LazyCollections.model_validate(test_collection_list)
+    # Extents are only used by the bbox and datetime filters
+    assert collections.filter(q="naip") == ["naip"]
+    with pytest.raises(ValueError, match="extent of collection 'landsat-8-c2-l2'"):
+        collections.filter(bbox=(0, 0, 1, 1))
+    del test_collection_list["collections"][1]
+    collections = LazyCollections.model_validate(test_collection_list)
+    with pytest.raises(ValueError, match="extent of collection 'sentinel-2-l2a'"):
+        collections.filter(datetime="2018-01-01T00:00:00Z")
@@ -1,6 +1,7 @@
 import pytest
-from pydantic import ValidationError
+from pydantic import AnyUrl, ValidationError
 
+from stac_pydantic.api import conformance as conformance_classes
 from stac_pydantic.api.conformance import Conformance
 
 
@@ -18,3 +19,22 @@ def test_api_conformance():
 def test_api_conformance_invalid_url():
     with pytest.raises(ValidationError):
         Conformance(conformsTo=["s3://conformance-class"])
+
+
+def test_api_conformance_supports():
+    conformance = Conformance(
+        conformsTo=[conformance_classes.CORE, "https://conformance-class-1"]
+    )
+    assert conformance.conformance_classes == frozenset(
+        {conformance_classes.CORE, "https://conformance-class-1/"}
+    )
+    assert conformance.supports(conformance_classes.CORE)
+    assert conformance.supports(AnyUrl(conformance_classes.CORE))
+    # Compared as validated
+    assert conformance.supports("https://conformance-class-1")
+    assert conformance.supports("https://CONFORMANCE-class-1/")
+    assert not conformance.supports(conformance_classes.ITEM_SEARCH)
+    assert not conformance.supports("not a url")
+
+    trusted = Conformance.model_construct(conformsTo=[conformance_classes.CORE])
+    assert trusted.supports(conformance_classes.CORE)
@@ -2,9 +2,10 @@ import jsonschema
 import pytest
 import requests
 import yaml
-from pydantic import ValidationError
+from pydantic import AnyUrl, ValidationError
 
 from stac_pydantic import Catalog
+from stac_pydantic.api.conformance import CORE, ITEM_SEARCH, OGC_FEATURES_CORE
 from stac_pydantic.api.landing import LandingPage
 from stac_pydantic.api.links import Link
 from stac_pydantic.api.version import STAC_API_VERSION
@@ -130,3 +131,50 @@ def test_api_landing_page_is_catalog():
     )
     d = landing_page.model_dump()
     Catalog(**d)
+
+
+@pytest.mark.parametrize("example_url", valid_examples)
+def test_landing_page_supports(example_url):
+    example = request(
+        example_url, path=["tests", "api", "examples", f"v{STAC_API_VERSION}"]
+    )
+    landing_page = LandingPage(**example)
+    assert landing_page.conformance_classes == frozenset(example["conformsTo"])
+    assert landing_page.supports(CORE)
+    assert landing_page.supports(OGC_FEATURES_CORE)
+    assert not landing_page.supports("https://api.stacspec.org/v1.0.0/unknown")
+    # Private attributes are not dumped
+    assert landing_page.model_dump(mode="json")["conformsTo"] == example["conformsTo"]
+
+
+def test_landing_page_supports_updated_conformance():
+    example = request(
+        valid_examples[0], path=["tests", "api", "examples", f"v{STAC_API_VERSION}"]
+    )
+    example["conformsTo"] = [CORE, OGC_FEATURES_CORE]
+    landing_page = LandingPage(**example)
+    assert not landing_page.supports(ITEM_SEARCH)
+
+    updated = landing_page.model_copy(
+        update={"conformsTo": [CORE, OGC_FEATURES_CORE, AnyUrl(ITEM_SEARCH)]}
+    )
+    assert updated.supports(ITEM_SEARCH)
+    assert not landing_page.supports(ITEM_SEARCH)
+
+    landing_page.conformsTo = [AnyUrl(CORE), AnyUrl(ITEM_SEARCH)]
+    assert landing_page.supports(ITEM_SEARCH)
+    assert not landing_page.supports(OGC_FEATURES_CORE)
+    # Only computed again when assigned, not when modified in place
+    landing_page.conformsTo.append(AnyUrl(OGC_FEATURES_CORE))
+    assert not landing_page.supports(OGC_FEATURES_CORE)
+
+
+def test_landing_page_item_search_links():
+    example = request(
+        "landing_page_core.json",
+        path=["tests", "api", "examples", f"v{STAC_API_VERSION}"],
+    )
+    assert ITEM_SEARCH in example["conformsTo"]
+    example["links"] = [link for link in example["links"] if link["rel"] != "search"]
+    with pytest.raises(ValidationError, match="ITEM SEARCH conform"):
+        LandingPage(**example)
@@ -4,7 +4,9 @@ import pytest
 from pydantic import ValidationError
 from shapely.geometry import Polygon, shape
 
-from stac_pydantic.api.search import Search
+from stac_pydantic.api.extensions.filter import FILTER_CRS
+from stac_pydantic.api.extensions.sort import SortExtension
+from stac_pydantic.api.search import ExtendedSearch, Search
 
 
 def test_search():
@@ -213,3 +215,117 @@ def test_search_datetime(dt, start, end):
 def test_search_invalid_datetime(dt):
     with pytest.raises(ValidationError):
         Search(datetime=dt)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"collections": ["b", "a"]}, {"collections": ["a", "b", "a"]}),
+        ({"ids": ["2", "1"]}, {"ids": ["1", "2"]}),
+        ({"bbox": [0, 0, 1, 1]}, {"bbox": [0.0, 0.0, 1.0, 1.00000001]}),
+        (
+            {"datetime": "2020-01-01T01:00:00+01:00"},
+            {"datetime": "2020-01-01T00:00:00.000Z"},
+        ),
+        (
+            {"datetime": "2020-01-01T00:00:00Z/.."},
+            {"datetime": "2020-01-01T02:00:00+02:00/"},
+        ),
+        ({}, {"limit": 10}),
+        (
+            {"intersects": {"type": "Point", "coordinates": [1, 2]}},
+            {"intersects": {"type": "Point", "coordinates": [1.00000001, 2.0]}},
+        ),
+    ],
+)
+def test_search_cache_key_equivalent(a, b):
+    assert Search(**a).canonical() == Search(**b).canonical()
+    assert Search(**a).cache_key() == Search(**b).cache_key()
+    assert ExtendedSearch(**a).cache_key() == ExtendedSearch(**b).cache_key()
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"collections": ["a"]}, {"collections": ["b"]}),
+        ({"collections": []}, {}),
+        ({"bbox": [0, 0, 1, 1]}, {"bbox": [0, 0, 1, 1.001]}),
+        ({"datetime": "2020-01-01T00:00:00Z"}, {"datetime": "2020-01-01T00:00:00Z/.."}),
+        ({}, {"limit": 20}),
+        ({}, {"limit": None}),
+    ],
+)
+def test_search_cache_key_different(a, b):
+    assert Search(**a).cache_key() != Search(**b).cache_key()
+
+
+def test_search_canonical():
+    search = Search(
+        collections=["b", "a"],
+        bbox=[0, 0, 1, 1],
+        datetime="2020-01-01T01:00:00+01:00/..",
+    )
+    assert search.canonical() == {
+        "collections": ["a", "b"],
+        "bbox": [0.0, 0.0, 1.0, 1.0],
+        "datetime": "2020-01-01T00:00:00Z/..",
+        "limit": 10,
+    }
+    assert Search(bbox=[0, 0, 1.26, 1]).canonical(precision=1)["bbox"][2] == 1.3
+    assert len(search.cache_key(algorithm="md5")) == 32
+
+
+def test_extended_search_cache_key():
+    a = ExtendedSearch(
+        query={"eo:cloud_cover": {"le": 10}, "platform": {"eq": "landsat-8"}},
+        fields={"includes": ["b", "a"], "excludes": ["c"]},
+        sortby=[{"field": "id", "direction": "asc"}],
+    )
+    b = ExtendedSearch(
+        query={"platform": {"eq": "landsat-8"}, "eo:cloud_cover": {"lte": 10}},
+        fields={"excludes": ["c"], "includes": ["a", "b"]},
+        sortby=[{"field": "id", "direction": "asc"}],
+    )
+    assert a.canonical()["query"] == {
+        "eo:cloud_cover": {"lte": 10},
+        "platform": {"eq": "landsat-8"},
+    }
+    assert a.canonical()["fields"] == {"includes": ["a", "b"], "excludes": ["c"]}
+    assert a.cache_key() == b.cache_key()
+
+    # Sort order matters
+    c = b.model_copy(
+        update={
+            "sortby": [
+                SortExtension(field="id", direction="asc"),
+                SortExtension(field="datetime", direction="desc"),
+            ]
+        }
+    )
+    d = b.model_copy(update={"sortby": list(reversed(c.sortby))})
+    assert c.cache_key() != d.cache_key()
+    assert a.cache_key() != c.cache_key()
+
+
+def test_extended_search_cache_key_filter_crs():
+    expression = {"op": "=", "args": [{"property": "platform"}, "landsat-8"]}
+    default = ExtendedSearch(filter=expression)
+    explicit = ExtendedSearch(
+        filter=expression,
+        **{"filter-lang": "cql2-json", "filter-crs": FILTER_CRS},
+    )
+    other_crs = ExtendedSearch(
+        filter=expression,
+        **{"filter-crs": "http://www.opengis.net/def/crs/EPSG/0/4326"},
+    )
+    assert default.canonical()["filter-crs"] == FILTER_CRS
+    assert default.canonical()["filter-lang"] == "cql2-json"
+    assert default.cache_key() == explicit.cache_key()
+    assert default.cache_key() != other_crs.cache_key()
+
+    # Without a filter, only values other than the defaults are included
+    assert "filter-crs" not in ExtendedSearch(**{"filter-crs": FILTER_CRS}).canonical()
+    assert (
+        ExtendedSearch().cache_key()
+        != ExtendedSearch(**{"filter-crs": "urn:ogc:def:crs:EPSG::3857"}).cache_key()
+    )
@@ -0,0 +1,282 @@
+import glob
+import json
+import os
+import sqlite3
+from datetime import timezone
+
+import pytest
+
+from stac_pydantic.api.search import ExtendedSearch, Search
+from stac_pydantic.api.sql import Columns, compile_search
+
+from ..conftest import UtcDatetimeAdapter
+
+COLUMNS = Columns(
+    end_datetime="end_datetime",
+    property_expression="""json_extract(properties, '$."' || {name} || '"')""",
+    datetime_value=lambda d: d.astimezone(timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
+    ),
+)
+
+
+def _items():
+    items = []
+    for path in sorted(glob.glob(os.path.join("tests", "example_stac", "*.json"))):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("type") == "Feature":
+            items.append(data)
+        elif data.get("type") == "FeatureCollection":
+            items.extend(data["features"])
+    return items
+
+
+def _range(item):
+    props = item["properties"]
+    start, end = (
+        UtcDatetimeAdapter.validate_strings(value, strict=True)
+        for value in (
+            props.get("datetime") or props["start_datetime"],
+            props.get("datetime") or props["end_datetime"],
+        )
+    )
+    if props.get("start_datetime") and props.get("end_datetime"):
+        start, end = (
+            UtcDatetimeAdapter.validate_strings(props[key], strict=True)
+            for key in ("start_datetime", "end_datetime")
+        )
+    return start, end
+
+
+def _bbox(item):
+    bbox = item.get("bbox")
+    if bbox and len(bbox) == 6:
+        return [bbox[0], bbox[1], bbox[3], bbox[4]]
+    return bbox or [None] * 4
+
+
+ITEMS = _items()
+
+
+@pytest.fixture(scope="module")
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("PRAGMA case_sensitive_like = ON")
+    conn.execute(
+        "CREATE TABLE items (id TEXT, collection TEXT, datetime TEXT, "
+        "end_datetime TEXT, xmin REAL, ymin REAL, xmax REAL, ymax REAL, "
+        "properties TEXT)"
+    )
+    for item in ITEMS:
+        start, end = _range(item)
+        conn.execute(
+            "INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                item["id"],
+                item.get("collection"),
+                COLUMNS.datetime_value(start),
+                COLUMNS.datetime_value(end),
+                *_bbox(item),
+                json.dumps(item["properties"]),
+            ],
+        )
+    yield conn
+    conn.close()
+
+
+def _matches(item, search):  # noqa: C901
+    """Filter an Item in Python, as the compiled SQL should."""
+    if search.collections and item.get("collection") not in search.collections:
+        return False
+    if search.ids and item["id"] not in search.ids:
+        return False
+    if search.bbox:
+        west, south, east, north = _bbox({"bbox": search.bbox})
+        xmin, ymin, xmax, ymax = _bbox(item)
+        if xmin is None or ymax < south or ymin > north:
+            return False
+        if west <= east and (xmax < west or xmin > east):
+            return False
+        if west > east and xmax < west and xmin > east:
+            return False
+    if search.datetime:
+        start, end = _range(item)
+        if search.start_date and end < search.start_date:
+            return False
+        if search.end_date and start > search.end_date:
+            return False
+    for name, operators in (getattr(search, "query", None) or {}).items():
+        value = item["properties"].get(name)
+        for op, expected in operators.items():
+            if value is None:
+                return False
+            if op.value in ("startsWith", "endsWith"):
+                if not getattr(value, op.value.lower())(expected):
+                    return False
+            elif not op.operator(value, expected):
+                return False
+    return True
+
+
+def _select(db, search):
+    clause = compile_search(search, COLUMNS)
+    rows = db.execute(f"SELECT id FROM items {clause.sql}", clause.params)
+    return [row[0] for row in rows]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"collections": ["landsat-8-l1", "CS3"]},
+        {"ids": ["datacube-123", "AOI_3_Paris_img101", "missing"]},
+        {"bbox": [-123, 37, -122, 38]},
+        {"bbox": [-123, 37, 0, -122, 38, 100]},
+        # Crossing the antimeridian
+        {"bbox": [150, -90, -100, 90]},
+        {"datetime": "2018-01-01T00:00:00Z/.."},
+        {"datetime": "../2016-01-01T00:00:00Z"},
+        {"datetime": "/2016-01-01T00:00:00Z"},
+        {"datetime": "2016-05-03T13:21:30.040Z"},
+        # Within the range of an Item
+        {"datetime": "2018-01-01T13:25:00Z"},
+        {"datetime": "1985-01-01T00:00:00+02:00/1985-12-31T00:00:00Z"},
+        {"query": {"eo:cloud_cover": {"lt": 50}}},
+        {"query": {"eo:cloud_cover": {"gte": 0.0759, "lte": 78}}},
+        {"query": {"platform": {"startsWith": "landsat"}}},
+        {"query": {"platform": {"neq": "landsat-8"}}},
+        {"query": {"platform": {"contains": "-1"}}},
+        {"query": {"platform": {"endsWith": "_7"}}},
+        {"query": {"platform": {"in": ["landsat-8", "sentinel-1a"]}}},
+        {"query": {"platform": {"in": []}}},
+        {"query": {"gsd": {"eq": 30}}, "collections": ["landsat-8-l1"]},
+        {"limit": 3, "sortby": [{"field": "id", "direction": "asc"}]},
+    ],
+)
+def test_compile_search(db, params):
+    search = ExtendedSearch(**{"limit": None, **params})
+    expected = [item["id"] for item in ITEMS if _matches(item, search)]
+    if search.limit:
+        expected = sorted(expected)[: search.limit]
+    assert sorted(_select(db, search)) == sorted(expected)
+
+
+def test_sortby(db):
+    search = ExtendedSearch(
+        sortby=[
+            {"field": "properties.datetime", "direction": "desc"},
+            {"field": "id", "direction": "asc"},
+        ],
+        limit=None,
+    )
+    expected = sorted(ITEMS, key=lambda item: item["id"])
+    expected = sorted(expected, key=lambda item: _range(item)[0], reverse=True)
+    assert _select(db, search) == [item["id"] for item in expected]
+
+    search = ExtendedSearch(
+        query={"eo:cloud_cover": {"gte": 0}},
+        sortby=[{"field": "eo:cloud_cover", "direction": "asc"}],
+        limit=1,
+    )
+    assert _select(db, search) == ["LE07_CU_002012_20150101_20210502_02_BA"]
+
+
+def test_clause():
+    search = ExtendedSearch(
+        collections=["a"],
+        datetime="2020-01-01T00:00:00Z/..",
+        query={"eo:cloud_cover": {"le": 10}, "platform": {"startsWith": "50%_"}},
+        sortby=[{"field": "eo:cloud_cover", "direction": "desc"}],
+    )
+    with pytest.raises(ValueError, match="No column for property 'platform'"):
+        compile_search(search, Columns(properties={"eo:cloud_cover": "cloud_cover"}))
+
+    columns = Columns(
+        properties={"eo:cloud_cover": "cloud_cover", "platform": "platform"}
+    )
+    clause = compile_search(search, columns, paramstyle="numeric")
+    assert clause.sql == (
+        "WHERE collection IN (:1) AND datetime >= :2 AND cloud_cover <= :3 "
+        "AND platform LIKE :4 ESCAPE '\\' ORDER BY cloud_cover DESC LIMIT :5"
+    )
+    assert clause.params[0] == "a"
+    assert clause.params[1].year == 2020
+    assert clause.params[2:] == [10, "50\\%\\_%", 10]
+
+    clause = compile_search(Search(), paramstyle="format")
+    assert (clause.sql, clause.params) == ("LIMIT %s", [10])
+    clause = compile_search(Search(limit=None, collections=[]))
+    assert (clause.sql, clause.params) == ("", [])
+
+
+def test_property_expression():
+    search = ExtendedSearch(query={"eo:cloud_cover": {"eq": 1}}, limit=None)
+    columns = Columns(property_expression="properties ->> {name}")
+    clause = compile_search(search, columns, paramstyle="format")
+    assert clause.sql == "WHERE properties ->> %s = %s"
+    assert clause.params == ["eo:cloud_cover", 1]
+
+    with pytest.raises(ValueError, match="No column for property 'eo:cloud_cover'"):
+        compile_search(search)
+
+
+def test_intersects():
+    geometry = {"type": "Point", "coordinates": [1.0, 2.0]}
+    search = Search(intersects=geometry, limit=None)
+    with pytest.raises(ValueError, match="intersects"):
+        compile_search(search)
+
+    columns = Columns(
+        intersects="ST_Intersects(geometry, ST_GeomFromGeoJSON({geometry}))"
+    )
+    clause = compile_search(search, columns)
+    assert clause.sql == "WHERE ST_Intersects(geometry, ST_GeomFromGeoJSON(?))"
+    assert json.loads(clause.params[0]) == geometry
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="paramstyle"):
+        compile_search(Search(), paramstyle="named")
+    with pytest.raises(ValueError, match="bbox"):
+        compile_search(Search(bbox=[0, 0, 1, 1]), Columns(bbox=None))
+
+
+@pytest.mark.parametrize(
+    "bbox,expected",
+    [
+        ([-10, -10, 10, 10], ["a"]),
+        ([175, -10, 178, 10], ["b", "c"]),
+        ([-178, -10, -175, 10], ["b", "d"]),
+        ([100, -10, 120, 10], []),
+        # Crossing the antimeridian
+        ([179, -10, -179, 10], ["b", "c", "d"]),
+        ([10, -10, -170, 10], ["b", "c", "d"]),
+        ([0.5, -10, -179, 10], ["a", "b", "c", "d"]),
+    ],
+)
+def test_bbox_crossing_antimeridian(bbox, expected):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE items (id TEXT, xmin REAL, ymin REAL, xmax REAL, ymax REAL)"
+    )
+    conn.executemany(
+        "INSERT INTO items VALUES (?, ?, ?, ?, ?)",
+        [
+            ("a", -1, -1, 1, 1),
+            # Crossing the antimeridian
+            ("b", 170, -1, -170, 1),
+            ("c", 150, -1, 179, 1),
+            ("d", -179, -1, -150, 1),
+        ],
+    )
+    clause = compile_search(Search(bbox=bbox, limit=None))
+    rows = conn.execute(f"SELECT id FROM items {clause.sql}", clause.params)
+    assert sorted(row[0] for row in rows) == expected
+    conn.close()
+
+
+def test_empty_in():
+    search = ExtendedSearch(query={"platform": {"in": []}}, limit=None)
+    clause = compile_search(search, Columns(properties={"platform": "platform"}))
+    assert (clause.sql, clause.params) == ("WHERE 1 = 0", [])
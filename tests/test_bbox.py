@@ -0,0 +1,281 @@
+import random
+
+import numpy
+import pytest
+from geojson_pydantic.geometries import parse_geometry_obj
+from pydantic import ValidationError
+
+from stac_pydantic import Item, ItemCollection, bbox
+from stac_pydantic.bbox import (
+    bbox_covers,
+    bbox_covers_geometry,
+    bbox_mismatches,
+    geometry_bbox,
+)
+
+from .conftest import request
+
+SQUARE = [[0, 0], [2, 0], [2, 1], [0, 1], [0, 0]]
+HOLE = [[0.5, 0.2], [1, 0.2], [1, 0.8], [0.5, 0.2]]
+EAST = [[170, 0], [180, 0], [180, 10], [170, 10], [170, 0]]
+WEST = [[-180, -5], [-170, -5], [-170, 5], [-180, 5], [-180, -5]]
+
+
+@pytest.mark.parametrize(
+    "geometry,expected",
+    [
+        (None, None),
+        ({"type": "Point", "coordinates": [1, 2]}, (1, 2, 1, 2)),
+        ({"type": "Point", "coordinates": [1, 2, 3]}, (1, 2, 3, 1, 2, 3)),
+        ({"type": "MultiPoint", "coordinates": [[1, 2], [-1, 4]]}, (-1, 2, 1, 4)),
+        ({"type": "MultiPoint", "coordinates": []}, None),
+        (
+            {"type": "LineString", "coordinates": [[1, 2, 0], [3, -1, 5]]},
+            (1, -1, 0, 3, 2, 5),
+        ),
+        # 3D only if all positions have an elevation
+        ({"type": "LineString", "coordinates": [[1, 2, 0], [3, -1]]}, (1, -1, 3, 2)),
+        (
+            {
+                "type": "MultiLineString",
+                "coordinates": [[[0, 0], [1, 1]], [[2, 2], [3, 3]]],
+            },
+            (0, 0, 3, 3),
+        ),
+        ({"type": "Polygon", "coordinates": [SQUARE, HOLE]}, (0, 0, 2, 1)),
+        (
+            {
+                "type": "MultiPolygon",
+                "coordinates": [[SQUARE], [[[p[0] + 5, p[1]] for p in SQUARE]]],
+            },
+            (0, 0, 7, 1),
+        ),
+        (
+            {"type": "MultiPolygon", "coordinates": [[EAST], [WEST]]},
+            (170, -5, -170, 10),
+        ),
+        (
+            {
+                "type": "GeometryCollection",
+                "geometries": [
+                    {"type": "Point", "coordinates": [180, 1]},
+                    {"type": "LineString", "coordinates": [[-179, 2], [-178, 2]]},
+                ],
+            },
+            (180, 1, -178, 2),
+        ),
+    ],
+)
+def test_geometry_bbox(geometry, expected):
+    assert geometry_bbox(geometry) == expected
+    if geometry is not None and geometry.get("coordinates") != []:
+        assert geometry_bbox(parse_geometry_obj(geometry)) == expected
+
+
+def test_geometry_bbox_antimeridian():
+    geometry = {"type": "MultiPolygon", "coordinates": [[EAST], [WEST]]}
+    assert geometry_bbox(geometry, antimeridian=False) == (-180, -5, 180, 10)
+    # Parts far from the antimeridian are not joined across it
+    geometry = {
+        "type": "MultiPoint",
+        "coordinates": [[-100, 0], [-10, 0], [80, 0], [170, 0]],
+    }
+    assert geometry_bbox(geometry) == (-100, 0, 170, 0)
+    geometry["coordinates"].append([-170, 0])
+    assert geometry_bbox(geometry) == (-170, 0, 170, 0)
+    # Only joined across it for parts touching it
+    geometry["coordinates"].append([180, 0])
+    assert geometry_bbox(geometry) == (-10, 0, -100, 0)
+    geometry = {"type": "MultiPoint", "coordinates": [[179, 1], [-179, 2]]}
+    assert geometry_bbox(geometry) == (-179, 1, 179, 2)
+
+    with pytest.raises(ValueError, match="Unknown geometry type"):
+        geometry_bbox({"type": "Circle", "coordinates": [0, 0]})
+
+
+def _multipolygon(parts, size, dimensions=2):
+    rng = random.Random(0)
+    polygons = []
+    for _ in range(parts):
+        ring = [[rng.uniform(-50, 50) for _ in range(dimensions)] for _ in range(size)]
+        polygons.append([ring + [ring[0]]])
+    return {"type": "MultiPolygon", "coordinates": polygons}
+
+
+@pytest.mark.parametrize("dimensions", [2, 3, 4])
+def test_geometry_bbox_numpy(monkeypatch, dimensions):
+    geometry = _multipolygon(100, 50, dimensions)
+    with_numpy = geometry_bbox(geometry)
+    assert len(with_numpy) == (6 if dimensions > 2 else 4)
+    monkeypatch.setattr(bbox, "NUMPY_MIN_POSITIONS", 10**9)
+    assert geometry_bbox(geometry) == with_numpy
+
+    # Also without NumPy installed
+    monkeypatch.setattr(bbox, "NUMPY_MIN_POSITIONS", 0)
+    monkeypatch.setattr(bbox, "_numpy", lambda: None)
+    assert geometry_bbox(geometry) == with_numpy
+
+
+def test_geometry_bbox_numpy_arrays(monkeypatch):
+    geometry = _multipolygon(10, 50)
+    expected = geometry_bbox(geometry)
+    monkeypatch.setattr(bbox, "NUMPY_MIN_POSITIONS", 0)
+    arrays = {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [numpy.array(polygon[0])] for polygon in geometry["coordinates"]
+        ],
+    }
+    assert geometry_bbox(arrays) == expected
+
+    # Positions of different dimensions are handled in Python
+    geometry["coordinates"][0][0][0] = [0, 0, 60]
+    assert geometry_bbox(geometry) == expected
+
+
+@pytest.mark.parametrize(
+    "outer,inner,covers",
+    [
+        ((0, 0, 2, 1), (0, 0, 2, 1), True),
+        ((0, 0, 2, 1), (0.5, 0.5, 1, 1), True),
+        ((0, 0, 2, 1), (0, 0, 2, 1.1), False),
+        ((0, 0, 2, 1), (-0.1, 0, 1, 1), False),
+        ((0, 0, 2, 1), (0, 0, 2 + 1e-12, 1), True),
+        ((0, 0, 2, 1), (-1e-12, 0, 1, 1), True),
+        ((170, -5, -170, 10), (175, 0, -175, 1), True),
+        ((170, -5, -170, 10), (175, 0, 179, 1), True),
+        ((170, -5, -170, 10), (-175, 0, -171, 1), True),
+        ((170, -5, -170, 10), (0, 0, 1, 1), False),
+        ((170, -5, -170, 10), (160, 0, -175, 1), False),
+        ((-180, -90, 180, 90), (170, 0, -170, 1), True),
+        ((0, 0, 0, 2, 1, 10), (0, 0, 5, 2, 1, 8), True),
+        ((0, 0, 0, 2, 1, 10), (0, 0, 5, 2, 1, 12), False),
+        # Elevations are ignored with a 2D bbox
+        ((0, 0, 2, 1), (0, 0, 5, 2, 1, 12), True),
+    ],
+)
+def test_bbox_covers(outer, inner, covers):
+    assert bbox_covers(outer, inner) is covers
+
+
+def _landsat_item():
+    data = request("example-landsat8_eo-extension.json")
+    # The bbox of the example does not cover its geometry
+    assert bbox_mismatches([data]) == [data["id"]]
+    data["bbox"] = list(geometry_bbox(data["geometry"]))
+    return data
+
+
+def test_bbox_mismatches():
+    item = _landsat_item()
+    other = dict(item, id="other", bbox=[0, 0, 1, 1])
+    missing = dict(item, id="missing")
+    del missing["bbox"]
+    no_geometry = dict(item, id="no-geometry", geometry=None, bbox=None)
+    items = [item, other, missing, no_geometry]
+    assert bbox_mismatches(items) == ["other", "missing"]
+    assert bbox_mismatches([Item.model_validate(item)]) == []
+
+
+def test_item_bbox_validation():
+    data = _landsat_item()
+    # Not checked by default
+    Item.model_validate(dict(data, bbox=[0, 0, 1, 1]))
+    for mode in ("check", "fill"):
+        Item.model_validate(data, context={"bbox": mode})
+        with pytest.raises(ValidationError, match="does not cover the geometry"):
+            Item.model_validate(dict(data, bbox=[0, 0, 1, 1]), context={"bbox": mode})
+
+    missing = dict(data)
+    del missing["bbox"]
+    for context in (None, {"bbox": "require"}, {"bbox": "check"}):
+        with pytest.raises(ValidationError, match="bbox is required"):
+            Item.model_validate(missing, context=context)
+    item = Item.model_validate(missing, context={"bbox": "fill"})
+    assert item.bbox == pytest.approx(geometry_bbox(data["geometry"]))
+    assert "bbox" not in missing
+
+    with pytest.raises(ValidationError, match="Invalid bbox validation"):
+        Item.model_validate(data, context={"bbox": "compute"})
+
+
+@pytest.mark.parametrize(
+    "geometry,bbox",
+    [
+        (
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [[[-110, 0], [-90, 0], [-90, 10], [-110, 10], [-110, 0]]],
+                    [[[90, 0], [110, 0], [110, 10], [90, 10], [90, 0]]],
+                ],
+            },
+            [-110, 0, 110, 10],
+        ),
+        (
+            {"type": "MultiPoint", "coordinates": [[-100, 0], [100, 1]]},
+            [-100, 0, 100, 1],
+        ),
+        # Split at the antimeridian
+        (
+            {"type": "MultiPolygon", "coordinates": [[EAST], [WEST]]},
+            [170, -5, -170, 10],
+        ),
+        (
+            {"type": "MultiPolygon", "coordinates": [[EAST], [WEST]]},
+            [-180, -5, 180, 10],
+        ),
+    ],
+)
+def test_item_bbox_validation_separate_parts(geometry, bbox):
+    data = dict(_landsat_item(), geometry=geometry, bbox=bbox)
+    for mode in ("check", "fill"):
+        item = Item.model_validate(data, context={"bbox": mode})
+        assert list(item.bbox) == bbox
+    assert bbox_covers_geometry(bbox, geometry)
+    assert bbox_mismatches([data]) == []
+
+    # Filled with the minimum and maximum longitudes, unless split at the
+    # antimeridian
+    del data["bbox"]
+    item = Item.model_validate(data, context={"bbox": "fill"})
+    assert list(item.bbox) == list(geometry_bbox(geometry))
+    assert (item.bbox[0] > item.bbox[2]) == (geometry["coordinates"][0] == [EAST])
+
+
+def test_bbox_covers_geometry():
+    geometry = {"type": "MultiPoint", "coordinates": [[-100, 0], [100, 1]]}
+    assert not bbox_covers_geometry([-100, 0, 90, 1], geometry)
+    assert bbox_covers_geometry([100, 0, -100, 1], geometry)
+    assert not bbox_covers_geometry([100, 0, -101, 1], geometry)
+    assert bbox_covers_geometry([0, 0, 1, 1], None)
+
+
+def test_item_collection_bbox_fill():
+    data = request("itemcollection-sample-full.json")
+    for feature in data["features"]:
+        del feature["bbox"]
+    collection = ItemCollection.model_validate(data, context={"bbox": "fill"})
+    assert all(item.bbox is not None for item in collection.features)
+    assert bbox_mismatches(collection.features) == []
+
+
+@pytest.mark.parametrize("mode", ["check", "fill"])
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Polygon", "coordinates": "invalid"},
+        {"type": "Point", "coordinates": [1]},
+        {"type": "LineString", "coordinates": [[0, "x"], [1, 2]]},
+        {"type": "Circle", "coordinates": [0, 0]},
+    ],
+)
+def test_item_bbox_validation_malformed_geometry(mode, geometry):
+    data = dict(_landsat_item(), geometry=geometry)
+    # The bbox is checked or filled once the geometry is validated
+    with pytest.raises(ValidationError, match="geometry"):
+        Item.model_validate(data, context={"bbox": mode})
+    if mode == "fill":
+        del data["bbox"]
+        with pytest.raises(ValidationError, match="geometry"):
+            Item.model_validate(data, context={"bbox": mode})
@@ -1,6 +1,14 @@
+import json
+import os
+
 import pytest
 
+from stac_pydantic import Catalog, Collection, Item
+from stac_pydantic.extensions import _load_and_cache_schema, validate_extensions
 from stac_pydantic.scripts.cli import app
+from stac_pydantic.writer import CatalogNode, write_catalog
+
+from .conftest import request
 
 
 @pytest.mark.network
@@ -17,3 +25,277 @@ def test_valid_stac_item(cli_runner):
         raise result.exception
 
     assert result.exit_code == 0
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    schema = {
+        "type": "object",
+        "required": ["properties"],
+        "properties": {
+            "properties": {"type": "object", "required": ["test:value"]},
+        },
+    }
+    path = tmp_path / "schemas" / "example.com" / "test" / "v1.0.0"
+    path.mkdir(parents=True)
+    (path / "schema.json").write_text(json.dumps(schema))
+    return tmp_path / "schemas"
+
+
+def _item(**properties):
+    item = request("example-landsat8_eo-extension.json")
+    item["stac_extensions"] = ["https://example.com/test/v1.0.0/schema.json"]
+    item["properties"].update(properties)
+    return item
+
+
+def _records(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+
+
+def test_validate_item_local_file(cli_runner, tmp_path):
+    item = _item()
+    item["stac_extensions"] = []
+    path = tmp_path / "item.json"
+    path.write_text(json.dumps(item))
+
+    result = cli_runner.invoke(app, ["validate-item", str(path)])
+    assert result.exit_code == 0
+    assert "is valid" in result.output
+
+
+def test_validate_directory(cli_runner):
+    result = cli_runner.invoke(
+        app, ["validate", "tests/example_stac", "--max-workers", "2"]
+    )
+    records = _records(result.stdout)
+    assert len(records) == len(os.listdir("tests/example_stac"))
+    assert {record["type"] for record in records} >= {"Feature", "Collection"}
+    # ItemCollections and Catalog lists are not STAC Items
+    assert not all(record["valid"] for record in records)
+    assert result.exit_code == 1
+    assert "items/s" in result.stderr
+
+
+def test_validate_glob(cli_runner):
+    result = cli_runner.invoke(
+        app,
+        [
+            "validate",
+            "tests/example_stac/example-landsat8_*.json",
+            "--max-workers",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    records = _records(result.stdout)
+    assert len(records) == 5
+    assert all(record["valid"] for record in records)
+
+
+def test_validate_ndjson_stdin(cli_runner, schema_dir):
+    lines = [
+        json.dumps(_item(**{"test:value": 1})),
+        "",
+        json.dumps(_item()),
+        "not json",
+    ]
+    result = cli_runner.invoke(
+        app,
+        [
+            "validate",
+            "-",
+            "--max-workers",
+            "1",
+            "--extensions",
+            "--schema-dir",
+            str(schema_dir),
+        ],
+        input="\n".join(lines),
+    )
+    assert result.exit_code == 1
+    records = _records(result.stdout)
+    assert [record["source"] for record in records] == [
+        "<stdin>:1",
+        "<stdin>:3",
+        "<stdin>:4",
+    ]
+    assert [record["valid"] for record in records] == [True, False, False]
+    assert "test:value" in records[1]["error"]
+    assert "3 documents validated, 2 invalid" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/../../secret.json",
+        "https://example.com/test/../../../secret.json",
+        "https://../secret.json",
+        "https://example.com/..",
+    ],
+)
+def test_schema_dir_traversal(schema_dir, url):
+    (schema_dir.parent / "secret.json").write_text("{}")
+    _load_and_cache_schema.cache_clear()
+    with pytest.raises(ValueError, match="outside of the schema directory"):
+        _load_and_cache_schema(url, str(schema_dir))
+
+    item = dict(_item(), stac_extensions=[url])
+    with pytest.raises(ValueError, match="outside of the schema directory"):
+        validate_extensions(item, reraise_exception=True, schema_dir=str(schema_dir))
+    # Within the directory
+    url = "https://example.com/test/v2/../v1.0.0/schema.json"
+    assert _load_and_cache_schema(url, str(schema_dir))["type"] == "object"
+
+
+def test_validate_ndjson_file_report(cli_runner, tmp_path):
+    ndjson = tmp_path / "items.ndjson"
+    ndjson.write_text(json.dumps(_item()) + "\n" + json.dumps({"type": "Foo"}))
+    report = tmp_path / "report.jsonl"
+
+    result = cli_runner.invoke(
+        app, ["validate", str(ndjson), "--max-workers", "1", "--report", str(report)]
+    )
+    assert result.exit_code == 1
+    records = _records(report.read_text())
+    assert records[0] == {
+        "source": f"{ndjson}:1",
+        "type": "Feature",
+        "model": "Item",
+        "valid": True,
+    }
+    assert records[1]["error"] == "Unknown STAC object type"
+
+
+def test_validate_collection(cli_runner):
+    result = cli_runner.invoke(
+        app, ["validate-collection", "tests/example_stac/landsat-collection.json"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "is valid Collection" in result.output
+
+    # an Item is not a Collection
+    result = cli_runner.invoke(
+        app,
+        [
+            "validate-collection",
+            "tests/example_stac/example-landsat8_eo-extension.json",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "Expected a Collection, found Item" in result.output
+
+
+def test_validate_collection_invalid_extent(cli_runner, tmp_path):
+    collection = request("landsat-collection.json")
+    collection["extent"]["temporal"]["interval"] = [
+        ["2020-01-01T00:00:00Z", "2019-01-01T00:00:00Z"]
+    ]
+    path = tmp_path / "collection.json"
+    path.write_text(json.dumps(collection))
+
+    result = cli_runner.invoke(app, ["validate-collection", str(path)])
+    assert result.exit_code == 1
+    assert "older than `End` time" in result.output
+
+
+@pytest.fixture
+def static_catalog(tmp_path):
+    catalog = Catalog(type="Catalog", id="root", description="root", links=[])
+    collection = Collection(**request("landsat-collection.json"))
+    item = request("example-landsat8_eo-extension.json")
+    items = [Item(**dict(item, id=f"item-{i}")) for i in range(5)]
+    write_catalog(
+        CatalogNode(catalog, children=[CatalogNode(collection, items=items)]),
+        str(tmp_path),
+    )
+    return tmp_path
+
+
+@pytest.mark.parametrize("max_workers", ["1", "2"])
+def test_validate_catalog_recursive(cli_runner, static_catalog, max_workers):
+    root = str(static_catalog / "catalog.json")
+    result = cli_runner.invoke(
+        app, ["validate-catalog", root, "--recursive", "--max-workers", max_workers]
+    )
+    assert result.exit_code == 0, result.output
+    assert "7 documents validated, 0 invalid" in result.stderr
+
+    result = cli_runner.invoke(app, ["validate-collection", root, "--recursive"])
+    assert result.exit_code == 1
+    assert "Expected a Collection" in result.output
+
+
+def test_validate_catalog_fail_fast(cli_runner, static_catalog):
+    for i in range(5):
+        path = static_catalog / "landsat-8-l1" / f"item-{i}" / f"item-{i}.json"
+        item = json.loads(path.read_text())
+        item["bbox"] = None
+        path.write_text(json.dumps(item))
+
+    root = str(static_catalog / "catalog.json")
+    result = cli_runner.invoke(
+        app, ["validate-catalog", root, "--recursive", "--max-workers", "1"]
+    )
+    assert result.exit_code == 1
+    assert "7 documents validated, 5 invalid" in result.stderr
+
+    result = cli_runner.invoke(
+        app,
+        ["validate-catalog", root, "--recursive", "--fail-fast", "--max-workers", "1"],
+    )
+    assert result.exit_code == 1
+    assert result.output.count("bbox is required") == 1
+
+
+def test_validate_catalog_unreadable_root(cli_runner, tmp_path):
+    missing = str(tmp_path / "catalog.json")
+    result = cli_runner.invoke(app, ["validate-catalog", missing, "--recursive"])
+    assert result.exit_code == 1
+    assert "No such file" in result.output
+    assert "Expected a Catalog" not in result.output
+
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text("{")
+    result = cli_runner.invoke(app, ["validate-catalog", str(invalid), "--recursive"])
+    assert result.exit_code == 1
+    assert result.output.startswith(f"{invalid}: ")
+    assert "Expected a Catalog" not in result.output
+
+
+def test_validate_item_collection(cli_runner):
+    result = cli_runner.invoke(
+        app,
+        [
+            "validate-item-collection",
+            "tests/example_stac/itemcollection-sample-full.json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    # Items of an API ItemCollection require links
+    result = cli_runner.invoke(
+        app,
+        ["validate-item-collection", "tests/example_stac/example-search.json", "--api"],
+    )
+    assert result.exit_code == 1
+
+
+def test_validate_api(cli_runner):
+    result = cli_runner.invoke(
+        app, ["validate-api", "tests/api/examples/v1.0.0/example-collection-list.json"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "is valid Collections" in result.output
+
+    # the same document is not valid STAC
+    result = cli_runner.invoke(
+        app,
+        [
+            "validate",
+            "tests/api/examples/v1.0.0/example-collection-list.json",
+            "--max-workers",
+            "1",
+        ],
+    )
+    assert result.exit_code == 1
@@ -0,0 +1,158 @@
+import pytest
+
+from stac_pydantic import Catalog, Collection, Item
+from stac_pydantic.graph import CatalogGraph, DanglingLink
+
+from .conftest import request
+
+ROOT = "https://example.com/catalog/catalog.json"
+COLLECTION = "https://example.com/catalog/landsat/collection.json"
+
+
+def _catalog(children=True):
+    links = [
+        {"rel": "self", "href": ROOT},
+        {"rel": "root", "href": "./catalog.json"},
+    ]
+    if children:
+        links.append({"rel": "child", "href": "./landsat/collection.json"})
+    return Catalog(
+        type="Catalog",
+        stac_version="1.0.0",
+        id="root",
+        description="root catalog",
+        links=links,
+    )
+
+
+def _collection():
+    collection = request("landsat-collection.json")
+    collection["links"] = [
+        {"rel": "root", "href": "../catalog.json"},
+        {"rel": "parent", "href": "../catalog.json"},
+        {"rel": "item", "href": "./item-1/item-1.json"},
+    ]
+    return Collection.model_validate(collection)
+
+
+def _item(item_id, links, collection="landsat-8-l1"):
+    item = request("example-landsat8_eo-extension.json")
+    item.update(id=item_id, links=links, collection=collection)
+    return Item.model_validate(item)
+
+
+@pytest.fixture
+def graph():
+    item_1 = _item("item-1", [{"rel": "root", "href": "../../catalog.json"}])
+    # Only linked to the collection by its parent link
+    item_2 = _item(
+        "item-2",
+        [{"rel": "parent", "href": "../collection.json"}],
+        collection=None,
+    )
+    # Only by its collection field
+    item_3 = _item("item-3", [])
+    return CatalogGraph(
+        [
+            _catalog(),
+            (_collection(), COLLECTION),
+            (item_1, "https://example.com/catalog/landsat/item-1/item-1.json"),
+            (item_2, "https://example.com/catalog/landsat/item-2/item-2.json"),
+            (item_3, "https://example.com/catalog/landsat/item-3/item-3.json"),
+        ]
+    )
+
+
+def test_catalog_graph(graph):
+    assert len(graph) == 5
+    catalog = graph.get("root")
+    collection = graph.get("landsat-8-l1")
+    assert isinstance(collection, Collection)
+    assert graph.by_href("https://example.com/catalog/./landsat/collection.json") is (
+        collection
+    )
+    assert graph.href(collection) == COLLECTION
+    assert collection in graph and COLLECTION in graph
+    assert graph.get("missing") is None
+
+    assert graph.children(catalog) == [collection]
+    assert graph.children(COLLECTION) == []
+    assert graph.parent(collection) is catalog
+    assert graph.parent(catalog) is None
+    assert [i.id for i in graph.items("landsat-8-l1")] == ["item-1", "item-2", "item-3"]
+    assert [i.id for i in graph.items(collection)] == ["item-1", "item-2", "item-3"]
+    assert graph.items("missing") == []
+    for item_id in ("item-1", "item-2"):
+        assert graph.parent(graph.get(item_id)) is collection
+    assert graph.parent(graph.get("item-3")) is None
+
+    assert graph.dangling_links() == []
+
+
+def test_catalog_graph_incremental(graph):
+    collection = graph.get("landsat-8-l1")
+    item_1 = graph.remove("https://example.com/catalog/landsat/item-1/item-1.json")
+    assert item_1.id == "item-1"
+    assert item_1 not in graph
+    assert [i.id for i in graph.items(collection)] == ["item-2", "item-3"]
+    assert graph.dangling_links() == [
+        DanglingLink(
+            COLLECTION, "item", "https://example.com/catalog/landsat/item-1/item-1.json"
+        )
+    ]
+
+    graph.remove(graph.get("root"))
+    assert graph.parent(collection) is None
+    assert {link.rel for link in graph.dangling_links()} == {"root", "parent", "item"}
+
+    # Added back, the links to it are followed again
+    catalog = _catalog()
+    graph.add(catalog)
+    assert graph.parent(collection) is catalog
+    assert graph.children(catalog) == [collection]
+
+    # Replacing an object drops the edges of its links
+    graph.add(_catalog(children=False))
+    assert graph.children(ROOT) == [collection]
+    collection = _collection()
+    collection.links.root.clear()
+    graph.add(collection, COLLECTION)
+    assert graph.children(ROOT) == []
+    assert graph.dangling_links() == []
+    assert graph._children == {}
+    # Still linked from its Items
+    assert [i.id for i in graph.items(COLLECTION)] == ["item-2", "item-3"]
+
+    with pytest.raises(KeyError, match="Catalog 'root' is not in the graph"):
+        graph.remove(catalog)
+
+
+def test_catalog_graph_errors(graph):
+    graph.add(_item("item-3", []), "https://example.com/other/item-3.json")
+    with pytest.raises(ValueError, match="2 objects have the id 'item-3'"):
+        graph.get("item-3")
+    assert len(graph.find("item-3")) == 2
+
+    with pytest.raises(ValueError, match="no self link"):
+        graph.add(_collection())
+    with pytest.raises(KeyError):
+        graph.children("https://example.com/missing.json")
+
+
+def test_catalog_graph_object_at_several_hrefs(graph):
+    item = graph.get("item-1")
+    first = graph.href(item)
+    other = graph.add(item, "https://example.com/mirror/item-1.json")
+    assert graph.href(item) == first
+    assert graph.find("item-1") == [item, item]
+
+    assert graph.remove(first) is item
+    assert item in graph
+    assert graph.href(item) == other
+    assert graph.by_href(first) is None
+
+    graph.add(item, first)
+    assert graph.remove(item) is item
+    assert item not in graph
+    assert graph.by_href(first) is None and graph.by_href(other) is None
+    assert graph.find("item-1") == []
@@ -0,0 +1,174 @@
+import json
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+
+import pytest
+from pydantic import AnyUrl
+
+from stac_pydantic import Collection, Item
+from stac_pydantic.hashing import canonical_hash, subtree_hashes
+from stac_pydantic.links import Link
+from stac_pydantic.shared import MimeTypes
+
+from .conftest import request
+
+EO_ITEM = "example-landsat8_eo-extension.json"
+
+
+class Number(int, Enum):
+    one = 1
+
+
+@pytest.mark.parametrize(
+    "example, model",
+    [(EO_ITEM, Item), ("landsat-collection.json", Collection)],
+)
+def test_model_hash_matches_dump(example, model):
+    obj = model.model_validate(request(example))
+    dump = obj.model_dump(exclude_unset=False, exclude_none=True)
+    assert obj.canonical_hash() == canonical_hash(obj)
+    assert obj.canonical_hash() == canonical_hash(dump)
+    assert obj.canonical_hash() == canonical_hash(
+        obj.model_dump(mode="json", exclude_unset=False, exclude_none=True)
+    )
+    assert len(obj.canonical_hash()) == 64
+    assert len(obj.canonical_hash("md5")) == 32
+
+
+def test_raw_document_hash_matches_model():
+    data = request(EO_ITEM)
+    assert canonical_hash(data) == Item.model_validate(data).canonical_hash()
+
+
+def test_key_order():
+    data = request(EO_ITEM)
+    reordered = json.loads(json.dumps(data, sort_keys=True))
+    reordered["properties"] = dict(reversed(list(data["properties"].items())))
+    assert list(reordered) != list(data)
+    assert canonical_hash(reordered) == canonical_hash(data)
+
+
+def test_datetime_formatting():
+    data = request(EO_ITEM)
+    other = request(EO_ITEM)
+    data["properties"]["datetime"] = "2020-01-01T00:00:00Z"
+    other["properties"]["datetime"] = "2020-01-01T01:00:00.000000+01:00"
+    assert canonical_hash(data) == canonical_hash(other)
+    assert Item.model_validate(data).canonical_hash() == canonical_hash(other)
+
+    other["properties"]["datetime"] = "2020-01-01T00:00:01Z"
+    assert canonical_hash(data) != canonical_hash(other)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"type": MimeTypes.png}, {"type": "image/png"}),
+        ({"n": Number.one}, {"n": 1}),
+        ({"n": 1.0}, {"n": 1}),
+        ({"c": (1, 2)}, {"c": [1, 2]}),
+        ({"t": "2020-01-01t00:00:00.1234567z"}, {"t": "2020-01-01T00:00:00.123456Z"}),
+    ],
+)
+def test_equivalent_values(a, b):
+    assert canonical_hash(a) == canonical_hash(b)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"n": 1}, {"n": "1"}),
+        ({"n": None}, {}),
+        ({"a": [1, 2]}, {"a": [2, 1]}),
+        ({"a": True}, {"a": 1}),
+        ({"a": {"b": 1}}, {"a.b": 1}),
+    ],
+)
+def test_different_values(a, b):
+    assert canonical_hash(a) != canonical_hash(b)
+
+
+class Text(str):
+    pass
+
+
+class Ratio(float):
+    pass
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        (
+            {"t": datetime(2020, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))},
+            {"t": "2020-01-01T00:00:00Z"},
+        ),
+        ({"t": datetime(2020, 1, 1)}, {"t": "2020-01-01T00:00:00Z"}),
+        ({"d": date(2020, 1, 1)}, {"d": "2020-01-01"}),
+        ({"u": AnyUrl("https://example.com/")}, {"u": "https://example.com/"}),
+        (
+            {"s": Text("a"), "f": Ratio(0.5), "d": OrderedDict(a=1)},
+            {"s": "a", "f": 0.5, "d": {"a": 1}},
+        ),
+        ({1: "a", "b": 2}, {"1": "a", "b": 2}),
+        (
+            {"m": Link(href="https://example.com", rel="self")},
+            {"m": {"href": "https://example.com", "rel": "self"}},
+        ),
+        # Not a valid date, hashed as a string
+        ({"t": "2020-13-01T00:00:00Z"}, {"t": "2020-13-01T00:00:00Z"}),
+    ],
+)
+def test_python_values(a, b):
+    assert canonical_hash(a) == canonical_hash(b)
+
+
+def test_non_finite_float():
+    with pytest.raises(ValueError):
+        canonical_hash({"a": float("nan")})
+
+
+def test_subtree_hashes():
+    item = Item.model_validate(request(EO_ITEM))
+    hashes = item.subtree_hashes()
+    assert set(hashes) == {"geometry", "assets", "properties"}
+    assert hashes["assets"] == canonical_hash(item.model_dump()["assets"])
+    assert item.subtree_hashes() == hashes
+    assert subtree_hashes(item, ["links", "collection", "unknown"]) == {
+        "links": canonical_hash(item.model_dump()["links"]),
+        "collection": canonical_hash(item.collection),
+    }
+
+    # Only the changed subtrees differ
+    patched = item.apply_patch({"properties": {"platform": "other"}})
+    patched_hashes = patched.subtree_hashes()
+    assert patched_hashes["properties"] != hashes["properties"]
+    assert patched_hashes["assets"] == hashes["assets"]
+
+
+def test_model_hash_defaults():
+    data = request(EO_ITEM)
+    data.pop("stac_extensions")
+    item = Item.model_validate(data)
+    properties = dict(data["properties"], title=None)
+    explicit = Item.model_validate(
+        dict(data, stac_extensions=[], properties=properties)
+    )
+    assert "stac_extensions" not in item.model_fields_set
+    assert "title" in explicit.properties.model_fields_set
+    assert explicit.canonical_hash() == item.canonical_hash()
+    assert explicit.subtree_hashes() == item.subtree_hashes()
+
+
+def test_subtree_hashes_cache():
+    item = Item.model_validate(request(EO_ITEM))
+    hashes = item.subtree_hashes()
+    properties = item.properties.model_copy(update={"platform": "other"})
+
+    copied = item.model_copy(update={"properties": properties})
+    assert copied.subtree_hashes()["properties"] != hashes["properties"]
+    assert item.subtree_hashes() == hashes
+
+    item.properties = properties
+    assert item.subtree_hashes() == copied.subtree_hashes()
@@ -0,0 +1,82 @@
+import json
+
+from stac_pydantic import Collection, Item
+from stac_pydantic.hydration import (
+    DO_NOT_MERGE_MARKER,
+    dehydrate,
+    dehydrate_items,
+    hydrate,
+    hydrate_items,
+    item_base,
+)
+
+from .conftest import request
+
+COLLECTION = "example-landsat8_item-assets-extension.json"
+EO_ITEM = "example-landsat8_eo-extension.json"
+
+
+def _base():
+    return item_base(Collection.model_validate(request(COLLECTION)))
+
+
+def test_item_base():
+    base = _base()
+    assert base["type"] == "Feature"
+    assert base["stac_version"] == "1.0.0"
+    assert base["collection"] == "landsat-8-l1"
+    assert base["assets"]["B1"]["type"] == "image/tiff; application=geotiff"
+
+    base = item_base(
+        Collection.model_validate(request("landsat-collection.json")),
+        {"properties": {"platform": "landsat-8"}},
+    )
+    assert "assets" not in base
+    assert base["properties"] == {"platform": "landsat-8"}
+
+
+def test_round_trip():
+    base = _base()
+    item = Item.model_validate(request(EO_ITEM))
+    dehydrated = item.dehydrate(base)
+
+    assert "type" not in dehydrated
+    assert "stac_version" not in dehydrated
+    b1 = dehydrated["assets"]["B1"]
+    assert "href" in b1
+    assert "type" not in b1
+    assert "eo:bands" not in b1
+    # Different from the collection
+    assert b1["title"] == "Band 1 (coastal)"
+    # In the collection only
+    assert dehydrated["assets"]["metadata"] == DO_NOT_MERGE_MARKER
+    assert b1["description"] == DO_NOT_MERGE_MARKER
+    assert len(json.dumps(dehydrated)) < len(item.model_dump_json())
+
+    assert Item.hydrate(dehydrated, base) == item
+    assert Item.hydrate(dehydrated, base, trusted=True) == item
+
+
+def test_dictionaries():
+    base = {"a": 1, "b": {"c": [1, 2], "d": 2}, "e": 3}
+    data = {"a": 1, "b": {"c": [1, 2], "d": 3, "f": 4}, "g": 5}
+    dehydrated = dehydrate(data, base)
+    assert dehydrated == {"b": {"d": 3, "f": 4}, "g": 5, "e": DO_NOT_MERGE_MARKER}
+    assert hydrate(dehydrated, base) == data
+    assert hydrate({}, base) == base
+
+    # Lists are compared as a whole
+    assert dehydrate({"b": {"c": [1]}}, base)["b"]["c"] == [1]
+
+
+def test_streams():
+    base = _base()
+    item = Item.model_validate(request(EO_ITEM))
+    rows = list(dehydrate_items([item, item.model_dump(mode="json")], base))
+    assert rows[0] == rows[1]
+
+    items = hydrate_items(iter(rows), base)
+    assert next(items) == item
+    assert next(items) == item
+
+    assert list(hydrate_items(rows, base, Item, trusted=True)) == [item, item]
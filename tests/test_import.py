@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+from typing import Dict, Optional, Tuple
+
+import pytest
+
+# Budgets, in microseconds, for the time spent in stac-pydantic's own modules
+# (`self` time reported by `python -X importtime`). They are deliberately
+# generous to absorb slow CI machines, regressions are usually much larger.
+LAZY_IMPORT_BUDGET = 50_000
+MODELS_IMPORT_BUDGET = 300_000
+
+
+def import_times(
+    statement: str, env: Optional[Dict[str, str]] = None
+) -> Dict[str, Tuple[int, int]]:
+    """Run `statement` in a new interpreter and return the (self, cumulative)
+    import time of each imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **(env or {})},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def own_time(times: Dict[str, Tuple[int, int]]) -> int:
+    return sum(
+        t[0] for module, t in times.items() if module.startswith("stac_pydantic")
+    )
+
+
+@pytest.mark.parametrize(
+    "statement", ["import stac_pydantic.api", "import stac_pydantic"]
+)
+def test_lazy_import(statement):
+    times = import_times(statement)
+
+    # models, and their dependencies, are not imported until used
+    assert set(times) & {"stac_pydantic", "stac_pydantic.api"}
+    assert not any(
+        module.startswith("stac_pydantic.") and module != "stac_pydantic.api"
+        for module in times
+    )
+    assert "pydantic" not in times
+    assert "geojson_pydantic" not in times
+    assert own_time(times) < LAZY_IMPORT_BUDGET
+
+
+@pytest.mark.parametrize("defer_build", ["0", "1"])
+def test_models_import_budget(defer_build):
+    times = import_times(
+        "from stac_pydantic.api import Item, ItemCollection, Search",
+        env={"STAC_PYDANTIC_DEFER_BUILD": defer_build},
+    )
+
+    assert "stac_pydantic.api.item_collection" in times
+    assert "stac_pydantic.api.landing" not in times
+    assert own_time(times) < MODELS_IMPORT_BUDGET
+
+
+def test_lazy_attributes():
+    import stac_pydantic
+    import stac_pydantic.api
+
+    assert "Item" in dir(stac_pydantic)
+    assert "LandingPage" in dir(stac_pydantic.api)
+    assert stac_pydantic.Item is stac_pydantic.item.Item
+    assert stac_pydantic.api.Search is stac_pydantic.api.search.Search
+
+    with pytest.raises(AttributeError):
+        stac_pydantic.Unknown  # noqa: B018
+    with pytest.raises(AttributeError):
+        stac_pydantic.api.Unknown  # noqa: B018
+
+
+def test_submodule_attributes():
+    # In a new interpreter, where the submodules are not imported yet
+    code = (
+        "import stac_pydantic\n"
+        "import stac_pydantic.api as api\n"
+        "assert stac_pydantic.item.Item is stac_pydantic.Item\n"
+        "assert api.search.Search is api.Search\n"
+        "assert stac_pydantic.api is api\n"
+        "assert stac_pydantic.extensions.validate_extensions\n"
+        "for module, name in ((stac_pydantic, 'unknown'), (api, 'unknown')):\n"
+        "    assert not hasattr(module, name)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_deferred_build():
+    code = (
+        "from stac_pydantic import Item\n"
+        "assert not Item.__pydantic_complete__\n"
+        "from tests.conftest import request\n"
+        "Item.model_validate(request('example-landsat8_eo-extension.json'))\n"
+        "assert Item.__pydantic_complete__\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "STAC_PYDANTIC_DEFER_BUILD": "1"},
+    )
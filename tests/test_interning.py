@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+from stac_pydantic import Item
+from stac_pydantic.api import Item as ApiItem
+from stac_pydantic.interning import (
+    DEFAULT_POOL,
+    DEFAULT_POOL_SIZE,
+    InternPool,
+    intern_pool,
+)
+
+from .conftest import request
+
+EO_ITEM = "example-landsat8_eo-extension.json"
+
+
+def _copies(example, n=2):
+    # Decoded separately, so that the documents do not share any string
+    raw = json.dumps(request(example))
+    return [json.loads(raw) for _ in range(n)]
+
+
+def test_interned_items_match():
+    pool = InternPool()
+    for data in _copies(EO_ITEM):
+        assert Item.model_validate(data, context={"intern": pool}) == (
+            Item.model_validate(data)
+        )
+    assert len(pool) > 0
+
+
+def test_values_are_shared():
+    pool = InternPool()
+    first, second = (
+        Item.model_validate(data, context={"intern": pool}) for data in _copies(EO_ITEM)
+    )
+    assert first.stac_version is second.stac_version
+    assert first.collection is second.collection
+    assert first.stac_extensions[0] is second.stac_extensions[0]
+    assert first.links[0].rel is second.links[0].rel
+
+    (name,) = [key for key in first.assets if key == "B1"]
+    assert any(key is name for key in second.assets)
+    assert first.assets["B1"].type is second.assets["B1"].type
+
+    # Extra fields keep their names, shared too
+    first_keys = list(first.properties.model_extra)
+    assert all(a is b for a, b in zip(first_keys, second.properties.model_extra))
+    assert "eo:cloud_cover" in first_keys
+
+
+def test_not_shared_by_default():
+    first, second = (Item.model_validate(data) for data in _copies(EO_ITEM))
+    assert first.collection == second.collection
+    assert first.collection is not second.collection
+
+
+def test_default_pool():
+    first, second = (
+        Item.model_validate(data, context={"intern": True}) for data in _copies(EO_ITEM)
+    )
+    assert first.collection is second.collection
+    assert first.collection in DEFAULT_POOL
+
+
+def test_json():
+    pool = InternPool()
+    raw = json.dumps(request(EO_ITEM))
+    first, second = (
+        Item.model_validate_json(raw, context={"intern": pool}) for _ in range(2)
+    )
+    assert first == Item.model_validate_json(raw)
+    assert first.stac_extensions[0] is second.stac_extensions[0]
+
+
+def test_with_validation_level():
+    pool = InternPool()
+    data = request("itemcollection-sample-full.json")["features"][0]
+    data["stac_version"] = "1.0"
+    context = {"intern": pool, "validation_level": "fast"}
+    item = ApiItem.model_validate(data, context=context)
+    assert item.stac_version == "1.0"
+    assert item.links[0].rel in pool
+
+
+def test_pool():
+    pool = InternPool()
+    a, b = "".join(["a", "b"]), "".join(["a", "b"])
+    assert a is not b
+    assert pool(a) is a
+    assert pool(b) is a
+    assert len(pool) == 1
+    pool.clear()
+    assert len(pool) == 0
+
+
+@pytest.mark.parametrize(
+    "context, expected",
+    [
+        (None, None),
+        ({}, None),
+        ({"intern": False}, None),
+        ({"intern": True}, DEFAULT_POOL),
+    ],
+)
+def test_intern_pool(context, expected):
+    assert intern_pool(context) is expected
+
+
+def test_bounded_pool():
+    pool = InternPool(max_size=3)
+    values = [str(i) * 2 for i in range(3)]
+    assert [pool(v) for v in values] == values
+    assert len(pool) == 3
+    # Already pooled values are shared without growing the pool
+    assert pool("".join(["0", "0"])) is values[0]
+    assert len(pool) == 3
+
+    # Cleared once full
+    assert pool("33") == "33"
+    assert len(pool) == 1 and "00" not in pool
+    assert DEFAULT_POOL.max_size == DEFAULT_POOL_SIZE
+    assert InternPool().max_size is None
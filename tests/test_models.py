@@ -1,4 +1,5 @@
 import json
+from datetime import datetime, timedelta, timezone, tzinfo
 from typing import Literal
 
 import pytest
@@ -9,9 +10,9 @@ from stac_pydantic import Collection, Item, ItemProperties
 from stac_pydantic.collection import SpatialExtent, TimeInterval
 from stac_pydantic.extensions import _fetch_and_cache_schema, validate_extensions
 from stac_pydantic.links import Link, Links
-from stac_pydantic.shared import MimeTypes, StacCommonMetadata
+from stac_pydantic.shared import MimeTypes, StacCommonMetadata, str_to_datetimes
 
-from .conftest import dict_match, request
+from .conftest import UtcDatetimeAdapter, dict_match, request
 
 COLLECTION = "landsat-collection.json"
 ITEM_COLLECTION = "itemcollection-sample-full.json"
@@ -507,3 +508,47 @@ def test_spatial_intervals_invalid(bboxes) -> None:
 def test_spatial_intervals_valid(bboxes) -> None:
     """Check Spatial Interval model."""
     assert SpatialExtent(bbox=bboxes)
+
+
+class _Winter(tzinfo):
+    """A time zone at UTC in winter (without a fixed offset)."""
+
+    def utcoffset(self, dt):
+        return None if dt is None else timedelta(0)
+
+    def dst(self, dt):
+        return None if dt is None else timedelta(0)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-01T12:00:00Z",
+        "2024-01-01T12:00:00.123456Z",
+        "2024-01-01T12:00:00+00:00",
+        "2024-01-01T14:00:00+02:00",
+        "2024-01-01T07:00:00-05:00",
+        datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+        datetime(2024, 1, 1, 12, tzinfo=_Winter()),
+    ],
+)
+def test_utc_datetime(value) -> None:
+    validated = UtcDatetimeAdapter.validate_python(value)
+    assert validated == datetime(2024, 1, 1, 12, tzinfo=timezone.utc).replace(
+        microsecond=validated.microsecond
+    )
+    assert validated.utcoffset() == timedelta(0)
+    assert validated.tzinfo == timezone.utc
+    # Converted unless the offset is fixed (not a time zone with DST)
+    assert validated.tzinfo.utcoffset(None) == timedelta(0)
+    assert validated.isoformat().endswith("+00:00")
+
+
+def test_str_to_datetimes() -> None:
+    start, end = str_to_datetimes("2024-01-01T12:00:00Z/2024-01-01T14:00:00+02:00")
+    assert start == end == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert str_to_datetimes("../2024-01-01T12:00:00Z")[0] is None
+    # Parsed datetimes are cached
+    assert str_to_datetimes("2024-01-01T12:00:00Z")[0] is start
+    with pytest.raises(ValidationError):
+        str_to_datetimes("2024-01-01T12:00:00")
@@ -0,0 +1,175 @@
+import pytest
+from pydantic import ValidationError
+
+from stac_pydantic import Collection, Item
+from stac_pydantic.api import Item as ApiItem
+from stac_pydantic.patch import json_patch, merge_patch
+
+from .conftest import request
+
+EO_ITEM = "example-landsat8_eo-extension.json"
+DATETIME = "2021-01-01T02:00:00+02:00"
+
+
+def _item(model=Item):
+    if model is ApiItem:
+        return model.model_validate(
+            request("itemcollection-sample-full.json")["features"][0]
+        )
+    return model.model_validate(request(EO_ITEM))
+
+
+def test_merge_patch_matches_full_validation():
+    item = _item()
+    patch = {
+        "properties": {"datetime": DATETIME, "eo:cloud_cover": None},
+        "assets": {"B1": {"title": "Coastal"}, "ANG": None},
+    }
+    patched = item.apply_patch(patch)
+
+    data = request(EO_ITEM)
+    data["properties"]["datetime"] = DATETIME
+    del data["properties"]["eo:cloud_cover"]
+    data["assets"]["B1"]["title"] = "Coastal"
+    del data["assets"]["ANG"]
+    assert patched == Item.model_validate(data)
+    assert patched.model_dump() == Item.model_validate(data).model_dump()
+
+    # The original is unchanged
+    assert item == _item()
+
+
+def test_untouched_models_are_shared():
+    item = _item()
+    patched = item.apply_patch({"properties": {"datetime": DATETIME}})
+    assert patched.properties.datetime.isoformat() == "2021-01-01T00:00:00+00:00"
+    assert patched.geometry is item.geometry
+    assert patched.links is item.links
+    assert patched.assets["B1"] is item.assets["B1"]
+    assert patched.properties is not item.properties
+
+    patched = item.apply_patch({"assets": {"B1": {"title": "Coastal"}}})
+    assert patched.assets["B2"] is item.assets["B2"]
+    assert patched.assets["B1"] is not item.assets["B1"]
+    assert patched.properties is item.properties
+
+
+def test_json_patch():
+    item = _item()
+    patched = item.apply_patch(
+        [
+            {
+                "op": "test",
+                "path": "/properties/datetime",
+                "value": "2018-10-01T01:08:32.033000Z",
+            },
+            {"op": "replace", "path": "/properties/datetime", "value": DATETIME},
+            {
+                "op": "add",
+                "path": "/links/-",
+                "value": {"rel": "via", "href": "https://example.com"},
+            },
+            {
+                "op": "add",
+                "path": "/links/0",
+                "value": {"rel": "license", "href": "https://example.com"},
+            },
+            {"op": "remove", "path": "/assets/ANG"},
+            {"op": "copy", "from": "/assets/B1", "path": "/assets/B1~1copy"},
+            {
+                "op": "move",
+                "from": "/properties/eo:cloud_cover",
+                "path": "/properties/cloud",
+            },
+        ]
+    )
+    assert patched.properties.datetime.isoformat() == "2021-01-01T00:00:00+00:00"
+    assert patched.links[0].rel == "license"
+    assert patched.links[-1].rel == "via"
+    assert len(patched.links) == len(item.links) + 2
+    assert "ANG" not in patched.assets
+    assert patched.assets["B1/copy"] == item.assets["B1"]
+    assert (
+        patched.properties.model_extra["cloud"]
+        == item.properties.model_extra["eo:cloud_cover"]
+    )
+    assert "eo:cloud_cover" not in patched.properties.model_extra
+    assert patched.links[1] is item.links[0]
+
+
+@pytest.mark.parametrize(
+    "patch, message",
+    [
+        ([{"op": "test", "path": "/id", "value": "other"}], "Test of '/id' failed"),
+        ([{"op": "remove", "path": "/properties/missing"}], "does not exist"),
+        ([{"op": "replace", "path": "/links/10", "value": {}}], "out of range"),
+        ([{"op": "add", "path": "/links/01", "value": {}}], "Invalid array index"),
+        ([{"op": "add", "path": "properties", "value": {}}], "Invalid JSON pointer"),
+        ([{"op": "add", "path": "", "value": {}}], "whole document"),
+        ([{"op": "add", "path": "/id/a", "value": 1}], "does not exist"),
+        ([{"op": "remove"}], "Missing path"),
+        ([{"op": "unknown", "path": "/id"}], "Invalid JSON Patch operation"),
+    ],
+)
+def test_invalid_json_patch(patch, message):
+    with pytest.raises(ValueError, match=message):
+        _item().apply_patch(patch)
+
+
+@pytest.mark.parametrize(
+    "patch, message",
+    [
+        # Cross-field validators of the touched models run again
+        ({"properties": {"start_datetime": DATETIME}}, "requires the use of the other"),
+        (
+            [{"op": "replace", "path": "/properties/datetime", "value": None}],
+            "must be specified when datetime is null",
+        ),
+        ({"bbox": None}, "bbox is required if geometry is not null"),
+        (
+            {
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1]]],
+                }
+            },
+            "same start and end coordinates",
+        ),
+        ({"assets": {"B1": {"href": ""}}}, "at least 1 character"),
+    ],
+)
+def test_patched_subtrees_are_validated(patch, message):
+    with pytest.raises(ValidationError, match=message) as e:
+        _item().apply_patch(patch)
+    assert e.value.title == "Item"
+
+
+def test_api_item_links():
+    item = _item(ApiItem)
+    with pytest.raises(ValidationError, match="must include a `Relations.self` link"):
+        item.apply_patch([{"op": "remove", "path": "/links/0"}])
+
+
+def test_collection():
+    collection = Collection.model_validate(request("landsat-collection.json"))
+    patched = collection.apply_patch({"title": "Landsat", "keywords": None})
+    assert patched.title == "Landsat"
+    assert patched.keywords is None
+    assert patched.extent is collection.extent
+
+
+def test_functions():
+    assert merge_patch(
+        {"a": {"b": 1, "c": 2}}, {"a": {"b": None, "d": 3}, "e": [1]}
+    ) == {
+        "a": {"c": 2, "d": 3},
+        "e": [1],
+    }
+    assert merge_patch({"a": 1}, [1]) == [1]
+    assert merge_patch(1, {"a": 1}) == {"a": 1}
+
+    document = {"a": [1, 2]}
+    assert json_patch(document, [{"op": "add", "path": "/a/1", "value": 3}]) == {
+        "a": [1, 3, 2]
+    }
+    assert document == {"a": [1, 2]}
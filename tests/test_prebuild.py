@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import Future
+
+import pytest
+from pydantic import BaseModel
+
+from stac_pydantic import Item, warmup
+from stac_pydantic.api import Item as ApiItem
+from stac_pydantic.api.search import ExtendedSearch
+from stac_pydantic.extensions import _load_and_cache_schema
+from stac_pydantic.prebuild import SAMPLES, VALIDATORS, default_models
+from stac_pydantic.trusted import fast_validator, trusted_validator
+
+
+@pytest.mark.parametrize("model", default_models())
+def test_samples_are_valid(model):
+    report = warmup([model])
+    steps = {step.split(":")[1] for step in report.timings}
+    assert steps == {"build", "validate", "validate_json", "dump", "dump_json"}
+    assert report.total >= 0
+
+
+def test_warmup_defaults():
+    report = warmup()
+    assert "item.Item:validate" in report.timings
+    assert "api.item.Item:dump_json" in report.timings
+    assert "api.search.ExtendedSearch:validate" in report.timings
+
+
+def test_warmup_background(tmp_path):
+    schema = tmp_path / "example.com" / "schema.json"
+    schema.parent.mkdir()
+    schema.write_text(json.dumps({"type": "object"}))
+    _load_and_cache_schema.cache_clear()
+
+    future = warmup(
+        [Item, ExtendedSearch],
+        background=True,
+        extension_schemas=["https://example.com/schema.json"],
+        schema_dir=str(tmp_path),
+    )
+    assert isinstance(future, Future)
+    report = future.result(timeout=30)
+    assert "schema:https://example.com/schema.json" in report.timings
+    assert _load_and_cache_schema.cache_info().currsize == 1
+
+
+def test_warmup_background_error(tmp_path):
+    future = warmup(
+        [ApiItem],
+        background=True,
+        extension_schemas=["https://example.com/missing.json"],
+        schema_dir=str(tmp_path),
+    )
+    with pytest.raises(FileNotFoundError):
+        future.result(timeout=30)
+
+
+def test_warmup_without_sample():
+    class Unknown(BaseModel):
+        value: int = 0
+
+    report = warmup([Unknown])
+    assert [step.split(":")[1] for step in report.timings] == ["build"]
+    assert "Item" in SAMPLES
+
+
+def test_warmup_validators():
+    fast_validator.cache_clear()
+    trusted_validator.cache_clear()
+    report = warmup([Item, ApiItem], validators=VALIDATORS)
+    for name in ("item.Item", "api.item.Item"):
+        for validator in VALIDATORS:
+            assert f"{name}:{validator}" in report.timings
+    assert fast_validator.cache_info().currsize == 2
+    assert trusted_validator.cache_info().currsize == 2
+    # Already built
+    warmup([Item], validators=["fast"])
+    assert fast_validator.cache_info().hits >= 1
+
+    with pytest.raises(ValueError, match="Unknown validators \\['slow'\\]"):
+        warmup([Item], validators=["fast", "slow"])
+
+
+def test_warmup_builds_deferred_models():
+    code = (
+        "from stac_pydantic import Item, warmup\n"
+        "assert not Item.__pydantic_complete__\n"
+        "warmup([Item])\n"
+        "assert Item.__pydantic_complete__\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "STAC_PYDANTIC_DEFER_BUILD": "1"},
+    )
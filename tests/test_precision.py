@@ -0,0 +1,206 @@
+import json
+import math
+import random
+
+import pytest
+
+from stac_pydantic import Item, ItemCollection, precision
+from stac_pydantic.bbox import bbox_covers, geometry_bbox
+from stac_pydantic.precision import (
+    reduce_coordinates,
+    reduce_geometry,
+    round_bbox,
+    round_lines,
+    serialization_precision,
+    simplify_line,
+)
+
+from .conftest import request
+
+
+@pytest.mark.parametrize(
+    "geometry_type,coordinates,expected",
+    [
+        ("Point", [1.23456, -2.34567], [1.23, -2.35]),
+        ("Point", [1.23456, -2.34567, 10.005], [1.23, -2.35, 10.01]),
+        ("MultiPoint", [[1.111, 2.222], [3.333, 4.444]], [[1.11, 2.22], [3.33, 4.44]]),
+        ("LineString", [[0.001, 0.009], [1, 2]], [[0.0, 0.01], [1.0, 2.0]]),
+        (
+            "MultiLineString",
+            [[[0.001, 0.009], [1, 2]], [[1.555, 2], [3, 4]]],
+            [[[0.0, 0.01], [1.0, 2.0]], [[1.56, 2.0], [3.0, 4.0]]],
+        ),
+        (
+            "Polygon",
+            [[[0, 0], [1.004, 0], [1.004, 1.006], [0, 0]]],
+            [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.01], [0.0, 0.0]]],
+        ),
+        (
+            "MultiPolygon",
+            [[[[0, 0], [1.004, 0], [1.004, 1.006], [0, 0]]], []],
+            [[[[0.0, 0.0], [1.0, 0.0], [1.0, 1.01], [0.0, 0.0]]], []],
+        ),
+        ("MultiPoint", [], []),
+    ],
+)
+def test_reduce_coordinates(geometry_type, coordinates, expected):
+    assert reduce_coordinates(geometry_type, coordinates, 2) == expected
+    # Without a precision, unchanged
+    assert reduce_coordinates(geometry_type, coordinates) == coordinates
+
+    with pytest.raises(ValueError, match="Unknown geometry type"):
+        reduce_coordinates("Circle", [0, 0], 2)
+
+
+@pytest.mark.parametrize(
+    "bbox,digits,expected",
+    [
+        ([0.12345, 0.5, 1.55555, 0.7], 2, [0.12, 0.5, 1.56, 0.7]),
+        ([-1.001, -1.009, 1.001, 1.009], 2, [-1.01, -1.01, 1.01, 1.01]),
+        ([0.3, 0, 0, 0.7, 1, 10.01], 1, [0.3, 0.0, 0.0, 0.7, 1.0, 10.1]),
+        ([170.55, -5, -170.55, 5], 1, [170.5, -5.0, -170.5, 5.0]),
+        ([123.4, 0, 155, 1], -1, [120.0, 0.0, 160.0, 10.0]),
+        ([0, math.nan, 1, math.inf], 1, [0.0, math.nan, 1.0, math.inf]),
+    ],
+)
+def test_round_bbox(bbox, digits, expected):
+    rounded = round_bbox(bbox, digits)
+    assert [str(v) for v in rounded] == [str(v) for v in expected]
+
+
+def _ring(size, noise, seed=0):
+    rng = random.Random(seed)
+    ring = [
+        [
+            math.cos(2 * math.pi * i / (size - 1)) + rng.uniform(-noise, noise),
+            math.sin(2 * math.pi * i / (size - 1)) + rng.uniform(-noise, noise),
+        ]
+        for i in range(size - 1)
+    ]
+    return ring + [ring[0]]
+
+
+def test_simplify_line():
+    line = [[0, 0], [1, 0.001], [2, -0.001], [3, 0], [3, 1], [3.5, 1.0001], [4, 1]]
+    assert simplify_line(line, 0.01) == [[0, 0], [3, 0], [3, 1], [4, 1]]
+    assert simplify_line(line, 0.0001) == line[:5] + [line[6]]
+    assert simplify_line(line, 0) == line
+    assert simplify_line(line, 10) == [[0, 0], [4, 1]]
+    assert simplify_line(line, 10, minimum=4) is line
+
+    # Closed rings keep their first position, and at least 4 positions
+    ring = _ring(9, 0)
+    simplified = simplify_line(ring, 0.5, minimum=4)
+    assert simplified[0] == simplified[-1] == ring[0]
+    assert len(simplified) == 5
+    assert simplify_line(ring, 2, minimum=4) is ring
+
+
+@pytest.mark.parametrize("size", [300, 3000])
+@pytest.mark.parametrize("tolerance", [1e-4, 1e-2, 0.5])
+def test_simplify_line_numpy(monkeypatch, size, tolerance):
+    ring = _ring(size, 1e-3, seed=size)
+    with_numpy = simplify_line(ring, tolerance, minimum=4)
+    assert 4 <= len(with_numpy) < size
+    monkeypatch.setattr(precision, "NUMPY_MIN_POSITIONS", 10**9)
+    assert simplify_line(ring, tolerance, minimum=4) == with_numpy
+
+
+def test_round_lines_numpy(monkeypatch):
+    lines = [_ring(200, 1e-3, seed=i) for i in range(3)]
+    with_numpy = round_lines(lines, 4)
+    monkeypatch.setattr(precision, "NUMPY_MIN_POSITIONS", 10**9)
+    assert round_lines(lines, 4) == with_numpy
+
+    # Positions of different dimensions are rounded in Python
+    monkeypatch.setattr(precision, "NUMPY_MIN_POSITIONS", 0)
+    lines[0][1] = [0.123456, 0.123456, 12.345678]
+    rounded = round_lines(lines, 4)
+    assert rounded[0][1] == [0.1235, 0.1235, 12.3457]
+    assert rounded[1:] == with_numpy[1:]
+
+
+def test_reduce_geometry():
+    geometry = {
+        "type": "GeometryCollection",
+        "geometries": [
+            {"type": "Point", "coordinates": [1.23456, 2.34567]},
+            {
+                "type": "LineString",
+                "coordinates": [[0, 0], [1, 0.00001], [2.00001, 0]],
+                "bbox": [0, 0, 2.00001, 0.00001],
+            },
+        ],
+    }
+    assert reduce_geometry(geometry, 3, 0.001) == {
+        "type": "GeometryCollection",
+        "geometries": [
+            {"type": "Point", "coordinates": [1.235, 2.346]},
+            {
+                "type": "LineString",
+                "coordinates": [[0.0, 0.0], [2.0, 0.0]],
+                "bbox": [0.0, 0.0, 2.001, 0.001],
+            },
+        ],
+    }
+    assert geometry["geometries"][1]["coordinates"][1] == [1, 0.00001]
+    assert reduce_geometry(None, 3) is None
+
+
+def test_serialization_precision():
+    assert serialization_precision(None) == (None, None)
+    assert serialization_precision({"precision": 6}) == (6, None)
+    assert serialization_precision({"simplify": 0}) == (None, None)
+    assert serialization_precision({"precision": 0, "simplify": 0.1}) == (0, 0.1)
+    for context in ({"precision": "6"}, {"precision": 1.5}, {"precision": True}):
+        with pytest.raises(ValueError, match="Invalid precision"):
+            serialization_precision(context)
+    for context in ({"simplify": -1}, {"simplify": "1"}):
+        with pytest.raises(ValueError, match="Invalid simplify tolerance"):
+            serialization_precision(context)
+
+
+def test_item_dump_precision():
+    data = request("example-landsat8_eo-extension.json")
+    data["bbox"] = list(geometry_bbox(data["geometry"]))
+    item = Item.model_validate(data)
+
+    dumped = item.model_dump(context={"precision": 3})
+    assert dumped["bbox"] == round_bbox(data["bbox"], 3)
+    # Within half a step of 0.001
+    for position, original in zip(
+        dumped["geometry"]["coordinates"][0], data["geometry"]["coordinates"][0]
+    ):
+        assert position == pytest.approx(original, abs=0.0005 + 1e-12)
+        assert [str(round(c, 3)) for c in position] == [str(c) for c in position]
+    assert bbox_covers(dumped["bbox"], geometry_bbox(dumped["geometry"]))
+    assert json.loads(
+        item.model_dump_json(context={"precision": 3})
+    ) == item.model_dump(mode="json", context={"precision": 3})
+    # Other values and the model are unchanged
+    assert dumped["properties"] == item.model_dump()["properties"]
+    assert item.model_dump() == item.model_dump(context={"other": 1})
+    assert list(item.bbox) == data["bbox"]
+
+    without_geometry = Item.model_validate(dict(data, geometry=None, bbox=None))
+    assert without_geometry.model_dump(context={"precision": 3})["geometry"] is None
+
+    with pytest.raises(ValueError, match="Invalid precision"):
+        item.model_dump_json(context={"precision": "3"})
+
+
+def test_item_collection_dump_precision():
+    ring = _ring(1000, 1e-6)
+    geometry = {"type": "Polygon", "coordinates": [ring]}
+    data = request("example-landsat8_eo-extension.json")
+    data.update(geometry=geometry, bbox=geometry_bbox(geometry))
+    collection = ItemCollection(type="FeatureCollection", features=[data, data])
+
+    full = collection.model_dump_json()
+    reduced = collection.model_dump_json(context={"precision": 5, "simplify": 1e-4})
+    assert len(reduced) < len(full) / 2
+    for feature in json.loads(reduced)["features"]:
+        coordinates = feature["geometry"]["coordinates"][0]
+        assert 4 <= len(coordinates) < len(ring)
+        assert coordinates[0] == coordinates[-1]
+        assert bbox_covers(feature["bbox"], geometry_bbox(feature["geometry"]))
@@ -0,0 +1,99 @@
+import pytest
+
+from stac_pydantic import Item, ItemCollection
+from stac_pydantic.api import Item as ApiItem
+from stac_pydantic.profiling import profile_validators, time_fields
+
+from .conftest import request
+
+EO_EXTENSION = "example-landsat8_eo-extension.json"
+
+
+def test_profile_validators():
+    item = request(EO_EXTENSION)
+
+    with profile_validators() as profile:
+        Item.model_validate(item).model_dump()
+        ItemCollection(type="FeatureCollection", features=[item, item]).model_dump()
+
+    assert profile.stats["item.Item.validate_bbox"].calls == 3
+    assert profile.stats["item.Item._serialize"].calls == 3
+    assert profile.stats["shared.StacCommonMetadata.validate_start_end"].calls == 3
+    assert profile.stats["shared.StacCommonMetadata.include_datetime_null"].calls == 3
+    assert all(stats.seconds > 0 for stats in profile.stats.values())
+    assert "item.Item.validate_bbox" in profile.report()
+
+    # validators are restored when leaving the context
+    Item.model_validate(item)
+    assert profile.stats["item.Item.validate_bbox"].calls == 3
+
+
+@pytest.mark.parametrize(
+    "context", [{"validation_level": "fast"}, {"intern": True}], ids=["fast", "intern"]
+)
+def test_profile_validators_compiled_validators(context):
+    item = request(EO_EXTENSION)
+    # Compiled before the context
+    Item.model_validate(item, context=context)
+
+    with profile_validators() as profile:
+        Item.model_validate(item, context=context)
+    assert profile.stats["item.Item.validate_bbox"].calls == 1
+
+    # Compiled in the context, and not kept after it
+    Item.model_validate(item, context=context)
+    assert profile.stats["item.Item.validate_bbox"].calls == 1
+
+
+def test_profile_validators_subclass():
+    item = request(EO_EXTENSION)
+    item["links"] = [
+        {"rel": "self", "href": "https://example.com/items/1"},
+        {"rel": "root", "href": "https://example.com"},
+        {"rel": "collection", "href": "https://example.com/collections/1"},
+    ]
+
+    with profile_validators(names=["required_links"]) as profile:
+        ApiItem.model_validate(item)
+
+    assert list(profile.stats) == ["api.item.Item.required_links"]
+    assert profile.stats["api.item.Item.required_links"].calls == 1
+
+
+def test_profile_validators_errors():
+    item = request(EO_EXTENSION)
+    item["bbox"] = None
+
+    with profile_validators() as profile:
+        with pytest.raises(RuntimeError):
+            with profile_validators():
+                pass
+
+        with pytest.raises(ValueError):
+            Item.model_validate(item)
+
+    # failed calls are recorded too
+    assert profile.stats["item.Item.validate_bbox"].calls == 1
+
+    with profile_validators() as profile:
+        pass
+    assert profile.stats == {}
+
+
+def test_time_fields():
+    item = request(EO_EXTENSION)
+    timings = time_fields(Item, item, number=2)
+
+    assert timings.total > 0
+    assert set(timings.fields) == {
+        "type",
+        "id",
+        "geometry",
+        "bbox",
+        "properties",
+        "assets",
+        "links",
+        "stac_version",
+        "stac_extensions",
+        "collection",
+    }
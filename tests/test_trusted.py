@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from stac_pydantic import Collection, Item, ItemCollection
+from stac_pydantic.api import Item as ApiItem
+from stac_pydantic.api import ItemCollection as ApiItemCollection
+from stac_pydantic.trusted import trusted_validator
+
+from .conftest import request
+
+
+@pytest.mark.parametrize(
+    "example, model",
+    [
+        ("example-landsat8_eo-extension.json", Item),
+        ("example-item_geometry-null.json", Item),
+        ("datetimerange.json", Item),
+        ("example-autzen.json", Item),
+        ("sentinel1_sar-extension.json", Item),
+        ("landsat-collection.json", Collection),
+        ("example-collection_version-extension.json", Collection),
+        ("itemcollection-sample-full.json", ItemCollection),
+        ("example-search.json", ItemCollection),
+        ("itemcollection-sample-full.json", ApiItemCollection),
+    ],
+)
+def test_from_trusted_matches_validation(example, model):
+    data = request(example)
+    trusted = model.from_trusted(data)
+    assert type(trusted) is model
+    assert trusted == model.model_validate(data)
+    assert trusted.model_dump_json() == model.model_validate(data).model_dump_json()
+    assert trusted.model_fields_set == model.model_validate(data).model_fields_set
+
+
+def test_from_trusted_nested_models():
+    data = request("itemcollection-sample-full.json")
+    item = ApiItemCollection.from_trusted(data).features[0]
+    assert isinstance(item, ApiItem)
+    assert item.properties.datetime.tzinfo is not None
+    assert item.geometry.type == "Polygon"
+    assert isinstance(item.geometry.coordinates[0][0], tuple)
+    assert item.links[0].rel == "self"
+    assert item.assets["analytic"].href
+
+
+def test_from_trusted_skips_validation():
+    data = request("example-landsat8_eo-extension.json")
+    data["stac_version"] = "not a version"
+    data["bbox"] = [180, 90, -180, -90]
+    data["links"] = []
+
+    item = ApiItem.from_trusted(data)
+    assert item.stac_version == "not a version"
+    assert item.bbox == (180.0, 90.0, -180.0, -90.0)
+
+    with pytest.raises(ValidationError):
+        ApiItem.model_validate(data)
+    with pytest.raises(ValidationError):
+        ApiItem.from_trusted(data, spot_check=1.0)
+
+
+def test_trusted_validator_is_cached():
+    assert trusted_validator(Item) is trusted_validator(Item)
+
+
+def test_from_trusted_deferred_build():
+    code = (
+        "from stac_pydantic import Item\n"
+        "assert not Item.__pydantic_complete__\n"
+        "from tests.conftest import request\n"
+        "Item.from_trusted(request('example-landsat8_eo-extension.json'))\n"
+        "assert Item.__pydantic_complete__\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "STAC_PYDANTIC_DEFER_BUILD": "1"},
+    )
+
+
+def test_from_trusted_skips_nested_checks():
+    data = request("itemcollection-sample-full.json")
+    data["features"][0]["geometry"]["coordinates"][0].pop()
+
+    item_collection = ApiItemCollection.from_trusted(data)
+    assert item_collection.features[0].geometry.type == "Polygon"
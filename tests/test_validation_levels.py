@@ -0,0 +1,105 @@
+import pytest
+from pydantic import ValidationError
+
+from stac_pydantic import Collection, Item
+from stac_pydantic.api import Item as ApiItem
+from stac_pydantic.api import ItemCollection as ApiItemCollection
+from stac_pydantic.shared import ValidationLevel
+
+from .conftest import request
+
+EO_ITEM = "example-landsat8_eo-extension.json"
+LEVELS = [level.value for level in ValidationLevel]
+
+
+def _validate(model, data, level):
+    return model.model_validate(data, context={"validation_level": level})
+
+
+@pytest.mark.parametrize("level", LEVELS)
+@pytest.mark.parametrize(
+    "example, model",
+    [
+        (EO_ITEM, Item),
+        ("sentinel1_sar-extension.json", Item),
+        ("landsat-collection.json", Collection),
+        ("itemcollection-sample-full.json", ApiItemCollection),
+    ],
+)
+def test_levels_match_for_valid_data(example, model, level):
+    data = request(example)
+    assert _validate(model, data, level) == model.model_validate(data)
+
+
+def test_default_level_is_standard():
+    data = request(EO_ITEM)
+    data["stac_version"] = "1.0"
+    with pytest.raises(ValidationError) as e:
+        Item.model_validate(data)
+    assert e.value.errors()[0]["type"] == "string_pattern_mismatch"
+
+    with pytest.raises(ValidationError):
+        _validate(Item, data, "standard")
+
+
+def test_fast_skips_semantic_checks():
+    data = request("itemcollection-sample-full.json")["features"][0]
+    data["stac_version"] = "1.0"
+    data["geometry"]["coordinates"][0].pop()
+    data["links"] = []
+
+    with pytest.raises(ValidationError) as e:
+        ApiItem.model_validate(data)
+    assert len(e.value.errors()) == 2
+
+    item = _validate(ApiItem, data, ValidationLevel.fast)
+    assert item.stac_version == "1.0"
+    assert item.geometry.type == "Polygon"
+    assert item.links.root == []
+
+
+def test_fast_keeps_structural_checks():
+    data = request(EO_ITEM)
+    data["geometry"] = {"type": "Polygon", "coordinates": "invalid"}
+    data["properties"]["datetime"] = "not a datetime"
+    del data["id"]
+
+    with pytest.raises(ValidationError) as e:
+        _validate(Item, data, "fast")
+    locations = {error["loc"][0] for error in e.value.errors()}
+    assert locations == {"geometry", "properties", "id"}
+
+
+def test_fast_caches_extension_urls():
+    data = request(EO_ITEM)
+    first = _validate(Item, data, "fast")
+    second = _validate(Item, data, "fast")
+    assert first.stac_extensions[0] is second.stac_extensions[0]
+    assert Item.model_validate(data).stac_extensions == first.stac_extensions
+
+
+def test_strict_checks_datetime_range():
+    data = request("sentinel1_sar-extension.json")
+    props = data["properties"]
+    props["start_datetime"], props["end_datetime"] = (
+        props["end_datetime"],
+        props["start_datetime"],
+    )
+
+    Item.model_validate(data)
+    with pytest.raises(ValidationError, match="start_datetime must not be after"):
+        _validate(Item, data, "strict")
+
+
+def test_strict_checks_duplicated_extensions():
+    data = request(EO_ITEM)
+    data["stac_extensions"] = data["stac_extensions"] * 2
+
+    Item.model_validate(data)
+    with pytest.raises(ValidationError, match="must not contain duplicates"):
+        _validate(Item, data, "strict")
+
+
+def test_invalid_level():
+    with pytest.raises(ValidationError):
+        _validate(Item, request(EO_ITEM), "unknown")
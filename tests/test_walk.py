@@ -0,0 +1,165 @@
+import json
+
+import pytest
+
+from stac_pydantic import Catalog, Collection, Item, ItemCollection, api, catalog_walk
+from stac_pydantic.walk import detect_model
+
+from .conftest import request
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def static_catalog(tmp_path):
+    catalog = {
+        "type": "Catalog",
+        "stac_version": "1.0.0",
+        "id": "root",
+        "description": "root catalog",
+        "links": [
+            {"rel": "root", "href": "./catalog.json"},
+            {"rel": "child", "href": "./landsat-8-l1/collection.json"},
+            {"rel": "child", "href": "https://example.com/remote/catalog.json"},
+        ],
+    }
+    collection = request("landsat-collection.json")
+    collection["links"] = [
+        {"rel": "root", "href": "../catalog.json"},
+        {"rel": "parent", "href": "../catalog.json"},
+        # cycles are only visited once
+        {"rel": "child", "href": "../catalog.json"},
+        {"rel": "item", "href": "./item-1/item-1.json"},
+        {"rel": "item", "href": "./item-2/item-2.json"},
+    ]
+    item = request("example-landsat8_eo-extension.json")
+    item["links"] = [{"rel": "root", "href": "../../catalog.json"}]
+
+    _write(tmp_path / "catalog.json", catalog)
+    _write(tmp_path / "landsat-8-l1" / "collection.json", collection)
+    _write(tmp_path / "landsat-8-l1" / "item-1" / "item-1.json", item)
+    invalid = dict(item, id="item-2", bbox=None)
+    _write(tmp_path / "landsat-8-l1" / "item-2" / "item-2.json", invalid)
+
+    return tmp_path / "catalog.json"
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_catalog_walk(static_catalog, use_processes):
+    results = {
+        r.path: r
+        for r in catalog_walk(
+            str(static_catalog), max_workers=2, use_processes=use_processes
+        )
+    }
+    root = static_catalog.parent
+    assert set(results) == {
+        str(root / "catalog.json"),
+        str(root / "landsat-8-l1" / "collection.json"),
+        str(root / "landsat-8-l1" / "item-1" / "item-1.json"),
+        str(root / "landsat-8-l1" / "item-2" / "item-2.json"),
+    }
+
+    assert isinstance(results[str(root / "catalog.json")].model, Catalog)
+    collection = results[str(root / "landsat-8-l1" / "collection.json")]
+    assert collection.valid
+    assert isinstance(collection.model, Collection)
+    item = results[str(root / "landsat-8-l1" / "item-1" / "item-1.json")]
+    assert item.type == "Feature"
+    assert isinstance(item.model, Item)
+
+    invalid = results[str(root / "landsat-8-l1" / "item-2" / "item-2.json")]
+    assert not invalid.valid
+    assert invalid.model is None
+    assert "bbox is required" in invalid.error
+
+
+def test_catalog_walk_errors(tmp_path):
+    _write(
+        tmp_path / "catalog.json",
+        {
+            "type": "Catalog",
+            "id": "root",
+            "links": [
+                {"rel": "child", "href": "missing/catalog.json"},
+                {"rel": "child", "href": "unknown/catalog.json"},
+            ],
+        },
+    )
+    _write(tmp_path / "unknown" / "catalog.json", {"type": "Unknown"})
+
+    results = {r.path: r for r in catalog_walk(str(tmp_path / "catalog.json"))}
+
+    assert len(results) == 3
+    assert not any(r.valid for r in results.values())
+    # Children are still crawled when a catalog is invalid
+    assert results[str(tmp_path / "catalog.json")].type == "Catalog"
+    assert results[str(tmp_path / "unknown" / "catalog.json")].error == (
+        "Unknown STAC object type"
+    )
+
+
+def test_catalog_walk_early_exit(static_catalog):
+    walker = catalog_walk(str(static_catalog), max_workers=1, max_pending=1)
+    first = next(walker)
+    assert first.path == str(static_catalog)
+    walker.close()
+
+
+@pytest.mark.parametrize(
+    "infile,api,model",
+    [
+        ("landsat-collection.json", False, Collection),
+        ("landsat-collection.json", True, api.Collection),
+        ("example-landsat8_eo-extension.json", False, Item),
+        ("example-landsat8_eo-extension.json", True, api.Item),
+        ("itemcollection-sample-full.json", False, ItemCollection),
+        ("itemcollection-sample-full.json", True, api.ItemCollection),
+        ("example-collection-list.json", False, None),
+        ("example-collection-list.json", True, api.Collections),
+    ],
+)
+def test_detect_model(infile, api, model):
+    assert detect_model(request(infile), api=api) is model
+
+
+def test_detect_model_api_structure():
+    assert detect_model({"conformsTo": []}, api=True) is api.Conformance
+    landing = {"type": "Catalog", "conformsTo": []}
+    assert detect_model(landing, api=True) is api.LandingPage
+    assert detect_model(landing) is Catalog
+    assert detect_model({"type": "Catalog"}, api=True) is Catalog
+    assert detect_model([], api=True) is None
+
+
+def test_catalog_walk_queues_links_lazily(tmp_path):
+    item = request("example-landsat8_eo-extension.json")
+    item["links"] = []
+    count = 50
+    links = [{"rel": "item", "href": f"./item-{i}.json"} for i in range(count)]
+    _write(
+        tmp_path / "catalog.json",
+        {
+            "type": "Catalog",
+            "stac_version": "1.0.0",
+            "id": "root",
+            "description": "root catalog",
+            "links": links,
+        },
+    )
+    for i in range(count):
+        _write(tmp_path / f"item-{i}.json", dict(item, id=f"item-{i}"))
+
+    walker = catalog_walk(str(tmp_path / "catalog.json"), max_workers=1, max_pending=2)
+    assert next(walker).type == "Catalog"
+    next(walker)
+    # One iterator over the links of the catalog, not a path per link
+    stack = walker.gi_frame.f_locals["stack"]
+    assert len(stack) == 1
+    assert not isinstance(stack[0], (list, str))
+    walker.close()
+
+    assert len(list(catalog_walk(str(tmp_path / "catalog.json")))) == count + 1
@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from stac_pydantic import Catalog, Collection, Item, catalog_walk
+from stac_pydantic.writer import CatalogNode, write_catalog
+
+from .conftest import request
+
+
+@pytest.fixture
+def catalog_tree():
+    catalog = Catalog(
+        type="Catalog",
+        id="root",
+        description="root catalog",
+        links=[{"rel": "license", "href": "https://example.com/license"}],
+    )
+    collection = Collection(**request("landsat-collection.json"))
+    item = request("example-landsat8_eo-extension.json")
+    items = [Item(**dict(item, id=f"item-{i}")) for i in range(10)]
+
+    return CatalogNode(
+        stac_object=catalog,
+        children=[CatalogNode(stac_object=collection, items=items)],
+    )
+
+
+def _links(path):
+    with open(path) as f:
+        return {link["rel"]: link["href"] for link in json.load(f)["links"]}
+
+
+def test_write_catalog_relative(tmp_path, catalog_tree):
+    stats = write_catalog(catalog_tree, str(tmp_path), max_workers=4)
+
+    assert stats.files == 12
+    assert stats.bytes > 0
+    assert stats.files_per_second > 0
+    assert stats.bytes_per_second > 0
+    # no temporary files are left behind
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    collection_dir = tmp_path / "landsat-8-l1"
+    assert _links(tmp_path / "catalog.json") == {
+        "root": "./catalog.json",
+        "child": "./landsat-8-l1/collection.json",
+        "license": "https://example.com/license",
+    }
+    collection_links = _links(collection_dir / "collection.json")
+    assert collection_links["root"] == "../catalog.json"
+    assert collection_links["parent"] == "../catalog.json"
+    assert "self" not in collection_links
+
+    item_links = _links(collection_dir / "item-0" / "item-0.json")
+    assert item_links == {
+        "root": "../../catalog.json",
+        "parent": "../collection.json",
+        "collection": "../collection.json",
+    }
+
+    # the written catalog can be crawled back and is valid
+    results = list(catalog_walk(str(tmp_path / "catalog.json")))
+    assert len(results) == 12
+    assert all(result.valid for result in results)
+
+    # input models are left untouched
+    assert catalog_tree.children[0].items[0].links[0].rel == "self"
+
+
+def test_write_catalog_absolute(tmp_path, catalog_tree):
+    write_catalog(
+        catalog_tree,
+        str(tmp_path),
+        link_type="absolute",
+        base_url="https://example.com/stac/",
+    )
+
+    item_links = _links(tmp_path / "landsat-8-l1" / "item-3" / "item-3.json")
+    assert item_links == {
+        "self": "https://example.com/stac/landsat-8-l1/item-3/item-3.json",
+        "root": "https://example.com/stac/catalog.json",
+        "parent": "https://example.com/stac/landsat-8-l1/collection.json",
+        "collection": "https://example.com/stac/landsat-8-l1/collection.json",
+    }
+
+
+def test_write_catalog_default_base_url(tmp_path, catalog_tree):
+    write_catalog(catalog_tree, str(tmp_path), link_type="absolute")
+    assert _links(tmp_path / "catalog.json")["self"] == (
+        (tmp_path / "catalog.json").as_uri()
+    )
+
+
+def test_write_catalog_invalid_link_type(tmp_path, catalog_tree):
+    with pytest.raises(ValueError):
+        write_catalog(catalog_tree, str(tmp_path), link_type="self-contained")
+
+
+@pytest.mark.parametrize("stac_id", ["..", ".", "a/b", "../../outside", "a\\b"])
+def test_write_catalog_invalid_ids(tmp_path, catalog_tree, stac_id):
+    collection = catalog_tree.children[0]
+    collection.items[-1] = collection.items[-1].model_copy(update={"id": stac_id})
+    with pytest.raises(ValueError, match="Feature id .* is not a valid path segment"):
+        write_catalog(catalog_tree, str(tmp_path / "out"))
+    # Nothing written
+    assert not (tmp_path / "out").exists()
+
+    collection.items.pop()
+    collection.stac_object = collection.stac_object.model_copy(update={"id": stac_id})
+    with pytest.raises(ValueError, match="Collection id"):
+        write_catalog(catalog_tree, str(tmp_path / "out"))
+
+
+def test_write_catalog_duplicate_ids(tmp_path, catalog_tree):
+    collection = catalog_tree.children[0]
+    collection.items[-1] = collection.items[-1].model_copy(update={"id": "item-0"})
+    with pytest.raises(ValueError, match="Duplicate id 'item-0' under Collection"):
+        write_catalog(catalog_tree, str(tmp_path / "out"))
+    assert not (tmp_path / "out").exists()
+
+    # Items and child catalogs are written to the same directories
+    collection.items[-1] = collection.items[-1].model_copy(update={"id": "item-9"})
+    child = Catalog(type="Catalog", id="item-1", description="child", links=[])
+    collection.children.append(CatalogNode(stac_object=child))
+    with pytest.raises(ValueError, match="Duplicate id 'item-1'"):
+        write_catalog(catalog_tree, str(tmp_path / "out"))
+
+    # The same id under different parents is fine
+    child.id = "other"
+    catalog_tree.items.append(collection.items[1])
+    write_catalog(catalog_tree, str(tmp_path / "out"))